@@ -25,6 +25,7 @@ import logging
 import os
 import sys
 import tempfile
+import time
 import traceback
 from collections import OrderedDict
 from pprint import pformat
@@ -48,6 +49,7 @@ from ludwig.constants import (
     HYPEROPT_WARNING,
     MIN_DATASET_SPLIT_ROWS,
     MODEL_ECD,
+    SRC,
     TEST,
     TRAINING,
     VALIDATION,
@@ -55,6 +57,7 @@ from ludwig.constants import (
 from ludwig.data.dataset.base import Dataset
 from ludwig.data.postprocessing import convert_predictions, postprocess
 from ludwig.data.preprocessing import load_metadata, preprocess_for_prediction, preprocess_for_training
+from ludwig.data.streaming import get_predictions_writer, read_chunks, StreamingStats
 from ludwig.features.feature_registries import update_config_with_metadata
 from ludwig.globals import (
     LUDWIG_VERSION,
@@ -869,7 +872,9 @@ class LudwigModel:
         )
 
         logger.debug("Predicting")
-        with self.backend.create_predictor(self.model, batch_size=batch_size) as predictor:
+        with self.backend.create_predictor(
+            self.model, batch_size=batch_size, mixed_precision=self._get_mixed_precision()
+        ) as predictor:
             predictions = predictor.batch_predict(
                 dataset,
             )
@@ -903,6 +908,91 @@ class LudwigModel:
 
             return converted_postproc_predictions, output_directory
 
+    def predict_streaming(
+        self,
+        dataset: str,
+        output_path: str,
+        data_format: str = None,
+        chunk_size: int = 100000,
+        batch_size: int = 128,
+        callbacks: Optional[List[Callback]] = None,
+    ) -> StreamingStats:
+        """Using a trained model, make predictions on a dataset file too large to fit in memory.
+
+        The dataset is read in chunks of `chunk_size` rows. Every chunk is preprocessed with the training set metadata,
+        predicted, postprocessed and appended to the file at `output_path` before the next chunk is read, so memory
+        usage is bounded by the size of a chunk rather than by the size of the dataset. Only supported on the local
+        backend.
+
+        # Inputs
+        :param dataset: (str) path to the dataset to predict on, in CSV, TSV,
+            JSONL or Parquet format.
+        :param output_path: (str) path of the file the postprocessed predictions
+            are written to, `.parquet` or `.csv`.
+        :param data_format: (str, default: `None`) format of the dataset. Will be
+            inferred from the extension of `dataset` if not specified.
+        :param chunk_size: (int, default: `100000`) number of rows read,
+            preprocessed and predicted at once.
+        :param batch_size: (int, default: 128) size of batch to use when making
+            predictions.
+        :param callbacks: (Optional[List[Callback]], default: None)
+            optional list of callbacks to use during this predict operation. Any callbacks
+            already registered to the model will be preserved.
+
+        # Return
+
+        :return: (StreamingStats) number of rows and chunks predicted, time
+            spent and throughput in rows per second.
+        """
+        self._check_initialization()
+
+        if self.backend.df_engine.partitioned:
+            raise ValueError(
+                "Streaming prediction is only supported on the local backend, partitioned backends predict on "
+                "datasets larger than memory with `predict`"
+            )
+
+        if not data_format or data_format == AUTO:
+            data_format = figure_data_format(dataset)
+
+        # relative paths of e.g. image and audio features are resolved against the directory of the dataset
+        training_set_metadata = {**self.training_set_metadata, SRC: dataset}
+        callbacks = self.callbacks + (callbacks or [])
+
+        stats = StreamingStats()
+        with self.backend.create_predictor(
+            self.model, batch_size=batch_size, mixed_precision=self._get_mixed_precision()
+        ) as predictor, get_predictions_writer(output_path) as writer:
+            start = time.perf_counter()
+            for chunk in read_chunks(dataset, data_format, chunk_size):
+                chunk_dataset, _ = preprocess_for_prediction(
+                    self.config_obj.to_dict(),
+                    dataset=chunk,
+                    training_set_metadata=training_set_metadata,
+                    include_outputs=False,
+                    backend=self.backend,
+                    callbacks=callbacks,
+                )
+                predictions = predictor.batch_predict(chunk_dataset)
+                predictions = postprocess(
+                    predictions,
+                    self.model.output_features,
+                    self.training_set_metadata,
+                    backend=self.backend,
+                    skip_save_unprocessed_output=True,
+                )
+                writer.write(predictions)
+
+                end = time.perf_counter()
+                stats.add_chunk(len(predictions), end - start)
+                start = end
+                logger.info(
+                    f"Predicted {stats.rows} rows in {stats.chunks} chunks ({stats.rows_per_second:.1f} rows/s)"
+                )
+
+        logger.info(f"Saved predictions to: {output_path}")
+        return stats
+
     def evaluate(
         self,
         dataset: Union[str, dict, pd.DataFrame] = None,
@@ -989,7 +1079,9 @@ class LudwigModel:
             ) or self.config_obj.trainer.to_dict().get(BATCH_SIZE, None)
 
         logger.debug("Predicting")
-        with self.backend.create_predictor(self.model, batch_size=batch_size) as predictor:
+        with self.backend.create_predictor(
+            self.model, batch_size=batch_size, mixed_precision=self._get_mixed_precision()
+        ) as predictor:
             eval_stats, predictions = predictor.batch_evaluation(
                 dataset,
                 collect_predictions=collect_predictions or collect_overall_stats,
@@ -1317,7 +1409,9 @@ class LudwigModel:
         )
 
         logger.debug("Predicting")
-        with self.backend.create_predictor(self.model, batch_size=batch_size) as predictor:
+        with self.backend.create_predictor(
+            self.model, batch_size=batch_size, mixed_precision=self._get_mixed_precision()
+        ) as predictor:
             activations = predictor.batch_collect_activations(
                 layer_names,
                 dataset,
@@ -1620,6 +1714,10 @@ class LudwigModel:
         if self.model is None or self._user_config is None or self.training_set_metadata is None:
             raise ValueError("Model has not been trained or loaded")
 
+    def _get_mixed_precision(self) -> Optional[str]:
+        # only the ECD trainer has a mixed precision setting, predictions follow the one used for training
+        return getattr(self.config_obj.trainer, "mixed_precision", None)
+
     @staticmethod
     def create_model(config_obj: ModelConfig, random_seed: int = default_random_seed) -> BaseModel:
         """Instantiates BaseModel object.
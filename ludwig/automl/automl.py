@@ -104,6 +104,7 @@ def auto_train(
     user_config: Dict = None,
     random_seed: int = default_random_seed,
     use_reference_config: bool = False,
+    max_rows: Optional[int] = None,
     **kwargs,
 ) -> AutoTrainResults:
     """Main auto train API that first builds configs for each model type (e.g. concat, tabnet, transformer). Then
@@ -127,6 +128,8 @@ def auto_train(
                         parameter initialization and training set shuffling
     :param use_reference_config: (bool) refine hyperopt search space by setting first
                                  search point from reference model config, if any
+    :param max_rows: (int, default: `None`) number of rows, sampled across the dataset, to
+                     profile it with when inferring the config. All rows if `None`
     :param kwargs: additional keyword args passed down to `ludwig.hyperopt.run.hyperopt`.
 
     # Returns
@@ -140,6 +143,7 @@ def auto_train(
         user_config,
         random_seed,
         use_reference_config=use_reference_config,
+        max_rows=max_rows,
     )
     return train_with_config(dataset, config, output_directory=output_directory, random_seed=random_seed, **kwargs)
 
@@ -155,6 +159,7 @@ def create_auto_config(
     imbalance_threshold: float = 0.9,
     use_reference_config: bool = False,
     backend: Union[Backend, str] = None,
+    max_rows: Optional[int] = None,
 ) -> dict:
     """Returns an auto-generated Ludwig config with the intent of training the best model on given given dataset /
     target in the given time limit.
@@ -174,6 +179,9 @@ def create_auto_config(
     :param imbalance_threshold: (float) maximum imbalance ratio (minority / majority) to perform stratified sampling
     :param use_reference_config: (bool) refine hyperopt search space by setting first
                                  search point from reference model config, if any
+    :param backend: (Union[Backend, str]) backend to use to load the dataset
+    :param max_rows: (int, default: `None`) number of rows, sampled across the dataset, to
+                     profile it with. All rows if `None`
 
     # Return
     :return: (dict) selected model configuration
@@ -183,7 +191,7 @@ def create_auto_config(
     if not isinstance(dataset, DatasetInfo):
         dataset = load_dataset(dataset, df_lib=backend.df_engine.df_lib)
 
-    dataset_info = get_dataset_info(dataset) if not isinstance(dataset, DatasetInfo) else dataset
+    dataset_info = get_dataset_info(dataset, max_rows=max_rows) if not isinstance(dataset, DatasetInfo) else dataset
     default_configs, features_metadata = _create_default_config(
         dataset_info, target, time_limit_s, random_seed, imbalance_threshold, backend
     )
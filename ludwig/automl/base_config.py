@@ -13,7 +13,7 @@
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 import dask.dataframe as dd
 import numpy as np
@@ -207,22 +207,27 @@ def _get_reference_configs() -> dict:
     return reference_configs
 
 
-def get_dataset_info(df: Union[pd.DataFrame, dd.core.DataFrame]) -> DatasetInfo:
+def get_dataset_info(df: Union[pd.DataFrame, dd.core.DataFrame], max_rows: Optional[int] = None) -> DatasetInfo:
     """Constructs FieldInfo objects for each feature in dataset. These objects are used for downstream type
     inference.
 
     # Inputs
     :param df: (Union[pd.DataFrame, dd.core.DataFrame]) Pandas or Dask dataframe.
+    :param max_rows: (Optional[int]) Number of rows to profile the dataset with, all rows if None.
 
     # Return
     :return: (DatasetInfo) Structure containing list of FieldInfo objects.
     """
     source = wrap_data_source(df)
-    return get_dataset_info_from_source(source)
+    return get_dataset_info_from_source(source, max_rows=max_rows)
 
 
 def is_field_boolean(source: DataSource, field: str) -> bool:
     num_unique_values, unique_values, _ = source.get_distinct_values(field, max_values_to_return=4)
+    return are_values_boolean(num_unique_values, unique_values)
+
+
+def are_values_boolean(num_unique_values: int, unique_values: List) -> bool:
     if num_unique_values <= 3:
         for entry in unique_values:
             try:
@@ -239,49 +244,49 @@ def is_field_boolean(source: DataSource, field: str) -> bool:
 
 
 @DeveloperAPI
-def get_dataset_info_from_source(source: DataSource) -> DatasetInfo:
+def get_dataset_info_from_source(source: DataSource, max_rows: Optional[int] = None) -> DatasetInfo:
     """Constructs FieldInfo objects for each feature in dataset. These objects are used for downstream type
     inference.
 
+    The statistics of all the fields are computed in a single scan of the dataset, see `DataSource.profile`.
+
     # Inputs
     :param source: (DataSource) A wrapper around a data source, which may represent a pandas or Dask dataframe.
+    :param max_rows: (Optional[int]) Number of rows to profile the dataset with, all rows if None. Statistics of large
+        datasets are extrapolated from `max_rows` rows sampled across them.
 
     # Return
     :return: (DatasetInfo) Structure containing list of FieldInfo objects.
     """
-    row_count = len(source)
+    profile = source.profile(max_rows=max_rows, max_distinct_values=MAX_DISTINCT_VALUES_TO_RETURN)
     fields = []
     for field in source.columns:
         dtype = source.get_dtype(field)
-        num_distinct_values, distinct_values, distinct_values_balance = source.get_distinct_values(
-            field, MAX_DISTINCT_VALUES_TO_RETURN
-        )
-        nonnull_values = source.get_nonnull_values(field)
-        image_values = source.get_image_values(field)
-        audio_values = source.get_audio_values(field)
+        num_distinct_values = profile.num_distinct_values(field)
+        distinct_values = profile.distinct_values(field)
         avg_words = None
         if dtype == "object":
             # Check if it is a nullboolean field. We do this since if you read a csv with
             # pandas that has a column of booleans and some missing values, the column is
             # interpreted as object dtype instead of bool
-            if is_field_boolean(source, field):
+            if are_values_boolean(num_distinct_values, distinct_values):
                 dtype = "bool"
         if source.is_string_type(dtype):
-            avg_words = source.get_avg_num_tokens(field)
+            avg_words = profile.avg_num_tokens(field)
         fields.append(
             FieldInfo(
                 name=field,
                 dtype=dtype,
                 distinct_values=distinct_values,
                 num_distinct_values=num_distinct_values,
-                distinct_values_balance=distinct_values_balance,
-                nonnull_values=nonnull_values,
-                image_values=image_values,
-                audio_values=audio_values,
+                distinct_values_balance=profile.distinct_values_balance(field),
+                nonnull_values=profile.nonnull_values(field),
+                image_values=profile.image_values(field),
+                audio_values=profile.audio_values(field),
                 avg_words=avg_words,
             )
         )
-    return DatasetInfo(fields=fields, row_count=row_count, size_bytes=source.size_bytes())
+    return DatasetInfo(fields=fields, row_count=profile.row_count, size_bytes=profile.size_bytes)
 
 
 def get_features_config(
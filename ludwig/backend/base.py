@@ -14,10 +14,11 @@
 # limitations under the License.
 # ==============================================================================
 
+import logging
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -25,8 +26,9 @@ import psutil
 import torch
 
 from ludwig.backend.utils.storage import StorageManager
+from ludwig.data.binary_reader import read_binary_files_to_array
 from ludwig.data.cache.manager import CacheManager
-from ludwig.data.dataframe.pandas import PANDAS
+from ludwig.data.dataframe.pandas import PANDAS, PandasEngine
 from ludwig.data.dataset.base import DatasetManager
 from ludwig.data.dataset.pandas import PandasDatasetManager
 from ludwig.models.base import BaseModel
@@ -37,6 +39,8 @@ from ludwig.utils.system_utils import Resources
 from ludwig.utils.torch_utils import initialize_pytorch
 from ludwig.utils.types import Series
 
+logger = logging.getLogger(__name__)
+
 
 class Backend(ABC):
     def __init__(
@@ -151,6 +155,19 @@ class LocalPreprocessingMixin:
 
         return pd.Series(result, index=column.index, name=column.name)
 
+    def read_binary_files_to_array(
+        self, column: pd.Series, map_fn: Callable, shape: Tuple[int, ...], num_processes: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Reads and decodes the files of the column in `num_processes` processes into a single uint8 array of
+        shape `shape`, the first dimension being the rows of the column.
+
+        Returns the array and a boolean mask of the rows whose file could not be read or decoded.
+        """
+        column = column.fillna(np.nan).replace([np.nan], [None])  # normalize NaNs to None
+        array, failed, stats = read_binary_files_to_array(column.values, map_fn, shape, num_processes)
+        logger.info(f"Column `{column.name}`: {stats}")
+        return array, failed
+
 
 class LocalTrainingMixin:
     def initialize_pytorch(self, *args, **kwargs):
@@ -194,12 +211,17 @@ class RemoteTrainingMixin:
 class LocalBackend(LocalPreprocessingMixin, LocalTrainingMixin, Backend):
     BACKEND_TYPE = "local"
 
-    def __init__(self, **kwargs):
+    def __init__(self, processor: Optional[Dict[str, Any]] = None, **kwargs):
         super().__init__(dataset_manager=PandasDatasetManager(self), **kwargs)
+        self._df_engine = PandasEngine(**processor) if processor else PANDAS
 
     def initialize(self):
         pass
 
+    @property
+    def df_engine(self):
+        return self._df_engine
+
     @property
     def num_nodes(self) -> int:
         return 1
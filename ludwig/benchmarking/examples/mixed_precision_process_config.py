@@ -0,0 +1,15 @@
+"""This function will take in a Ludwig config and set the mixed precision of its trainer to the one of the
+experiment, to compare full precision with mixed precision training on the same datasets."""
+
+
+def process_config(ludwig_config: dict, experiment_dict: dict) -> dict:
+    """Modify a Ludwig config by setting `trainer.mixed_precision` to the `mixed_precision` attribute of
+    `experiment_dict` ('bf16', 'fp16' or None for full precision).
+
+    :param ludwig_config: a Ludwig config.
+    :param experiment_dict: a benchmarking config experiment dictionary.
+
+    Returns: a modified Ludwig config.
+    """
+    ludwig_config.setdefault("trainer", {})["mixed_precision"] = experiment_dict.get("mixed_precision")
+    return ludwig_config
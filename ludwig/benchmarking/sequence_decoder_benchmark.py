@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Prediction throughput of the sequence generator decoder, with and without early exit.
+
+The decoder has random weights, with a bias on the logit of the stop symbol tuned so that the decoded sequences are
+`mean_length` long on average, as for tagging or short generation outputs with a large `max_sequence_length`.
+
+Usage: python -m ludwig.benchmarking.sequence_decoder_benchmark --max_sequence_length 256 --mean_length 10
+"""
+import argparse
+import logging
+import time
+from typing import Dict, Optional
+
+import torch
+
+from ludwig.constants import HIDDEN, LOGITS
+from ludwig.decoders.sequence_decoders import SequenceGeneratorDecoder
+from ludwig.utils.strings_utils import SpecialSymbol
+from ludwig.utils.torch_utils import get_torch_device
+
+logger = logging.getLogger(__name__)
+
+
+def _mean_length(logits: torch.Tensor) -> float:
+    """Returns the mean number of steps up to and including the first stop symbol of the predictions."""
+    is_stop = logits.argmax(-1) == SpecialSymbol.STOP.value
+    lengths = torch.where(is_stop.any(-1), is_stop.int().argmax(-1) + 1, logits.size(1))
+    return lengths.float().mean().item()
+
+
+def _set_stop_bias(decoder: SequenceGeneratorDecoder, combiner_outputs: Dict, mean_length: float):
+    """Bisects the bias of the stop symbol until the predictions are about `mean_length` long."""
+    step_decoder = getattr(decoder.rnn_decoder, "lstm_decoder", None) or decoder.rnn_decoder.rnn_decoder
+    low, high = -10.0, 10.0
+    for _ in range(20):
+        step_decoder.out.bias[SpecialSymbol.STOP.value] = (low + high) / 2
+        if _mean_length(decoder(combiner_outputs)[LOGITS]) > mean_length:
+            low = (low + high) / 2
+        else:
+            high = (low + high) / 2
+
+
+def _rows_per_second(decoder: SequenceGeneratorDecoder, combiner_outputs: Dict, num_iterations: int, device: str):
+    decoder(combiner_outputs)  # warmup
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        decoder(combiner_outputs)
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return combiner_outputs[HIDDEN].size(0) * num_iterations / (time.perf_counter() - start)
+
+
+@torch.no_grad()
+def benchmark_sequence_decoder(
+    max_sequence_length: int = 256,
+    mean_length: float = 10,
+    batch_size: int = 128,
+    hidden_size: int = 256,
+    vocab_size: int = 1000,
+    cell_type: str = "gru",
+    num_iterations: int = 10,
+    device: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Runs the prediction of a batch of sequences, decoding up to `max_sequence_length` steps or with early exit.
+
+    # Inputs
+
+    :param max_sequence_length: (int) Maximum length of the decoded sequences.
+    :param mean_length: (float) Mean length of the decoded sequences, up to the stop symbol.
+    :param batch_size: (int) Number of rows of the batch.
+    :param hidden_size: (int) Size of the hidden state of the decoder.
+    :param vocab_size: (int) Size of the vocab of the feature.
+    :param cell_type: (str) Type of recurrent cell of the decoder, 'rnn', 'gru' or 'lstm'.
+    :param num_iterations: (int) Number of batches to measure the throughput over.
+    :param device: (str) Device to run on, defaults to the GPU if available.
+
+    # Return
+
+    :return: (Dict[str, Dict[str, float]]) For both `full` and `early_exit`, the number of rows per second
+        (`rows_per_second`) and the mean length of the decoded sequences (`mean_length`).
+    """
+    device = device or get_torch_device()
+    decoders = {
+        name: SequenceGeneratorDecoder(
+            vocab_size=vocab_size,
+            max_sequence_length=max_sequence_length,
+            cell_type=cell_type,
+            input_size=hidden_size,
+            early_exit=early_exit,
+        )
+        .to(device)
+        .eval()
+        for name, early_exit in (("full", False), ("early_exit", True))
+    }
+    decoders["early_exit"].load_state_dict(decoders["full"].state_dict())
+    combiner_outputs = {HIDDEN: torch.randn(batch_size, hidden_size, device=device)}
+    _set_stop_bias(decoders["early_exit"], combiner_outputs, mean_length)
+    decoders["full"].load_state_dict(decoders["early_exit"].state_dict())
+
+    return {
+        name: {
+            "rows_per_second": _rows_per_second(decoder, combiner_outputs, num_iterations, device),
+            "mean_length": _mean_length(decoder(combiner_outputs)[LOGITS]),
+        }
+        for name, decoder in decoders.items()
+    }
+
+
+def cli(sys_argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--max_sequence_length", type=int, default=256)
+    parser.add_argument("--mean_length", type=float, default=10)
+    parser.add_argument("--batch_size", type=int, default=128)
+    parser.add_argument("--hidden_size", type=int, default=256)
+    parser.add_argument("--vocab_size", type=int, default=1000)
+    parser.add_argument("--cell_type", default="gru", choices=["rnn", "gru", "lstm"])
+    parser.add_argument("--num_iterations", type=int, default=10)
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args(sys_argv)
+
+    results = benchmark_sequence_decoder(**vars(args))
+    for name, result in results.items():
+        logger.info(f"{name}: {result['rows_per_second']:.0f} rows/s, mean length {result['mean_length']:.1f}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    cli(sys.argv[1:])
@@ -0,0 +1,150 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Memory and throughput of the embedding of set and bag features.
+
+Compares embedding only the tokens present in each row with an embedding bag (`EmbedSet` and `EmbedWeighted`) with
+embedding every token of the vocab and masking out the absent ones (the dense path), which materializes a
+[batch x vocab_size x embedding_size] tensor.
+
+Only the encoders are measured, the batches are dense [batch x vocab_size] tensors in both cases, as in the
+preprocessed datasets.
+
+Usage: python -m ludwig.benchmarking.set_embedding_benchmark --vocab_size 100000 --items_per_row 5
+"""
+import argparse
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+import torch
+
+from ludwig.modules.embedding_modules import EmbedSet, EmbedWeighted
+from ludwig.utils.torch_utils import get_torch_device
+
+logger = logging.getLogger(__name__)
+
+
+def embed_dense(inputs: torch.Tensor, weight: torch.Tensor, aggregation_function: str = "sum") -> torch.Tensor:
+    """Embeds every token of the vocab, weighted by the [batch x vocab_size] inputs, then aggregates them."""
+    vocab_indices = torch.arange(inputs.shape[1], device=inputs.device)
+    embedded = torch.nn.functional.embedding(vocab_indices, weight).unsqueeze(0) * inputs.unsqueeze(-1)
+    if aggregation_function == "avg":
+        return embedded.sum(dim=1) / torch.count_nonzero(inputs, dim=1).clamp(min=1).unsqueeze(-1)
+    return embedded.sum(dim=1)
+
+
+def _allocated_memory(step: Callable, device: str) -> int:
+    """Returns the number of bytes allocated by the step and not freed by the operation allocating them."""
+    activities = [torch.profiler.ProfilerActivity.CPU]
+    if device.startswith("cuda"):
+        activities.append(torch.profiler.ProfilerActivity.CUDA)
+    with torch.profiler.profile(activities=activities, profile_memory=True) as prof:
+        step()
+    return sum(max(event.self_cpu_memory_usage, 0) + max(event.self_cuda_memory_usage, 0) for event in prof.events())
+
+
+def _rows_per_second(step: Callable, batch_size: int, num_iterations: int, device: str) -> float:
+    step()  # warmup
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_iterations):
+        step()
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return batch_size * num_iterations / (time.perf_counter() - start)
+
+
+def benchmark_set_embedding(
+    vocab_size: int = 100000,
+    batch_size: int = 128,
+    items_per_row: int = 5,
+    embedding_size: int = 64,
+    num_iterations: int = 10,
+    weighted: bool = False,
+    device: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """Runs the forward and backward passes of the embedding bag and of the dense path on a random batch.
+
+    # Inputs
+
+    :param vocab_size: (int) Size of the vocab of the feature.
+    :param batch_size: (int) Number of rows of the batch.
+    :param items_per_row: (int) Number of tokens present in each row.
+    :param embedding_size: (int) Size of the embeddings.
+    :param num_iterations: (int) Number of passes to measure the throughput over.
+    :param weighted: (bool) Benchmark bags (`EmbedWeighted`) instead of sets (`EmbedSet`).
+    :param device: (str) Device to run on, defaults to the GPU if available.
+
+    # Return
+
+    :return: (Dict[str, Dict[str, float]]) For both `embedding_bag` and `dense`, the bytes allocated by a pass
+        (`allocated_memory_bytes`) and the number of rows per second (`rows_per_second`).
+    """
+    device = device or get_torch_device()
+    vocab = [str(i) for i in range(vocab_size)]
+    if weighted:
+        embed = EmbedWeighted(vocab, embedding_size, force_embedding_size=True).to(device)
+    else:
+        embed = EmbedSet(vocab, embedding_size, force_embedding_size=True).to(device)
+
+    inputs = torch.zeros(batch_size, vocab_size, device=device)
+    rows = torch.arange(batch_size, device=device).repeat_interleave(items_per_row)
+    inputs[rows, torch.randint(1, vocab_size, (len(rows),), device=device)] = 1
+    if weighted:
+        inputs *= torch.randint(1, 5, inputs.shape, device=device)
+    else:
+        inputs = inputs.bool()
+
+    def embedding_bag_step():
+        embed(inputs).sum().backward()
+
+    def dense_step():
+        embed_dense(inputs, embed.embeddings.weight).sum().backward()
+
+    results = {}
+    for name, step in (("embedding_bag", embedding_bag_step), ("dense", dense_step)):
+        results[name] = {
+            "allocated_memory_bytes": _allocated_memory(step, device),
+            "rows_per_second": _rows_per_second(step, batch_size, num_iterations, device),
+        }
+    return results
+
+
+def cli(sys_argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--vocab_size", type=int, default=100000)
+    parser.add_argument("--batch_size", type=int, default=128)
+    parser.add_argument("--items_per_row", type=int, default=5)
+    parser.add_argument("--embedding_size", type=int, default=64)
+    parser.add_argument("--num_iterations", type=int, default=10)
+    parser.add_argument("--weighted", action="store_true", help="benchmark bags instead of sets")
+    parser.add_argument("--device", default=None)
+    args = parser.parse_args(sys_argv)
+
+    results = benchmark_set_embedding(**vars(args))
+    for name, result in results.items():
+        logger.info(
+            f"{name}: {result['allocated_memory_bytes'] / 1e6:.1f} MB allocated, "
+            f"{result['rows_per_second']:.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    cli(sys.argv[1:])
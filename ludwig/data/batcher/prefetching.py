@@ -0,0 +1,152 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import contextlib
+import queue
+import threading
+from typing import Dict, Union
+
+import numpy as np
+import torch
+
+from ludwig.data.batcher.base import Batcher
+
+# Marks the end of the epoch in the prefetch queue.
+_END_OF_EPOCH = object()
+
+
+class _ProducerError:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+def batch_to_tensors(batch: Dict[str, np.ndarray], pin_memory: bool = False) -> Dict[str, torch.Tensor]:
+    """Converts a batch of numpy arrays into (optionally page-locked) CPU tensors that own their memory."""
+    tensors = {}
+    for key, value in batch.items():
+        tensor = torch.from_numpy(np.array(value, copy=True))
+        if pin_memory:
+            tensor = tensor.pin_memory()
+        tensors[key] = tensor
+    return tensors
+
+
+class PrefetchingBatcher(Batcher):
+    """Wraps a batcher and assembles its next `depth` batches on a background thread.
+
+    Index gathering, lazy HDF5 reads and the numpy -> tensor conversion of the wrapped batcher run while the training
+    step of the previous batch is computed, so `next_batch` only hands over ready-made tensors. The wrapped batcher must
+    not be used directly while it is wrapped.
+    """
+
+    def __init__(self, batcher: Batcher, depth: int = 2, pin_memory: bool = False):
+        if depth < 1:
+            raise ValueError(f"Prefetch depth must be a positive integer, found: {depth}")
+
+        self.batcher = batcher
+        self.depth = depth
+        self.pin_memory = pin_memory and torch.cuda.is_available()
+
+        self.step = 0
+        self._queue = None
+        self._thread = None
+        self._stop_event = None
+        self._next = None
+
+    @property
+    def steps_per_epoch(self) -> int:
+        return self.batcher.steps_per_epoch
+
+    def next_batch(self) -> Dict[str, Union[np.ndarray, torch.Tensor]]:
+        if self.last_batch():
+            raise StopIteration()
+
+        batch, self._next = self._next, None
+        self.step += 1
+        return batch
+
+    def last_batch(self) -> bool:
+        if self._next is None:
+            self._start()
+            self._next = self._queue.get()
+            if isinstance(self._next, _ProducerError):
+                error, self._next = self._next.exception, None
+                raise error
+        return self._next is _END_OF_EPOCH
+
+    def set_epoch(self, epoch: int, batch_size: int):
+        self.close()
+        self.batcher.set_epoch(epoch, batch_size)
+        self.step = 0
+
+    def close(self):
+        """Stops the producer thread and discards any batch prefetched for the current epoch."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+        self._queue = None
+        self._thread = None
+        self._stop_event = None
+        self._next = None
+
+    def _start(self):
+        if self._thread is not None:
+            return
+
+        self._queue = queue.Queue(maxsize=self.depth)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, args=(self._queue, self._stop_event), name="ludwig-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self, batch_queue: queue.Queue, stop_event: threading.Event):
+        try:
+            while not stop_event.is_set() and not self.batcher.last_batch():
+                batch = batch_to_tensors(self.batcher.next_batch(), pin_memory=self.pin_memory)
+                if not self._put(batch_queue, stop_event, batch):
+                    return
+            self._put(batch_queue, stop_event, _END_OF_EPOCH)
+        except BaseException as e:
+            # surfaced to the consumer on its next call to `last_batch`
+            self._put(batch_queue, stop_event, _ProducerError(e))
+
+    @staticmethod
+    def _put(batch_queue: queue.Queue, stop_event: threading.Event, item) -> bool:
+        # wake up periodically so that a consumer abandoning the epoch is never blocked on a full queue
+        while not stop_event.is_set():
+            try:
+                batch_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+@contextlib.contextmanager
+def prefetch(batcher: Batcher, depth: int, pin_memory: bool = False):
+    """Wraps `batcher` in a `PrefetchingBatcher` for the duration of the context, unless `depth` is 0."""
+    if depth == 0:
+        yield batcher
+        return
+
+    with PrefetchingBatcher(batcher, depth=depth, pin_memory=pin_memory) as prefetching_batcher:
+        yield prefetching_batcher
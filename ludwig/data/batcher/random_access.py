@@ -23,7 +23,7 @@ class RandomAccessBatcher(Batcher):
         # store our dataset as well
         self.dataset = dataset
         self.sampler = sampler
-        self.sample_it = iter(self.sampler)
+        self.indices = sampler.get_indices()
 
         self.ignore_last = ignore_last
         self.batch_size = batch_size
@@ -36,13 +36,13 @@ class RandomAccessBatcher(Batcher):
         if self.last_batch():
             raise StopIteration()
 
-        indices = []
-        for _ in range(self.batch_size):
-            try:
-                indices.append(next(self.sample_it))
-                self.index += 1
-            except StopIteration:
-                break
+        end = min(self.index + self.batch_size, self.total_size)
+        if self.sampler.is_contiguous:
+            # slicing instead of gathering, so in memory columns are returned as views
+            indices = slice(self.index, end)
+        else:
+            indices = self.indices[self.index : end]
+        self.index = end
 
         sub_batch = {}
         for features_name in self.dataset.features:
@@ -60,7 +60,7 @@ class RandomAccessBatcher(Batcher):
         self.index = 0
         self.step = 0
         self.sampler.set_epoch(epoch)
-        self.sample_it = iter(self.sampler)
+        self.indices = self.sampler.get_indices()
 
     def _compute_steps_per_epoch(self):
         return int(math.ceil(self.total_size / self.batch_size))
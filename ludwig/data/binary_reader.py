@@ -0,0 +1,154 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Reading and decoding of binary files (e.g. images) in a pool of processes.
+
+Decoding and resizing images is mostly Python code holding the GIL, so threads do not scale with the number of cores.
+Worker processes instead decode chunks of the files and write the decoded arrays directly into a preallocated array
+shared by all the processes, so that the decoded data is never pickled back to the main process.
+"""
+import logging
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ludwig.utils.fs_utils import get_bytes_obj_from_path
+
+logger = logging.getLogger(__name__)
+
+# Number of chunks of files per worker process, more chunks balance the load better between the processes.
+CHUNKS_PER_PROCESS = 4
+
+
+@dataclass
+class ReadStats:
+    """Throughput of the stages of reading binary files, the times being summed over all the processes."""
+
+    num_files: int = 0
+    num_failed: int = 0
+    bytes_read: int = 0
+    read_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    total_seconds: float = 0.0
+    num_processes: int = 1
+
+    def merge(self, other: "ReadStats"):
+        self.num_files += other.num_files
+        self.num_failed += other.num_failed
+        self.bytes_read += other.bytes_read
+        self.read_seconds += other.read_seconds
+        self.decode_seconds += other.decode_seconds
+
+    @property
+    def read_bytes_per_second(self) -> float:
+        """Bytes read per second, by all the processes."""
+        return self.bytes_read / self.read_seconds * self.num_processes if self.read_seconds > 0 else math.inf
+
+    @property
+    def decoded_per_second(self) -> float:
+        """Files decoded per second, by all the processes."""
+        return self.num_files / self.decode_seconds * self.num_processes if self.decode_seconds > 0 else math.inf
+
+    @property
+    def files_per_second(self) -> float:
+        """Files read and decoded per second, end to end."""
+        return self.num_files / self.total_seconds if self.total_seconds > 0 else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"read {self.bytes_read / 1e6:.1f} MB from {self.num_files} files "
+            f"({self.read_bytes_per_second / 1e6:.1f} MB/s), "
+            f"decoded {self.num_files - self.num_failed} files ({self.decoded_per_second:.1f} files/s), "
+            f"{self.files_per_second:.1f} files/s overall with {self.num_processes} processes"
+        )
+
+
+def _read_chunk(
+    array_fp: str, shape: Tuple[int, ...], start: int, entries: Sequence[Any], map_fn: Callable
+) -> Tuple[ReadStats, List[int]]:
+    """Reads and decodes the entries of a chunk of the column, writing them into the shared array from `start`."""
+    array = np.memmap(array_fp, dtype=np.uint8, mode="r+", shape=shape)
+    stats = ReadStats()
+    failed = []
+    for i, entry in enumerate(entries, start):
+        read_start = time.perf_counter()
+        if isinstance(entry, str):
+            entry = get_bytes_obj_from_path(entry)
+            if entry is not None:
+                stats.bytes_read += len(entry)
+        decode_start = time.perf_counter()
+        value = map_fn(entry)
+        if isinstance(value, np.ndarray):
+            array[i] = value
+        else:
+            failed.append(i)
+        stats.read_seconds += decode_start - read_start
+        stats.decode_seconds += time.perf_counter() - decode_start
+        stats.num_files += 1
+    stats.num_failed = len(failed)
+    array.flush()
+    return stats, failed
+
+
+def read_binary_files_to_array(
+    entries: Sequence[Any],
+    map_fn: Callable[[Optional[bytes]], Optional[np.ndarray]],
+    shape: Tuple[int, ...],
+    num_processes: int,
+) -> Tuple[np.ndarray, np.ndarray, ReadStats]:
+    """Reads and decodes binary files in a pool of processes, into a single uint8 array.
+
+    Args:
+        entries: Paths of the files to read, or their content already read, None for missing values.
+        map_fn: Function decoding the bytes of a file into a uint8 array of shape `shape[1:]`, returning None if the
+            file cannot be decoded. Must be picklable.
+        shape: Shape of the decoded array, the first dimension being the number of entries.
+        num_processes: Number of worker processes.
+
+    Returns:
+        The decoded array, a boolean mask of the entries that could not be read, and the read statistics.
+    """
+    start_time = time.perf_counter()
+    fd, array_fp = tempfile.mkstemp(prefix="ludwig_binary_", suffix=".bin")
+    os.close(fd)
+    try:
+        array = np.memmap(array_fp, dtype=np.uint8, mode="w+", shape=shape)
+        failed = np.zeros(len(entries), dtype=bool)
+        stats = ReadStats(num_processes=num_processes)
+        chunk_size = max(1, math.ceil(len(entries) / (num_processes * CHUNKS_PER_PROCESS)))
+        with ProcessPoolExecutor(max_workers=num_processes) as executor:
+            futures = [
+                executor.submit(_read_chunk, array_fp, shape, start, entries[start : start + chunk_size], map_fn)
+                for start in range(0, len(entries), chunk_size)
+            ]
+            for future in futures:
+                chunk_stats, chunk_failed = future.result()
+                stats.merge(chunk_stats)
+                failed[chunk_failed] = True
+    finally:
+        try:
+            # The array stays mapped in memory, the file is only needed to share it with the worker processes.
+            os.remove(array_fp)
+        except OSError:
+            logger.debug(f"Could not remove {array_fp}, it will be removed with the temporary files")
+
+    stats.total_seconds = time.perf_counter() - start_time
+    return array, failed, stats
@@ -0,0 +1,148 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Cache of the preprocessed columns of individual features.
+
+The dataset cache stores the whole preprocessed dataset under a single key, so changing the config of any feature
+invalidates all of it. The feature cache instead stores the processed column and the metadata of each feature under a
+hash of that feature's preprocessing config and of the content of its source column, so that preprocessing only needs to
+compute the features that changed. Past a size bound, the least recently used entries are evicted.
+"""
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+import ludwig
+from ludwig.constants import TYPE
+from ludwig.utils.data_utils import hash_dict, load_json, save_json
+from ludwig.utils.fs_utils import delete, get_fs_and_path, makedirs, path_exists
+from ludwig.utils.types import Series
+
+logger = logging.getLogger(__name__)
+
+# Size of the feature cache of a dataset past which its least recently used entries are evicted.
+DEFAULT_MAX_SIZE_BYTES = 4 * 1024**3
+
+
+def column_checksum(column: Series) -> Optional[str]:
+    """Returns a checksum of the values and the index of a column, or None if its values cannot be hashed."""
+    try:
+        hashes = pd.util.hash_pandas_object(column, index=True).to_numpy()
+    except TypeError:
+        # e.g. columns of lists
+        return None
+    return hashlib.md5(hashes.tobytes()).hexdigest()
+
+
+class FeatureCache:
+    """Content addressed store of the processed column and metadata of features.
+
+    Each entry is a directory named after the key of the feature, holding the processed column as a pickle and the
+    feature metadata as JSON. The metadata is written last and marks the entry as complete, it is written again when the
+    entry is used so that its modification time tracks the last use of the entry.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: Optional[int] = DEFAULT_MAX_SIZE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+
+    def get_key(
+        self,
+        feature_config: Dict[str, Any],
+        preprocessing_parameters: Dict[str, Any],
+        column: Series,
+        src: Optional[str] = None,
+    ) -> Optional[str]:
+        """Returns the key of the feature, None if the feature cannot be cached.
+
+        The key does not depend on the name of the feature nor on its encoder or decoder, only on what the processed
+        column is computed from.
+        """
+        if not preprocessing_parameters.get("in_memory", True):
+            # Features that are not in memory are written to the dataset cache while being preprocessed.
+            return None
+
+        checksum = column_checksum(column)
+        if checksum is None:
+            return None
+
+        info = {
+            "ludwig_version": ludwig.globals.LUDWIG_VERSION,
+            "feature_type": feature_config[TYPE],
+            "preprocessing": preprocessing_parameters,
+            "column_checksum": checksum,
+            # relative paths of e.g. images are resolved from the directory of the dataset
+            "src_dir": os.path.dirname(os.path.abspath(src)) if src is not None else None,
+        }
+        return hash_dict(info, max_length=None).decode("ascii")
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], Series]]:
+        """Returns the metadata and the processed column of the feature with the key, None if not cached."""
+        metadata_fp, column_fp = self._get_paths(key)
+        if not path_exists(metadata_fp):
+            return None
+
+        try:
+            feature_metadata, proc_column = load_json(metadata_fp), pd.read_pickle(column_fp)
+        except Exception as e:
+            logger.error(f"failed to load cached feature at {os.path.dirname(metadata_fp)}", exc_info=e)
+            return None
+        save_json(metadata_fp, feature_metadata)
+        return feature_metadata, proc_column
+
+    def put(self, key: str, feature_metadata: Dict[str, Any], proc_column: Series):
+        metadata_fp, column_fp = self._get_paths(key)
+        makedirs(os.path.dirname(metadata_fp), exist_ok=True)
+        pd.to_pickle(proc_column, column_fp)
+        save_json(metadata_fp, feature_metadata)
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None):
+        """Deletes the least recently used entries, other than the entry with key `keep`, until the size of the
+        cache is within `max_size_bytes`."""
+        if self.max_size_bytes is None or not path_exists(self.cache_dir):
+            return
+
+        fs, cache_dir = get_fs_and_path(self.cache_dir)
+        entries = []
+        for entry_dir in fs.ls(cache_dir, detail=False):
+            if os.path.basename(entry_dir.rstrip("/")) == keep:
+                continue
+            # incomplete entries, without metadata, are the least recently used
+            metadata_fp = os.path.join(entry_dir, "metadata.json")
+            last_used = fs.modified(metadata_fp).timestamp() if fs.exists(metadata_fp) else 0
+            entries.append((last_used, fs.du(entry_dir), entry_dir))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if keep is not None:
+            size += fs.du(os.path.join(cache_dir, keep))
+        for _, entry_size, entry_dir in sorted(entries):
+            if size <= self.max_size_bytes:
+                break
+            logger.info(f"Evicting cached feature at {entry_dir}")
+            fs.rm(entry_dir, recursive=True)
+            size -= entry_size
+
+    def delete(self):
+        """Deletes all the entries of the cache."""
+        if path_exists(self.cache_dir):
+            delete(self.cache_dir, recursive=True)
+
+    def _get_paths(self, key: str) -> Tuple[str, str]:
+        feature_dir = os.path.join(self.cache_dir, key)
+        return os.path.join(feature_dir, "metadata.json"), os.path.join(feature_dir, "column.pkl")
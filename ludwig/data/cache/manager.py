@@ -3,6 +3,7 @@ import os
 from typing import Optional
 
 from ludwig.constants import CHECKSUM, META, TEST, TRAINING, VALIDATION
+from ludwig.data.cache.feature_cache import DEFAULT_MAX_SIZE_BYTES, FeatureCache
 from ludwig.data.cache.types import alphanum, CacheableDataset
 from ludwig.data.cache.util import calculate_checksum
 from ludwig.data.dataset.base import DatasetManager
@@ -13,11 +14,12 @@ logger = logging.getLogger(__name__)
 
 
 class DatasetCache:
-    def __init__(self, config, checksum, cache_map, dataset_manager):
+    def __init__(self, config, checksum, cache_map, dataset_manager, feature_cache: Optional[FeatureCache] = None):
         self.config = config
         self.checksum = checksum
         self.cache_map = cache_map
         self.dataset_manager = dataset_manager
+        self.feature_cache = feature_cache
 
     def get(self):
         training_set_metadata_fp = self.cache_map[META]
@@ -75,11 +77,13 @@ class DatasetCache:
 
         return training_set, test_set, validation_set, training_set_metadata
 
-    def delete(self):
+    def delete(self, delete_features: bool = True):
         for fname in self.cache_map.values():
             if path_exists(fname):
                 # Parquet entries in the cache_ma can be pointers to directories.
                 delete(fname, recursive=True)
+        if delete_features and self.feature_cache is not None:
+            self.feature_cache.delete()
 
 
 class CacheManager:
@@ -87,9 +91,11 @@ class CacheManager:
         self,
         dataset_manager: DatasetManager,
         cache_dir: Optional[str] = None,
+        feature_cache_max_size_bytes: Optional[int] = DEFAULT_MAX_SIZE_BYTES,
     ):
         self._dataset_manager = dataset_manager
         self._cache_dir = cache_dir
+        self._feature_cache_max_size_bytes = feature_cache_max_size_bytes
 
     def get_dataset_cache(
         self,
@@ -107,7 +113,7 @@ class CacheManager:
                 TEST: self.get_cache_path(dataset, key, TEST),
                 VALIDATION: self.get_cache_path(dataset, key, VALIDATION),
             }
-            return DatasetCache(config, key, cache_map, self._dataset_manager)
+            return DatasetCache(config, key, cache_map, self._dataset_manager, self.get_feature_cache(dataset))
         else:
             key = self.get_cache_key(training_set, config)
             cache_map = {
@@ -116,7 +122,15 @@ class CacheManager:
                 TEST: self.get_cache_path(test_set, key, TEST),
                 VALIDATION: self.get_cache_path(validation_set, key, VALIDATION),
             }
-            return DatasetCache(config, key, cache_map, self._dataset_manager)
+            return DatasetCache(config, key, cache_map, self._dataset_manager, self.get_feature_cache(training_set))
+
+    def get_feature_cache(self, dataset: Optional[CacheableDataset] = None) -> FeatureCache:
+        if self._cache_dir is None and dataset is not None:
+            # Next to the dataset cache files of the input dataset
+            cache_dir = os.path.join(dataset.get_cache_directory(), f"{dataset.get_cache_path()}.features")
+        else:
+            cache_dir = os.path.join(self.get_cache_directory(dataset), "features")
+        return FeatureCache(cache_dir, max_size_bytes=self._feature_cache_max_size_bytes)
 
     def get_cache_key(self, dataset: CacheableDataset, config: dict) -> str:
         return calculate_checksum(dataset, config)
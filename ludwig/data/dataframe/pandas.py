@@ -13,7 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import logging
+import multiprocessing
 import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -23,10 +27,50 @@ from ludwig.globals import PREDICTIONS_SHAPES_FILE_NAME
 from ludwig.utils.data_utils import load_json, save_json, split_by_slices
 from ludwig.utils.dataframe_utils import flatten_df, unflatten_df
 
+logger = logging.getLogger(__name__)
+
+PROCESS_POOL = "process"
+THREAD_POOL = "thread"
+
+# Data with fewer rows than this is always mapped in the calling process.
+MIN_PARALLEL_ROWS = 1000
+
+# Number of chunks per worker, more chunks than workers balance rows of uneven cost across the pool.
+CHUNKS_PER_WORKER = 4
+
+# Function mapped over the chunks by a process pool worker, inherited from the parent when the worker is forked so that
+# lambdas and closures, which can't be pickled, can be mapped too.
+_worker_fn = None
+
+
+def _init_worker(fn: Callable):
+    global _worker_fn
+    _worker_fn = fn
+
+
+def _run_worker_fn(chunk):
+    return _worker_fn(chunk)
+
 
 class PandasEngine(DataFrameEngine):
-    def __init__(self, **kwargs):
+    """Engine for pandas DataFrames, held in memory by the local process.
+
+    With a `parallelism` greater than 1, `map_objects`, `apply_objects` and `map_partitions` over a Series split the
+    data into chunks and map them over a pool of `parallelism` workers: forked processes for `pool_type="process"`, or
+    threads for `pool_type="thread"`, which only pays off for functions that release the GIL. The results are
+    concatenated back in the original order.
+    """
+
+    def __init__(self, parallelism: Optional[int] = None, pool_type: str = PROCESS_POOL, **kwargs):
         super().__init__()
+        if pool_type not in {PROCESS_POOL, THREAD_POOL}:
+            raise ValueError(f"Invalid pool_type: {pool_type}, expected one of: {PROCESS_POOL}, {THREAD_POOL}")
+        if pool_type == PROCESS_POOL and "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Process pools need the fork start method, which isn't available: using threads instead")
+            pool_type = THREAD_POOL
+
+        self._parallelism = parallelism
+        self._pool_type = pool_type
 
     def df_like(self, df, proc_cols):
         # df argument unused for pandas, which can instantiate df directly
@@ -48,16 +92,19 @@ class PandasEngine(DataFrameEngine):
         return df
 
     def map_objects(self, series, map_fn, meta=None):
-        return series.map(map_fn)
+        return self._map_chunks(series, lambda chunk: chunk.map(map_fn))
 
     def map_batches(self, df, map_fn):
         return map_fn(df)
 
     def map_partitions(self, series, map_fn, meta=None):
-        return map_fn(series)
+        if isinstance(series, pd.DataFrame):
+            # functions over whole DataFrames, e.g. stratified splits, may depend on the rows they see together
+            return map_fn(series)
+        return self._map_chunks(series, map_fn)
 
     def apply_objects(self, df, apply_fn, meta=None):
-        return df.apply(apply_fn, axis=1)
+        return self._map_chunks(df, lambda chunk: chunk.apply(apply_fn, axis=1))
 
     def reduce_objects(self, series, reduce_fn):
         return reduce_fn(series)
@@ -105,7 +152,36 @@ class PandasEngine(DataFrameEngine):
         return False
 
     def set_parallelism(self, parallelism):
-        pass
+        self._parallelism = parallelism
+
+    @property
+    def parallelism(self) -> Optional[int]:
+        return self._parallelism
+
+    def _map_chunks(self, data: Union[pd.Series, pd.DataFrame], chunk_fn: Callable) -> Union[pd.Series, pd.DataFrame]:
+        num_workers = min(self._parallelism or 1, len(data) // MIN_PARALLEL_ROWS)
+        if num_workers <= 1:
+            return chunk_fn(data)
+
+        chunk_size = -(-len(data) // (num_workers * CHUNKS_PER_WORKER))
+        chunks = [data.iloc[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+        with self._create_executor(num_workers, chunk_fn) as executor:
+            if self._pool_type == PROCESS_POOL:
+                results = list(executor.map(_run_worker_fn, chunks))
+            else:
+                results = list(executor.map(chunk_fn, chunks))
+        return pd.concat(results)
+
+    def _create_executor(self, num_workers: int, chunk_fn: Callable) -> Executor:
+        if self._pool_type == THREAD_POOL:
+            return ThreadPoolExecutor(max_workers=num_workers)
+        # arguments of forked workers are inherited rather than pickled
+        return ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(chunk_fn,),
+        )
 
 
 PANDAS = PandasEngine()
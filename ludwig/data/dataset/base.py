@@ -31,6 +31,10 @@ class Dataset(ABC):
     def to_df(self):
         raise NotImplementedError()
 
+    def sample(self, num_rows: int, seed: int = 0) -> "Dataset":
+        """Returns a dataset of `num_rows` rows picked at random, or this dataset if it is not any larger."""
+        raise NotImplementedError()
+
     @property
     def in_memory_size_bytes(self):
         raise NotImplementedError()
@@ -53,3 +57,8 @@ class DatasetManager(ABC):
     @abstractmethod
     def data_format(self):
         raise NotImplementedError()
+
+    @property
+    def supports_columnar_data(self) -> bool:
+        """Whether `create` also accepts a dict of numpy arrays keyed by column name in place of a DataFrame."""
+        return False
@@ -14,9 +14,10 @@
 # limitations under the License.
 # ==============================================================================
 import contextlib
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Union
 
 import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from ludwig.constants import PREPROCESSING, TRAINING
@@ -26,16 +27,28 @@ from ludwig.data.sampler import DistributedSampler
 from ludwig.features.base_feature import BaseFeature
 from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP, save_hdf5
 from ludwig.utils.dataframe_utils import from_numpy_dataset, to_numpy_dataset
-from ludwig.utils.fs_utils import download_h5
+from ludwig.utils.h5_utils import H5HandlePool, read_rows
 from ludwig.utils.misc_utils import get_proc_features
 
 
 class PandasDataset(Dataset):
-    def __init__(self, dataset, features, data_hdf5_fp):
+    def __init__(self, dataset: Union[DataFrame, Dict[str, np.ndarray]], features, data_hdf5_fp):
+        """
+        Args:
+            dataset: DataFrame, or dict of numpy arrays keyed by column name (e.g. as loaded by `load_hdf5_columns`),
+                which is used as is instead of being stacked into new arrays.
+            features: Processed feature configs, keyed by proc column.
+            data_hdf5_fp: Path of the HDF5 cache of the training set, holding the features that are not in memory.
+        """
         self.features = features
         self.data_hdf5_fp = data_hdf5_fp
-        self.size = len(dataset)
-        self.dataset = to_numpy_dataset(dataset)
+        if isinstance(dataset, dict):
+            self.dataset = dataset
+            self.size = len(next(iter(dataset.values()))) if dataset else 0
+        else:
+            self.size = len(dataset)
+            self.dataset = to_numpy_dataset(dataset)
+        self._h5_pool = None
 
     def to_df(self, features: Optional[Iterable[BaseFeature]] = None) -> DataFrame:
         """Convert the dataset to a Pandas DataFrame."""
@@ -56,34 +69,60 @@ class PandasDataset(Dataset):
             return self.dataset[proc_column][idx]
 
         sub_batch = self.dataset[proc_column][idx]
+        if self._h5_pool is not None:
+            return read_rows(self._h5_pool.get_dataset(self.data_hdf5_fp, proc_column + "_data"), sub_batch)
 
-        indices = np.empty((3, len(sub_batch)), dtype=np.int64)
-        indices[0, :] = sub_batch
-        indices[1, :] = np.arange(len(sub_batch))
-        indices = indices[:, np.argsort(indices[0])]
-
-        with download_h5(self.data_hdf5_fp) as h5_file:
-            im_data = h5_file[proc_column + "_data"][indices[0, :], :, :]
-        indices[2, :] = np.arange(len(sub_batch))
-        indices = indices[:, np.argsort(indices[1])]
-        return im_data[indices[2, :]]
+        # outside of a batcher there is no long-lived pool, so open the file just for this read
+        with H5HandlePool() as h5_pool:
+            return np.array(read_rows(h5_pool.get_dataset(self.data_hdf5_fp, proc_column + "_data"), sub_batch))
 
     def get_dataset(self):
         return self.dataset
 
+    def sample(self, num_rows: int, seed: int = 0) -> "PandasDataset":
+        if num_rows >= self.size:
+            return self
+
+        # rows are kept in order, so that lazily loaded features are read from the HDF5 cache sequentially
+        idx = np.sort(np.random.default_rng(seed).choice(self.size, num_rows, replace=False))
+        return PandasDataset(
+            {column: values[idx] for column, values in self.dataset.items()}, self.features, self.data_hdf5_fp
+        )
+
     def __len__(self):
         return self.size
 
     @property
     def in_memory_size_bytes(self):
-        df = self.to_df()
-        return df.memory_usage(deep=True).sum() if df is not None else 0
+        size = 0
+        for values in self.dataset.values():
+            if isinstance(values, np.ndarray) and values.dtype != object:
+                size += values.nbytes
+            else:
+                size += pd.Series(list(values), dtype=object).memory_usage(deep=True, index=False)
+        return size
 
     @contextlib.contextmanager
     def initialize_batcher(self, batch_size=128, should_shuffle=True, seed=0, ignore_last=False, horovod=None):
         sampler = DistributedSampler(len(self), shuffle=should_shuffle, seed=seed, horovod=horovod)
-        batcher = RandomAccessBatcher(self, sampler, batch_size=batch_size, ignore_last=ignore_last)
-        yield batcher
+        with self._open_h5_pool():
+            batcher = RandomAccessBatcher(self, sampler, batch_size=batch_size, ignore_last=ignore_last)
+            yield batcher
+
+    @contextlib.contextmanager
+    def _open_h5_pool(self):
+        """Keeps the HDF5 cache of lazily loaded features open for as long as the batcher lives."""
+        if self._h5_pool is not None:
+            # nested batcher over the same dataset, e.g. evaluating the training set mid-epoch
+            yield self._h5_pool
+            return
+
+        with H5HandlePool() as h5_pool:
+            self._h5_pool = h5_pool
+            try:
+                yield h5_pool
+            finally:
+                self._h5_pool = None
 
 
 class PandasDatasetManager(DatasetManager):
@@ -105,3 +144,7 @@ class PandasDatasetManager(DatasetManager):
     @property
     def data_format(self):
         return "hdf5"
+
+    @property
+    def supports_columnar_data(self) -> bool:
+        return True
@@ -50,6 +50,7 @@ from ludwig.constants import (
     TYPE,
     VALIDATION,
 )
+from ludwig.data.cache.feature_cache import FeatureCache
 from ludwig.data.cache.types import wrap
 from ludwig.data.concatenate_datasets import concatenate_df, concatenate_files, concatenate_splits
 from ludwig.data.dataset.base import Dataset
@@ -104,6 +105,7 @@ from ludwig.utils.data_utils import (
 from ludwig.utils.defaults import default_preprocessing_parameters, default_random_seed
 from ludwig.utils.fs_utils import file_lock, path_exists
 from ludwig.utils.misc_utils import get_from_registry, merge_dict, resolve_pointers
+from ludwig.utils.tokenization import tokenized_column_cache
 from ludwig.utils.types import DataFrame, Series
 
 REPARTITIONING_FEATURE_TYPES = {"image", "audio"}
@@ -1042,7 +1044,12 @@ class HDF5Preprocessor(DataFormatPreprocessor):
             )
 
         elif training_set is not None:
-            kwargs = dict(preprocessing_params=preprocessing_params, backend=backend, split_data=False)
+            kwargs = dict(
+                preprocessing_params=preprocessing_params,
+                backend=backend,
+                split_data=False,
+                columnar=backend.dataset_manager.supports_columnar_data,
+            )
             training_set = load_hdf5(training_set, shuffle_training=True, **kwargs)
 
             if validation_set is not None:
@@ -1160,22 +1167,47 @@ def build_dataset(
     logger.debug("cast columns")
     cast_columns(dataset_cols, feature_configs, backend)
 
-    for callback in callbacks or []:
-        callback.on_build_metadata_start(dataset_df, mode)
+    # Reuse the metadata and processed columns of the features whose preprocessing and source column are unchanged.
+    feature_cache = get_feature_cache(metadata, backend, skip_save_processed_input, mode)
+    feature_cache_keys = {}
+    cached_proc_cols = {}
+    if feature_cache is not None:
+        feature_cache_keys = get_feature_cache_keys(
+            feature_cache, dataset_cols, feature_configs, feature_name_to_preprocessing_parameters, metadata
+        )
+        for feature_config in feature_configs:
+            key = feature_cache_keys.get(feature_config[NAME])
+            cached = feature_cache.get(key) if key is not None else None
+            if cached is not None:
+                logger.info(f"Using cached preprocessed data of feature `{feature_config[NAME]}`")
+                metadata[feature_config[NAME]], cached_proc_cols[feature_config[PROC_COLUMN]] = cached
+    uncached_feature_configs = [f for f in feature_configs if f[PROC_COLUMN] not in cached_proc_cols]
+
+    # Tokens computed while building the vocabularies are reused to build the data, and released once it is built.
+    with tokenized_column_cache():
+        for callback in callbacks or []:
+            callback.on_build_metadata_start(dataset_df, mode)
+
+        logger.debug("build metadata")
+        metadata = build_metadata(
+            metadata, feature_name_to_preprocessing_parameters, dataset_cols, feature_configs, backend
+        )
 
-    logger.debug("build metadata")
-    metadata = build_metadata(
-        metadata, feature_name_to_preprocessing_parameters, dataset_cols, feature_configs, backend
-    )
+        for callback in callbacks or []:
+            callback.on_build_metadata_end(dataset_df, mode)
 
-    for callback in callbacks or []:
-        callback.on_build_metadata_end(dataset_df, mode)
+        for callback in callbacks or []:
+            callback.on_build_data_start(dataset_df, mode)
 
-    for callback in callbacks or []:
-        callback.on_build_data_start(dataset_df, mode)
+        logger.debug("build data")
+        proc_cols = build_data(dataset_cols, uncached_feature_configs, metadata, backend, skip_save_processed_input)
 
-    logger.debug("build data")
-    proc_cols = build_data(dataset_cols, feature_configs, metadata, backend, skip_save_processed_input)
+    for feature_config in uncached_feature_configs:
+        key = feature_cache_keys.get(feature_config[NAME])
+        if key is not None:
+            feature_cache.put(key, metadata[feature_config[NAME]], proc_cols[feature_config[PROC_COLUMN]])
+    proc_cols.update(cached_proc_cols)
+    proc_cols = {f[PROC_COLUMN]: proc_cols[f[PROC_COLUMN]] for f in feature_configs}
 
     for callback in callbacks or []:
         callback.on_build_data_end(dataset_df, mode)
@@ -1229,6 +1261,47 @@ def build_dataset(
     return dataset, metadata
 
 
+def get_feature_cache(
+    metadata: Dict[str, Any], backend: Backend, skip_save_processed_input: bool, mode: Optional[str]
+) -> Optional[FeatureCache]:
+    """Returns the cache of the preprocessed features of the dataset, or None if the features should not be cached.
+
+    Like the preprocessed dataset, features are only cached when training on a dataset file, and when the processed
+    input is saved. Only in memory columns of the local backend can be cached.
+    """
+    if mode != "training" or backend.df_engine.partitioned or not backend.cache.can_cache(skip_save_processed_input):
+        return None
+    src = metadata.get(SRC) if metadata is not None else None
+    if not isinstance(src, str):
+        return None
+    return backend.cache.get_feature_cache(wrap(src))
+
+
+def get_feature_cache_keys(
+    feature_cache: FeatureCache,
+    dataset_cols: Dict[str, Series],
+    feature_configs: List[Dict[str, Any]],
+    feature_name_to_preprocessing_parameters: Dict[str, Any],
+    metadata: Dict[str, Any],
+) -> Dict[str, str]:
+    """Returns the feature cache key of every feature that can be cached, by feature name."""
+    keys = {}
+    for feature_config in feature_configs:
+        feature_name = feature_config[NAME]
+        if feature_name in metadata:
+            # the metadata provided as input is used to process the feature
+            continue
+        key = feature_cache.get_key(
+            feature_config,
+            feature_name_to_preprocessing_parameters[feature_name],
+            dataset_cols[feature_config[COLUMN]],
+            src=metadata.get(SRC),
+        )
+        if key is not None:
+            keys[feature_name] = key
+    return keys
+
+
 def cast_columns(dataset_cols, features, backend) -> None:
     """Casts columns based on their feature type."""
     for feature in features:
@@ -1490,13 +1563,27 @@ def handle_missing_values(dataset_cols, feature, preprocessing_parameters, backe
         raise ValueError(f"Invalid missing value strategy {missing_value_strategy}")
 
 
-def load_hdf5(hdf5_file_path, preprocessing_params, backend, split_data=True, shuffle_training=False):
+def load_hdf5(hdf5_file_path, preprocessing_params, backend, split_data=True, shuffle_training=False, columnar=False):
+    """Loads a preprocessed HDF5 file, split into training, test and validation sets if `split_data`.
+
+    If `columnar` and the data is not split, it is returned as a dict of contiguous numpy arrays keyed by column name
+    instead of a DataFrame, for datasets managers that support columnar data.
+    """
     # TODO dask: this needs to work with DataFrames
     logger.info(f"Loading data from: {hdf5_file_path}")
 
     def shuffle(df):
         return df.sample(frac=1).reset_index(drop=True)
 
+    if columnar and not split_data:
+        dataset = data_utils.load_hdf5_columns(hdf5_file_path)
+        if shuffle_training and dataset:
+            permutation = np.random.permutation(len(next(iter(dataset.values()))))
+            for column, values in dataset.items():
+                # one column at a time, so that at most one column is held twice
+                dataset[column] = values[permutation]
+        return dataset
+
     dataset = data_utils.load_hdf5(hdf5_file_path)
     if not split_data:
         if shuffle_training:
@@ -1597,7 +1684,8 @@ def preprocess_for_training(
                             "if saving of processed input is not skipped "
                             "they will be overridden"
                         )
-                        cache.delete()
+                        # the features whose preprocessing did not change are reused from the feature cache
+                        cache.delete(delete_features=False)
 
         training_set_metadata[CHECKSUM] = cache.checksum
         data_format_processor = get_from_registry(data_format, data_format_preprocessor_registry)
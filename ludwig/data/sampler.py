@@ -33,21 +33,30 @@ class DistributedSampler:
         self.seed = seed
 
     def __iter__(self):
+        return iter(self.get_indices().tolist())
+
+    def get_indices(self) -> np.ndarray:
+        """Returns the indices of this replica's shard for the current epoch, in the order they are sampled."""
         if self.shuffle:
             # deterministically shuffle based on epoch and seed
-            indices = np.random.RandomState(seed=self.seed + self.epoch).permutation(self.dataset_size).tolist()
+            indices = np.random.RandomState(seed=self.seed + self.epoch).permutation(self.dataset_size)
         else:
-            indices = list(range(self.dataset_size))
+            indices = np.arange(self.dataset_size)
 
         # add extra samples to make it evenly divisible
-        indices += indices[: (self.total_size - len(indices))]
+        indices = np.concatenate([indices, indices[: (self.total_size - len(indices))]])
         assert len(indices) == self.total_size
 
         # subsample
         indices = indices[self.rank : self.total_size : self.num_replicas]
         assert len(indices) == self.num_samples
 
-        return iter(indices)
+        return indices
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Whether this replica samples every index in order, i.e. `get_indices()` is `range(dataset_size)`."""
+        return not self.shuffle and self.num_replicas == 1
 
     def __len__(self):
         return self.num_samples
@@ -0,0 +1,185 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Chunked reading of datasets and incremental writing of predictions, for predicting on files larger than
+memory."""
+import contextlib
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterator, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ludwig.data.dataframe.pandas import PANDAS
+from ludwig.globals import PREDICTIONS_SHAPES_FILE_NAME
+from ludwig.utils.data_utils import (
+    CSV_FORMATS,
+    JSONL_FORMATS,
+    PARQUET_FORMATS,
+    read_csv,
+    read_tsv,
+    save_json,
+    TSV_FORMATS,
+)
+from ludwig.utils.dataframe_utils import flatten_df
+from ludwig.utils.fs_utils import open_file
+
+STREAMING_FORMATS = CSV_FORMATS | TSV_FORMATS | JSONL_FORMATS | PARQUET_FORMATS
+
+
+def read_chunks(data_fp: str, data_format: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Reads the dataset at `data_fp` as a sequence of DataFrames of at most `chunk_size` rows.
+
+    CSV, TSV and JSONL files are parsed `chunk_size` lines at a time, Parquet files are read one row group at a time and
+    split into chunks of at most `chunk_size` rows.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be a positive integer, found: {chunk_size}")
+
+    if data_format in CSV_FORMATS or data_format in TSV_FORMATS:
+        read_xsv = read_csv if data_format in CSV_FORMATS else read_tsv
+        with read_xsv(data_fp, df_lib=pd, chunksize=chunk_size) as reader:
+            yield from reader
+    elif data_format in JSONL_FORMATS:
+        with pd.read_json(data_fp, lines=True, chunksize=chunk_size) as reader:
+            yield from reader
+    elif data_format in PARQUET_FORMATS:
+        with open_file(data_fp, "rb") as f:
+            for batch in pq.ParquetFile(f).iter_batches(batch_size=chunk_size):
+                yield batch.to_pandas()
+    else:
+        raise ValueError(
+            f"Streaming is not supported for data format {data_format}, supported formats are: "
+            f"{sorted(STREAMING_FORMATS)}"
+        )
+
+
+class PredictionsWriter(ABC):
+    """Appends DataFrames of postprocessed predictions to a single output file, one chunk at a time."""
+
+    # mode the output file is opened with
+    mode: str
+
+    def __init__(self, path: str):
+        self.path = path
+        self._exit_stack = contextlib.ExitStack()
+        self._file = None
+
+    @abstractmethod
+    def write(self, df: pd.DataFrame):
+        raise NotImplementedError()
+
+    def close(self):
+        self._exit_stack.close()
+
+    def __enter__(self):
+        self._file = self._exit_stack.enter_context(open_file(self.path, self.mode))
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ParquetPredictionsWriter(PredictionsWriter):
+    """Writes every chunk as a row group of a Parquet file, readable with `DataFrameEngine.read_predictions`."""
+
+    mode = "wb"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._writer = None
+        self.column_shapes: Dict[str, Tuple] = {}
+
+    def write(self, df: pd.DataFrame):
+        # multidimensional predictions are stored flattened, as in `DataFrameEngine.write_predictions`
+        df, column_shapes = flatten_df(df, PANDAS)
+        for column, shape in column_shapes.items():
+            self.column_shapes.setdefault(column, shape)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._file, table.schema)
+        elif not table.schema.equals(self._writer.schema):
+            # types inferred from a single chunk may be narrower than those of the first chunk, e.g. all nulls
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            save_json(os.path.join(os.path.dirname(self.path), PREDICTIONS_SHAPES_FILE_NAME), self.column_shapes)
+        super().close()
+
+
+class CSVPredictionsWriter(PredictionsWriter):
+    """Writes all chunks to a single CSV file with one header row."""
+
+    mode = "w"
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._header_written = False
+
+    def write(self, df: pd.DataFrame):
+        df.to_csv(self._file, header=not self._header_written, index=False)
+        self._header_written = True
+
+
+predictions_writer_registry = {
+    **{fmt: ParquetPredictionsWriter for fmt in PARQUET_FORMATS},
+    **{fmt: CSVPredictionsWriter for fmt in CSV_FORMATS},
+}
+
+
+def get_predictions_writer(path: str) -> PredictionsWriter:
+    """Returns the writer of predictions for the format of the output `path`, inferred from its extension."""
+    output_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if output_format not in predictions_writer_registry:
+        raise ValueError(
+            f"Cannot write streamed predictions to {path}, supported output formats are: "
+            f"{sorted(predictions_writer_registry)}"
+        )
+    return predictions_writer_registry[output_format](path)
+
+
+@dataclass
+class StreamingStats:
+    """Throughput of a streaming prediction."""
+
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def add_chunk(self, num_rows: int, seconds: float):
+        """Records a chunk of `num_rows` rows read, predicted and written in `seconds`."""
+        self.rows += num_rows
+        self.chunks += 1
+        self.seconds += seconds
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "seconds": self.seconds,
+            "rows_per_second": self.rows_per_second,
+        }
@@ -1,11 +1,16 @@
 """Utility functions related to sequence decoders."""
 
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import torch
 
 from ludwig.constants import ENCODER_OUTPUT_STATE, HIDDEN
 from ludwig.modules.reduction_modules import SequenceReducer
+from ludwig.utils import strings_utils
+
+# Logit of the symbols other than padding after the stop symbol, low enough for the padding symbol to get a probability
+# of exactly 1 while finite, so losses computed on these logits stay finite.
+STOPPED_LOGIT = -100.0
 
 
 def repeat_2D_tensor(tensor, k):
@@ -117,3 +122,49 @@ def get_lstm_init_state(
 
     # Repeat over the number of layers.
     return repeat_2D_tensor(decoder_hidden_state, num_layers), repeat_2D_tensor(decoder_cell_state, num_layers)
+
+
+def greedy_decode_until_stop(
+    decoder_step: Callable,
+    decoder_input: torch.Tensor,
+    decoder_states: List[torch.Tensor],
+    logits: torch.Tensor,
+) -> torch.Tensor:
+    """Greedily decodes sequences until every one of them has produced the stop symbol.
+
+    Rows that produced the stop symbol drop out of the batch decoded at the next time steps, their logits after the stop
+    symbol put all the probability on the padding symbol, so those steps add nothing to the log probability of the
+    sequence. The logits of the other steps are the same as when decoding every row up to the maximum sequence length.
+
+    Args:
+        decoder_step: Function running a single decoding time step, taking the previous step's predicted symbols and
+            the decoder states and returning the [batch_size, 1, vocab_size] logits followed by the updated states.
+        decoder_input: [batch_size] tensor with the start symbols.
+        decoder_states: Decoder states, each [num_layers, batch_size, hidden_size].
+        logits: [batch_size, max_sequence_length, vocab_size] tensor filled with the logits of every step.
+
+    Returns:
+        The logits tensor.
+    """
+    # Logits of the steps after the stop symbol.
+    stopped_logits = torch.full_like(logits[0, 0], STOPPED_LOGIT)
+    stopped_logits[strings_utils.SpecialSymbol.PADDING.value] = 0
+
+    # Indices in the batch of the rows still being decoded.
+    active = torch.arange(logits.size(0), device=logits.device)
+    for di in range(logits.size(1)):
+        decoder_output, *decoder_states = decoder_step(decoder_input, *decoder_states)
+        logits[active, di, :] = decoder_output.squeeze(1)
+
+        _, topi = decoder_output.topk(1)
+        decoder_input = topi.squeeze(1).squeeze(1).detach()
+
+        unfinished = decoder_input != strings_utils.SpecialSymbol.STOP.value
+        if not unfinished.all():
+            logits[active[~unfinished], di + 1 :] = stopped_logits
+            if not unfinished.any():
+                break
+            active = active[unfinished]
+            decoder_input = decoder_input[unfinished]
+            decoder_states = [state[:, unfinished] for state in decoder_states]
+    return logits
@@ -21,7 +21,7 @@ import torch.nn as nn
 from ludwig.constants import LOGITS, SEQUENCE, TEXT
 from ludwig.decoders.base import Decoder
 from ludwig.decoders.registry import register_decoder
-from ludwig.decoders.sequence_decoder_utils import get_lstm_init_state, get_rnn_init_state
+from ludwig.decoders.sequence_decoder_utils import get_lstm_init_state, get_rnn_init_state, greedy_decode_until_stop
 from ludwig.modules.reduction_modules import SequenceReducer
 from ludwig.schema.decoders.sequence_decoders import SequenceGeneratorDecoderConfig
 from ludwig.utils import strings_utils
@@ -123,6 +123,7 @@ class SequenceRNNDecoder(nn.Module):
         cell_type: str,
         num_layers: int = 1,
         reduce_input="sum",
+        early_exit: bool = False,
     ):
         super().__init__()
         self.hidden_size = hidden_size
@@ -131,6 +132,7 @@ class SequenceRNNDecoder(nn.Module):
         self.max_sequence_length = max_sequence_length
         self.reduce_sequence = SequenceReducer(reduce_mode=reduce_input)
         self.num_layers = num_layers
+        self.early_exit = early_exit
 
         self.register_buffer("logits", torch.zeros([max_sequence_length, vocab_size]))
         self.register_buffer("decoder_input", torch.Tensor([strings_utils.SpecialSymbol.START.value]))
@@ -156,6 +158,10 @@ class SequenceRNNDecoder(nn.Module):
         # Initialize the decoder with start symbols.
         decoder_input = self.decoder_input.repeat(batch_size)
 
+        # Traced models replay the steps decoded for the example inputs, so they always decode until max length.
+        if target is None and self.early_exit and not torch.jit.is_tracing():
+            return greedy_decode_until_stop(self.rnn_decoder, decoder_input, [decoder_hidden], logits)
+
         # Unsqueeze to account for extra multilayer dimension.
         # decoder_hidden = encoder_output_state.unsqueeze(0)
 
@@ -192,6 +198,7 @@ class SequenceLSTMDecoder(nn.Module):
         max_sequence_length: int,
         reduce_input: str = "sum",
         num_layers: int = 1,
+        early_exit: bool = False,
     ):
         super().__init__()
         self.hidden_size = hidden_size
@@ -200,6 +207,7 @@ class SequenceLSTMDecoder(nn.Module):
         self.max_sequence_length = max_sequence_length
         self.reduce_sequence = SequenceReducer(reduce_mode=reduce_input)
         self.num_layers = num_layers
+        self.early_exit = early_exit
 
         self.register_buffer("logits", torch.zeros([max_sequence_length, vocab_size]))
         self.register_buffer("decoder_input", torch.Tensor([strings_utils.SpecialSymbol.START.value]))
@@ -226,6 +234,12 @@ class SequenceLSTMDecoder(nn.Module):
         # Tensor to store decoder output logits.
         logits = self.logits.unsqueeze(0).repeat(batch_size, 1, 1)
 
+        # Traced models replay the steps decoded for the example inputs, so they always decode until max length.
+        if target is None and self.early_exit and not torch.jit.is_tracing():
+            return greedy_decode_until_stop(
+                self.lstm_decoder, decoder_input, [decoder_hidden, decoder_cell_state], logits
+            )
+
         # Decode until max length.
         for di in range(self.max_sequence_length):
             decoder_output, decoder_hidden, decoder_cell_state = self.lstm_decoder(
@@ -263,6 +277,7 @@ class SequenceGeneratorDecoder(Decoder):
         input_size: int = 256,
         reduce_input: str = "sum",
         num_layers: int = 1,
+        early_exit: bool = False,
         decoder_config=None,
         **kwargs,
     ):
@@ -274,6 +289,7 @@ class SequenceGeneratorDecoder(Decoder):
             input_size: Size of incoming combiner output.
             reduce_input: Mode with which to reduce incoming combiner output, if needed.
             num_layers: Number of layers for the RNN deecoders.
+            early_exit: Whether to stop decoding predictions once every sequence of the batch produced the stop symbol.
         """
         super().__init__()
         self.config = decoder_config
@@ -288,6 +304,7 @@ class SequenceGeneratorDecoder(Decoder):
                 max_sequence_length=max_sequence_length,
                 reduce_input=reduce_input,
                 num_layers=num_layers,
+                early_exit=early_exit,
             )
         else:
             self.rnn_decoder = SequenceRNNDecoder(
@@ -297,6 +314,7 @@ class SequenceGeneratorDecoder(Decoder):
                 cell_type=cell_type,
                 reduce_input=reduce_input,
                 num_layers=num_layers,
+                early_exit=early_exit,
             )
 
     def forward(
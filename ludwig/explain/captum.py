@@ -1,11 +1,12 @@
+import logging
 from typing import List, Optional, Tuple
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import torch
-from captum.attr import IntegratedGradients
+import torch.nn.functional as F
 from torch.autograd import Variable
-from tqdm import tqdm
 
 from ludwig.api import LudwigModel
 from ludwig.api_annotations import PublicAPI
@@ -16,6 +17,11 @@ from ludwig.explain.util import get_pred_col
 from ludwig.models.ecd import ECD
 from ludwig.utils.torch_utils import DEVICE
 
+logger = logging.getLogger(__name__)
+
+# Number of steps of the approximation of the integral, the default of `captum.attr.IntegratedGradients`.
+DEFAULT_N_STEPS = 50
+
 
 class WrapperModule(torch.nn.Module):
     """Model used by the explainer to generate predictions.
@@ -110,6 +116,29 @@ def get_input_tensors(model: LudwigModel, input_set: pd.DataFrame) -> List[Varia
 
 @PublicAPI(stability="experimental")
 class IntegratedGradientsExplainer(Explainer):
+    def __init__(self, *args, target_chunk_size: int = 32, top_k: Optional[int] = None, **kwargs):
+        """Constructor for the Integrated Gradients explainer.
+
+        # Inputs
+
+        :param target_chunk_size: (int, default: 32) number of labels of the target feature whose attributions are
+            computed together, from a single forward pass and a batched backward pass. Larger chunks are faster but
+            hold the gradients of more labels in memory at once.
+        :param top_k: (Optional[int], default: None) if set, only the attributions of the `top_k` labels with the
+            highest predicted probability of every row are computed, in order of decreasing probability. With
+            `use_global=True`, the `top_k` labels with the highest mean predicted probability over all rows are used.
+            Only applies to category targets.
+
+        The other parameters are the ones of `Explainer`.
+        """
+        super().__init__(*args, **kwargs)
+        if target_chunk_size < 1:
+            raise ValueError(f"`target_chunk_size` must be a positive integer, found: {target_chunk_size}")
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"`top_k` must be a positive integer, found: {top_k}")
+        self.target_chunk_size = target_chunk_size
+        self.top_k = top_k
+
     def explain(self) -> Tuple[List[Explanation], List[float]]:
         """Explain the model's predictions using Integrated Gradients.
 
@@ -117,10 +146,10 @@ class IntegratedGradientsExplainer(Explainer):
 
         :return: (Tuple[List[Explanation], List[float]]) `(explanations, expected_values)`
             `explanations`: (List[Explanation]) A list of explanations, one for each row in the input data. Each
-            explanation contains the integrated gradients for each label in the target feature's vocab with respect to
-            each input feature.
+            explanation contains the integrated gradients for each label in the target feature's vocab (or for its
+            `top_k` labels) with respect to each input feature.
 
-            `expected_values`: (List[float]) of length [output feature cardinality] Average convergence delta for each
+            `expected_values`: (List[float]) of length [number of explained labels] Average convergence delta for each
             label in the target feature's vocab.
         """
         self.model.model.to(DEVICE)
@@ -130,30 +159,29 @@ class IntegratedGradientsExplainer(Explainer):
         sample_encoded = get_input_tensors(self.model, self.sample_df)
         baseline = get_baseline(sample_encoded)
 
-        # Compute attribution for each possible output feature label separately.
+        # Compute attribution for all the labels at once, a chunk of labels per forward pass.
+        target_indices = self.get_target_indices(inputs_encoded)
+        total_attributions = get_total_attributions(
+            self.model,
+            self.target_feature_name,
+            target_indices,
+            inputs_encoded,
+            baseline,
+            self.use_global,
+            len(self.inputs_df),
+            target_chunk_size=self.target_chunk_size,
+        )
+
         expected_values = []
-        for target_idx in tqdm(range(self.vocab_size), desc="Explain"):
-            total_attribution = get_total_attribution(
-                self.model,
-                self.target_feature_name,
-                target_idx if self.is_category_target else None,
-                inputs_encoded,
-                baseline,
-                self.use_global,
-                len(self.inputs_df),
-            )
-
-            for feature_attributions, explanation in zip(total_attribution, self.explanations):
+        for label_position, total_attribution in enumerate(total_attributions):
+            for row, (feature_attributions, explanation) in enumerate(zip(total_attribution, self.explanations)):
                 # Add the feature attributions to the explanation object for this row.
-                explanation.add(feature_attributions)
+                label_idx = int(target_indices[row, label_position]) if target_indices is not None else None
+                explanation.add(feature_attributions, label_idx=label_idx)
 
             # TODO(travis): for force plots, need something similar to SHAP E[X]
             expected_values.append(0.0)
 
-            if self.is_binary_target:
-                # For binary targets, we only need to compute attribution for the positive class (see below).
-                break
-
         # For binary targets, add an extra attribution for the negative class (false).
         if self.is_binary_target:
             for explanation in self.explanations:
@@ -165,6 +193,27 @@ class IntegratedGradientsExplainer(Explainer):
 
         return self.explanations, expected_values
 
+    def get_target_indices(self, inputs_encoded: List[Variable]) -> Optional[np.ndarray]:
+        """Returns the labels to explain, as an array of shape [number of explanations, number of labels], or None
+        if the target has a single output per row (binary and number targets).
+
+        Every row holds the labels explained for the corresponding explanation: the whole vocab of the target, or its
+        `top_k` labels.
+        """
+        if not self.is_category_target:
+            # For binary targets, we only need to compute attribution for the positive class.
+            return None
+
+        if self.top_k is None:
+            target_indices = np.arange(self.vocab_size)
+        else:
+            probabilities = get_target_probabilities(self.model, self.target_feature_name, inputs_encoded)
+            if self.use_global:
+                probabilities = probabilities.mean(axis=0, keepdims=True)
+            # stable sort, so that ties are broken by label index
+            target_indices = np.argsort(-probabilities, axis=1, kind="stable")[:, : self.top_k]
+        return np.broadcast_to(target_indices, (len(self.explanations), target_indices.shape[-1]))
+
 
 def get_baseline(sample_encoded: List[Variable]) -> List[Variable]:
     # For a robust baseline, we take the mean of all embeddings in the sample from the training data.
@@ -172,49 +221,80 @@ def get_baseline(sample_encoded: List[Variable]) -> List[Variable]:
     return [torch.unsqueeze(torch.mean(t, dim=0), 0) for t in sample_encoded]
 
 
-def get_total_attribution(
+def get_target_probabilities(
+    model: LudwigModel, target_feature_name: str, inputs_encoded: List[Variable]
+) -> npt.NDArray[np.float64]:
+    """Returns the predicted probabilities of the target feature, of shape [batch size, vocab size]."""
+    explanation_model = WrapperModule(model.model, target_feature_name)
+    device = next(model.model.parameters()).device
+    inputs_encoded_splits = [ipt.split(model.config_obj.trainer.batch_size) for ipt in inputs_encoded]
+
+    probabilities = []
+    with torch.no_grad():
+        for input_batch in zip(*inputs_encoded_splits):
+            probabilities.append(explanation_model(*[ipt.to(device) for ipt in input_batch]).cpu().numpy())
+    return np.concatenate(probabilities)
+
+
+def get_total_attributions(
     model: LudwigModel,
     target_feature_name: str,
-    target_idx: Optional[int],
+    target_indices: Optional[np.ndarray],
     inputs_encoded: List[Variable],
     baseline: List[Variable],
     use_global: bool,
     nsamples: int,
-) -> np.array:
+    target_chunk_size: int = 32,
+    n_steps: int = DEFAULT_N_STEPS,
+) -> npt.NDArray[np.float64]:
+    """Computes the Integrated Gradients attributions of the input features for a set of labels of the target.
+
+    # Inputs
+
+    :param target_indices: (Optional[np.ndarray]) labels to explain, either the same for every row, of shape
+        [number of labels], or per row, of shape [batch size (1 if `use_global`), number of labels]. None if the
+        target has a single output per row.
+    :param target_chunk_size: (int) number of labels whose gradients are computed from the same forward pass.
+    :param n_steps: (int) number of steps of the approximation of the integral.
+
+    # Return
 
+    :return: (np.array) attributions of shape [number of labels, batch size (1 if `use_global`), number of input
+        features].
+    """
     # Configure the explainer, which includes wrapping the model so its interface conforms to
     # the format expected by Captum.
     explanation_model = WrapperModule(model.model, target_feature_name)
-    explainer = IntegratedGradients(explanation_model)
 
-    inputs_encoded_splits = [ipt.split(model.config_obj.trainer.batch_size) for ipt in inputs_encoded]
+    batch_size = model.config_obj.trainer.batch_size
+    inputs_encoded_splits = [ipt.split(batch_size) for ipt in inputs_encoded]
     baseline = [t.to(DEVICE) for t in baseline]
+    if target_indices is not None:
+        target_indices = torch.from_numpy(
+            np.array(np.broadcast_to(target_indices, (nsamples, target_indices.shape[-1])))
+        )
+        target_indices_splits = target_indices.split(batch_size)
+    else:
+        target_indices_splits = [None] * len(inputs_encoded_splits[0])
 
     total_attribution = None
-    for input_batch in zip(*inputs_encoded_splits):
+    for input_batch, target_batch in zip(zip(*inputs_encoded_splits), target_indices_splits):
         input_batch = [ipt.to(DEVICE) for ipt in input_batch]
-        attribution = explainer.attribute(
-            tuple(input_batch),
-            baselines=tuple(baseline),
-            target=target_idx,
+        if target_batch is not None:
+            target_batch = target_batch.to(DEVICE)
+        attribution = integrated_gradients(
+            explanation_model, input_batch, baseline, target_batch, target_chunk_size, n_steps
         )
-
-        # Attribution over the feature embeddings returns a vector with the same dimensions of
-        # shape [batch_size, embedding_size], so take the sum over this vector in order to return a single
-        # floating point attribution value per input feature.
-        attribution = np.array([t.detach().cpu().numpy().sum(1) for t in attribution])
-
-        # Transpose to [batch_size, num_input_features]
-        attribution = attribution.T
+        attribution = attribution.detach().cpu().numpy()
 
         if total_attribution is not None:
             if use_global:
-                total_attribution += attribution.sum(axis=0, keepdims=True)
+                total_attribution += attribution.sum(axis=1, keepdims=True)
             else:
-                total_attribution = np.concatenate([total_attribution, attribution], axis=0)
+                total_attribution = np.concatenate([total_attribution, attribution], axis=1)
         else:
             if use_global:
-                total_attribution = attribution.sum(axis=0, keepdims=True)
+                total_attribution = attribution.sum(axis=1, keepdims=True)
             else:
                 total_attribution = attribution
 
@@ -222,3 +302,87 @@ def get_total_attribution(
         total_attribution /= nsamples
 
     return total_attribution
+
+
+def integrated_gradients(
+    explanation_model: WrapperModule,
+    inputs: List[torch.Tensor],
+    baselines: List[torch.Tensor],
+    target_indices: Optional[torch.Tensor],
+    target_chunk_size: int = 32,
+    n_steps: int = DEFAULT_N_STEPS,
+) -> torch.Tensor:
+    """Integrated Gradients of a batch of inputs for many labels of the target at once.
+
+    Follows `captum.attr.IntegratedGradients` with its default Gauss-Legendre approximation of the integral, but the
+    interpolated inputs are run through the model once and the gradients of a whole chunk of labels are computed by a
+    single batched vector-Jacobian product, instead of running the complete integration once per label.
+
+    # Inputs
+
+    :param inputs: (List[torch.Tensor]) encoded input features, each of shape [batch size, ...].
+    :param baselines: (List[torch.Tensor]) baseline of every input feature, broadcastable to its inputs.
+    :param target_indices: (Optional[torch.Tensor]) labels to explain for every row, of shape [batch size, number of
+        labels], or None if the target has a single output per row.
+
+    # Return
+
+    :return: (torch.Tensor) attributions of shape [number of labels, batch size, number of input features], summed
+        over the dimensions of every encoded input feature.
+    """
+    # Gauss-Legendre points and weights, mapped from [-1, 1] to [0, 1].
+    points, weights = np.polynomial.legendre.leggauss(n_steps)
+    step_sizes = torch.tensor(0.5 * weights, dtype=inputs[0].dtype, device=inputs[0].device)
+    alphas = (0.5 * (1 + points)).tolist()
+
+    # Interpolations between the baselines and the inputs, step by step: [n_steps * batch size, ...].
+    scaled_inputs = [
+        torch.cat([baseline + alpha * (ipt - baseline) for alpha in alphas]).requires_grad_()
+        for ipt, baseline in zip(inputs, baselines)
+    ]
+    outputs = explanation_model(*scaled_inputs)
+
+    num_labels = 1 if target_indices is None else target_indices.shape[1]
+    attributions = []
+    for start in range(0, num_labels, target_chunk_size):
+        if target_indices is None:
+            chunk = torch.ones_like(outputs).unsqueeze(0)
+        else:
+            # One-hot selection of the output of the labels of the chunk, built one chunk at a time to bound memory:
+            # [chunk size, n_steps * batch size, vocab size].
+            chunk_indices = target_indices[:, start : start + target_chunk_size]
+            chunk = F.one_hot(chunk_indices.repeat(n_steps, 1), outputs.shape[-1]).to(outputs.dtype).permute(1, 0, 2)
+        grads = _batched_vjp(outputs, scaled_inputs, chunk)
+
+        chunk_attributions = []
+        for grad, ipt, baseline in zip(grads, inputs, baselines):
+            # Integrate the gradients over the steps: [number of labels, batch size, ...].
+            grad = grad.view(grad.shape[0], n_steps, -1, *grad.shape[2:])
+            total_grad = (grad * step_sizes.view(1, n_steps, *[1] * (grad.dim() - 2))).sum(1)
+
+            # Attribution over the feature embeddings has the same dimensions as the embeddings, so sum over them in
+            # order to return a single floating point attribution value per input feature.
+            chunk_attributions.append((total_grad * (ipt - baseline)).flatten(2).sum(-1))
+        attributions.append(torch.stack(chunk_attributions, dim=-1))
+    return torch.cat(attributions)
+
+
+def _batched_vjp(
+    outputs: torch.Tensor, inputs: List[torch.Tensor], grad_outputs: torch.Tensor
+) -> Tuple[torch.Tensor, ...]:
+    """Returns the vector-Jacobian products of `outputs` with every vector in `grad_outputs` with respect to
+    `inputs`, each of shape [len(grad_outputs), *input.shape].
+
+    The graph of `outputs` is retained, so that the products with the next chunk of vectors reuse the forward pass.
+    """
+    try:
+        return torch.autograd.grad(outputs, inputs, grad_outputs=grad_outputs, retain_graph=True, is_grads_batched=True)
+    except RuntimeError as e:
+        # Models with operations that cannot be vectorized with vmap fall back to one backward pass per vector.
+        logger.debug(f"Falling back to one backward pass per label, batched backward pass failed: {e}")
+
+    grads = [
+        torch.autograd.grad(outputs, inputs, grad_outputs=grad_output, retain_graph=True)
+        for grad_output in grad_outputs
+    ]
+    return tuple(torch.stack(input_grads) for input_grads in zip(*grads))
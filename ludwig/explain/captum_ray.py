@@ -8,7 +8,7 @@ from tqdm import tqdm
 
 from ludwig.api import LudwigModel
 from ludwig.api_annotations import PublicAPI
-from ludwig.explain.captum import get_baseline, get_input_tensors, get_total_attribution, IntegratedGradientsExplainer
+from ludwig.explain.captum import get_baseline, get_input_tensors, get_total_attributions, IntegratedGradientsExplainer
 from ludwig.explain.explanation import Explanation
 from ludwig.utils.torch_utils import get_torch_device
 
@@ -51,42 +51,50 @@ class RayIntegratedGradientsExplainer(IntegratedGradientsExplainer):
         inputs_encoded_ref = ray.put(inputs_encoded)
         baseline_ref = ray.put(baseline)
 
-        if self.is_category_target:
+        target_indices = self.get_target_indices(inputs_encoded)
+        if target_indices is not None:
             # Evenly divide the list of labels among the desired number of workers (Ray tasks).
             # For example, 4 GPUs -> 4 workers. We do this instead of creating nlabels tasks because
             # there is significant overhead to spawning a Ray task.
-            target_splits = split_list(list(range(self.vocab_size)), self.num_workers)
+            label_positions = list(range(target_indices.shape[1]))
+            target_splits = [
+                target_indices[:, split] for split in split_list(label_positions, self.num_workers) if split
+            ]
         else:
             # No target index to compare against exists for number features.
             # For binary targets, we only need to compute attribution for the positive class (see below).
             # May need to revisit in the future for additional feature types.
-            target_splits = [[None]]
+            target_splits = [None]
 
-        # Compute attribution for each possible output feature label separately.
+        # Compute attribution for each chunk of labels of the output feature in a separate task.
         total_attribution_refs = []
-        for target_indices in target_splits:
+        for target_split in target_splits:
             total_attribution_ref = get_total_attribution_task.options(**self.resources_per_task).remote(
                 model_ref,
                 self.target_feature_name,
-                target_indices,
+                target_split,
                 inputs_encoded_ref,
                 baseline_ref,
                 self.use_global,
                 len(self.inputs_df),
+                self.target_chunk_size,
             )
             total_attribution_refs.append(total_attribution_ref)
 
         # Await the completion of our Ray tasks, then merge the results.
         expected_values = []
+        label_position = 0
         for total_attribution_ref in tqdm(total_attribution_refs, desc="Explain"):
             total_attributions = ray.get(total_attribution_ref)
             for total_attribution in total_attributions:
-                for feature_attributions, explanation in zip(total_attribution, self.explanations):
+                for row, (feature_attributions, explanation) in enumerate(zip(total_attribution, self.explanations)):
                     # Add the feature attributions to the explanation object for this row.
-                    explanation.add(feature_attributions)
+                    label_idx = int(target_indices[row, label_position]) if target_indices is not None else None
+                    explanation.add(feature_attributions, label_idx=label_idx)
 
                 # TODO(travis): for force plots, need something similar to SHAP E[X]
                 expected_values.append(0.0)
+                label_position += 1
 
         # For binary targets, add an extra attribution for the negative class (false).
         if self.is_binary_target:
@@ -113,26 +121,25 @@ def get_input_tensors_task(model: LudwigModel, df: pd.DataFrame) -> List[Variabl
 def get_total_attribution_task(
     model: LudwigModel,
     target_feature_name: str,
-    target_indices: List[Optional[int]],
+    target_indices: Optional[np.ndarray],
     inputs_encoded: List[Variable],
     baseline: List[Variable],
     use_global: bool,
     nsamples: int,
-) -> List[np.array]:
+    target_chunk_size: int,
+) -> np.array:
     model.model.to(get_torch_device())
     try:
-        return [
-            get_total_attribution(
-                model=model,
-                target_feature_name=target_feature_name,
-                target_idx=target_idx,
-                inputs_encoded=inputs_encoded,
-                baseline=baseline,
-                use_global=use_global,
-                nsamples=nsamples,
-            )
-            for target_idx in tqdm(target_indices, desc="Explain")
-        ]
+        return get_total_attributions(
+            model=model,
+            target_feature_name=target_feature_name,
+            target_indices=target_indices,
+            inputs_encoded=inputs_encoded,
+            baseline=baseline,
+            use_global=use_global,
+            nsamples=nsamples,
+            target_chunk_size=target_chunk_size,
+        )
     finally:
         model.model.cpu()
 
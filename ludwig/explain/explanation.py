@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import numpy.typing as npt
@@ -14,6 +14,9 @@ class LabelExplanation:
     # The attribution for each input feature.
     feature_attributions: npt.NDArray[np.float64]
 
+    # The index of the label in the vocab of the target feature, if known.
+    label_idx: Optional[int] = None
+
 
 @PublicAPI(stability="experimental")
 @dataclass
@@ -28,15 +31,15 @@ class Explanation:
     # The explanations for each label in the vocab of the target feature.
     label_explanations: List[LabelExplanation] = field(default_factory=list)
 
-    def add(self, feature_attributions: npt.NDArray[np.float64]):
-        """Add the feature attributions for a single label."""
+    def add(self, feature_attributions: npt.NDArray[np.float64], label_idx: Optional[int] = None):
+        """Add the feature attributions for a single label, optionally with its index in the vocab."""
         if len(self.label_explanations) > 0:
             # Check that the feature attributions are the same shape as existing explanations.
             assert self.label_explanations[0].feature_attributions.shape == feature_attributions.shape, (
                 f"Expected feature attributions of shape {self.label_explanations[0].feature_attributions.shape}, "
                 f"got {feature_attributions.shape}"
             )
-        self.label_explanations.append(LabelExplanation(feature_attributions))
+        self.label_explanations.append(LabelExplanation(feature_attributions, label_idx))
 
     def to_array(self) -> npt.NDArray[np.float64]:
         """Convert the explanation to a 2D array of shape (num_labels, num_features)."""
@@ -1,6 +1,11 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
 
 from ludwig.api_annotations import PublicAPI
+from ludwig.data.preprocessing import preprocess_for_prediction
 from ludwig.explain.explainer import Explainer
 from ludwig.explain.explanation import Explanation
 from ludwig.models.gbm import GBM
@@ -8,8 +13,19 @@ from ludwig.models.gbm import GBM
 
 @PublicAPI(stability="experimental")
 class GBMExplainer(Explainer):
+    def __init__(self, *args, batch_size: Optional[int] = None, **kwargs):
+        """Constructor for the GBM explainer.
+
+        # Inputs
+
+        :param batch_size: (Optional[int]) Number of rows to compute the SHAP values of at once. Defaults to the
+            `eval_batch_size` of the trainer.
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+
     def explain(self) -> Tuple[List[Explanation], List[float]]:
-        """Explain the model's predictions. Uses the feature importances from the model.
+        """Explain the model's predictions using the SHAP values computed by LightGBM from the trees (TreeSHAP).
 
         # Return
 
@@ -18,27 +34,73 @@ class GBMExplainer(Explainer):
             explanation contains the feature attributions for each label in the target feature's vocab.
 
             `expected_values`: (List[float]) of length [output feature cardinality] Expected value for each label in
-            the target feature's vocab.
+            the target feature's vocab, in the raw (pre-activation) score space of the model.
         """
         base_model: GBM = self.model.model
         gbm = base_model.lgbm_model
         if gbm is None:
             raise ValueError("Model has not been trained yet.")
 
-        # Get global feature importance from the model, use it for each row in the batch.
-        # TODO(travis): support local feature importance
-        feat_imp = gbm.booster_.feature_importance(importance_type="gain")
+        # Same input matrix as the one the model has been trained on, see `LightGBMTrainer._construct_lgb_datasets`.
+        dataset, _ = preprocess_for_prediction(
+            self.model.config_obj.to_dict(),
+            dataset=self.inputs_df,
+            training_set_metadata=self.model.training_set_metadata,
+            data_format="auto",
+            split="full",
+            include_outputs=False,
+            backend=self.model.backend,
+            callbacks=self.model.callbacks,
+        )
+        inputs = dataset.to_df(base_model.input_features.values())
 
-        # Scale the feature importance to sum to 1.
-        feat_imp = feat_imp / feat_imp.sum() if feat_imp.sum() > 0 else feat_imp
+        batch_size = self.batch_size or self.model.config_obj.trainer.eval_batch_size
+        shap_values = get_tree_shap_values(gbm.booster_, inputs, batch_size, self.use_global)
 
-        expected_values = []
-        for _ in range(self.vocab_size):
-            for explanation in self.explanations:
-                # Add the feature attributions to the explanation object for this row.
-                explanation.add(feat_imp)
+        # The last column holds the expected value of the raw score of each output, the others the feature attributions.
+        attributions, expected_values = shap_values[..., :-1], shap_values[..., -1].mean(axis=0)
+        for output_idx in range(attributions.shape[1]):
+            # Multiclass models have one output per label of the vocab, in order.
+            label_idx = output_idx if self.is_category_target and attributions.shape[1] > 1 else None
+            for feature_attributions, explanation in zip(attributions[:, output_idx], self.explanations):
+                explanation.add(feature_attributions, label_idx=label_idx)
 
-            # TODO:
-            expected_values.append(0.0)
+        expected_values = expected_values.tolist()
+
+        # Binary models (also categories with 2 labels) only output the score of the positive class, the attributions
+        # of the negative class are its opposite.
+        if self.vocab_size == 2 and attributions.shape[1] == 1:
+            for explanation in self.explanations:
+                le_true = explanation.label_explanations[0]
+                explanation.add(le_true.feature_attributions * -1)
+            expected_values.append(-expected_values[0])
 
         return self.explanations, expected_values
+
+
+def get_tree_shap_values(booster: lgb.Booster, inputs: pd.DataFrame, batch_size: int, use_global: bool) -> np.ndarray:
+    """Computes the exact SHAP values of every row of `inputs`, `batch_size` rows at a time.
+
+    # Inputs
+
+    :param booster: (lgb.Booster) The trained LightGBM booster.
+    :param inputs: (pd.DataFrame) The preprocessed input features, of shape [batch size, number of input features].
+    :param batch_size: (int) Number of rows to compute the SHAP values of at once.
+    :param use_global: (bool) Average the SHAP values over all rows if True.
+
+    # Return
+
+    :return: (np.ndarray) SHAP values of shape [batch size (1 if `use_global`), number of model outputs, number of
+        input features + 1], the last column being the expected value of the raw score of the output.
+    """
+    num_features = inputs.shape[1] + 1
+    shap_values = []
+    for start in range(0, len(inputs), batch_size):
+        # For multiclass models, the contributions of every class are concatenated: [batch size, classes * features].
+        contribs = booster.predict(inputs.iloc[start : start + batch_size], pred_contrib=True)
+        contribs = contribs.reshape(len(contribs), -1, num_features)
+        shap_values.append(contribs.sum(axis=0, keepdims=True) if use_global else contribs)
+
+    if use_global:
+        return np.sum(shap_values, axis=0) / len(inputs)
+    return np.concatenate(shap_values)
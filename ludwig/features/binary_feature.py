@@ -17,6 +17,7 @@ import logging
 from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import (
@@ -35,6 +36,7 @@ from ludwig.constants import (
 )
 from ludwig.error import InputDataError
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
+from ludwig.features.feature_utils import ids_to_labels, stack_rows
 from ludwig.schema.features.binary_feature import BinaryInputFeatureConfig, BinaryOutputFeatureConfig
 from ludwig.utils import calibration, output_feature_utils, strings_utils
 from ludwig.utils.eval_utils import (
@@ -356,9 +358,7 @@ class BinaryOutputFeature(BinaryFeatureMixin, OutputFeature):
         predictions_col = f"{self.feature_name}_{PREDICTIONS}"
         if predictions_col in result:
             if "bool2str" in metadata:
-                result[predictions_col] = result[predictions_col].map(
-                    lambda pred: metadata["bool2str"][pred],
-                )
+                result[predictions_col] = ids_to_labels(stack_rows(result[predictions_col]), metadata["bool2str"])
 
         probabilities_col = f"{self.feature_name}_{PROBABILITIES}"
         if probabilities_col in result:
@@ -366,14 +366,14 @@ class BinaryOutputFeature(BinaryFeatureMixin, OutputFeature):
             true_col = f"{probabilities_col}_{class_names[1]}"
             prob_col = f"{self.feature_name}_{PROBABILITY}"
 
+            true_probabilities = stack_rows(result[probabilities_col])
+            probabilities = np.stack([1 - true_probabilities, true_probabilities], axis=1)
             result = result.assign(
                 **{
-                    false_col: lambda x: 1 - x[probabilities_col],
-                    true_col: lambda x: x[probabilities_col],
-                    prob_col: np.where(
-                        result[probabilities_col] > 0.5, result[probabilities_col], 1 - result[probabilities_col]
-                    ),
-                    probabilities_col: result.apply(lambda x: [1 - x[probabilities_col], x[probabilities_col]], axis=1),
+                    false_col: probabilities[:, 0],
+                    true_col: true_probabilities,
+                    prob_col: probabilities.max(axis=1, initial=0),
+                    probabilities_col: pd.Series(probabilities.tolist(), index=result.index, dtype=object),
                 }
             )
 
@@ -17,6 +17,7 @@ import logging
 from typing import Any, Dict, List, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import (
@@ -36,6 +37,7 @@ from ludwig.constants import (
 )
 from ludwig.error import InputDataError
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
+from ludwig.features.feature_utils import ids_to_labels, stack_rows
 from ludwig.schema.features.category_feature import CategoryInputFeatureConfig, CategoryOutputFeatureConfig
 from ludwig.utils import calibration, output_feature_utils
 from ludwig.utils.eval_utils import ConfusionMatrix
@@ -405,32 +407,33 @@ class CategoryOutputFeature(CategoryFeatureMixin, OutputFeature):
         predictions,
         metadata,
     ):
+        idx2str = metadata.get("idx2str")
+
         predictions_col = f"{self.feature_name}_{PREDICTIONS}"
         if predictions_col in predictions:
-            if "idx2str" in metadata:
-                predictions[predictions_col] = predictions[predictions_col].map(lambda pred: metadata["idx2str"][pred])
+            if idx2str is not None:
+                predictions[predictions_col] = ids_to_labels(stack_rows(predictions[predictions_col]), idx2str)
 
         probabilities_col = f"{self.feature_name}_{PROBABILITIES}"
         if probabilities_col in predictions:
             prob_col = f"{self.feature_name}_{PROBABILITY}"
-            predictions[prob_col] = predictions[probabilities_col].map(max)
-            predictions[probabilities_col] = predictions[probabilities_col].map(lambda pred: pred.tolist())
-            if "idx2str" in metadata:
-                for i, label in enumerate(metadata["idx2str"]):
-                    key = f"{probabilities_col}_{label}"
-
-                    # Use default param to force a capture before the loop completes, see:
-                    # https://stackoverflow.com/questions/2295290/what-do-lambda-function-closures-capture
-                    predictions[key] = predictions[probabilities_col].map(
-                        lambda prob, i=i: prob[i],
-                    )
+            probabilities = stack_rows(predictions[probabilities_col], row_shape=(len(idx2str or []),))
+            predictions[prob_col] = probabilities.max(axis=1, initial=0)
+            predictions[probabilities_col] = pd.Series(probabilities.tolist(), index=predictions.index, dtype=object)
+            if idx2str is not None:
+                # one column per class, added in a single operation
+                probabilities_per_class = pd.DataFrame(
+                    probabilities,
+                    index=predictions.index,
+                    columns=[f"{probabilities_col}_{label}" for label in idx2str],
+                )
+                predictions = pd.concat([predictions, probabilities_per_class], axis=1)
 
         top_k_col = f"{self.feature_name}_predictions_top_k"
         if top_k_col in predictions:
-            if "idx2str" in metadata:
-                predictions[top_k_col] = predictions[top_k_col].map(
-                    lambda pred_top_k: [metadata["idx2str"][pred] for pred in pred_top_k]
-                )
+            if idx2str is not None:
+                top_k = ids_to_labels(stack_rows(predictions[top_k_col], row_shape=(0,)), idx2str)
+                predictions[top_k_col] = pd.Series(top_k.tolist(), index=predictions.index, dtype=object)
 
         return predictions
 
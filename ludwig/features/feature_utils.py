@@ -14,12 +14,24 @@
 # limitations under the License.
 # ==============================================================================
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 import torch
 
-from ludwig.constants import NAME, PREPROCESSING, SEQUENCE, TEXT, TIMESERIES
+from ludwig.constants import (
+    LAST_PREDICTIONS,
+    LENGTHS,
+    NAME,
+    PREDICTIONS,
+    PREPROCESSING,
+    PROBABILITIES,
+    PROBABILITY,
+    SEQUENCE,
+    TEXT,
+    TIMESERIES,
+)
 from ludwig.utils.data_utils import hash_dict
 from ludwig.utils.strings_utils import get_tokenizer_from_registry, UNKNOWN_SYMBOL
 
@@ -48,50 +60,88 @@ def set_str_to_idx(set_string, feature_dict, tokenizer_name):
     return np.array(out, dtype=np.int32)
 
 
-def compute_token_probabilities(
-    probabilities: Union[list, tuple, np.ndarray],
-) -> np.ndarray:
-    """Gets the maximum probability per timestep.
+def stack_rows(values: pd.Series, row_shape: Tuple[int, ...] = ()) -> np.ndarray:
+    """Stacks a Series of scalars, or of equally shaped arrays, into a single array with one row per element.
 
     Args:
-        probabilities: An iterable of iterables or np.ndarray with shape (sequence_length, num_classes)
-            where each inner iterable or np.ndarray is the probability distribution for a single timestep.
-    Returns:
-        An np.ndarray with shape (sequence_length,) containing the maximum probability for each timestep.
+        values: Series with one scalar or array per row.
+        row_shape: Shape of every row, only used to shape the result when `values` is empty.
     """
-    if isinstance(probabilities, (list, tuple)):
-        max_probs = []
-        for timestep_probs in probabilities:
-            max_probs.append(np.max(timestep_probs))
-        max_probs = np.array(max_probs)
-    elif isinstance(probabilities, np.ndarray):
-        max_probs = np.max(probabilities, axis=-1)
-    else:
-        raise ValueError(f"probabilities type must be in [list, tuple, np.ndarray]. Got {type(probabilities)}")
-    return max_probs
+    if len(values) == 0:
+        return np.zeros((0,) + tuple(row_shape))
+    array = values.to_numpy()
+    if array.dtype == object:
+        array = np.stack(array)
+    return array
 
 
-def compute_sequence_probability(
-    sequence_probabilities: np.ndarray,
-    max_sequence_length: Optional[int] = None,
-    return_log_prob: bool = True,
-) -> float:
-    """Computes the sequence level probability.
+def ids_to_labels(ids: np.ndarray, idx2str: List[str], unknown_symbol: Optional[str] = None) -> np.ndarray:
+    """Maps an array of vocabulary ids to an object array of the same shape with their labels.
 
     Args:
-        sequence_probabilities: An iterable of iterables or np.ndarray with shape (sequence_length,)
-        max_sequence_length: The maximum sequence length to use. If None, uses the first dim of `sequence_probabilities`
-        return_log_prob: Whether to return the log probability. Defaults to True.
-    """
-    if max_sequence_length is None:
-        max_sequence_length = sequence_probabilities.shape[0]
+        ids: Array of ids.
+        idx2str: Vocabulary, the label of every id.
+        unknown_symbol: Label of the ids out of the vocabulary. If None, the ids are expected to be in the vocabulary.
 
-    sequence_probabilities = sequence_probabilities[:max_sequence_length]
+    Raises:
+        IndexError: If `unknown_symbol` is None and some ids are out of the vocabulary.
+    """
+    labels = np.empty(len(idx2str) + 1, dtype=object)
+    labels[:-1] = idx2str
+    labels[-1] = unknown_symbol
+    ids = np.asarray(ids, dtype=np.int64)
+    in_vocab = (ids >= 0) & (ids < len(idx2str))
+    if unknown_symbol is not None:
+        ids = np.where(in_vocab, ids, len(idx2str))
+    elif not in_vocab.all():
+        raise IndexError(f"Ids {np.unique(ids[~in_vocab]).tolist()} are out of the vocabulary of size {len(idx2str)}")
+    return labels[ids]
+
+
+def postprocess_sequence_predictions(
+    result: pd.DataFrame,
+    feature_name: str,
+    idx2str: Optional[List[str]],
+    max_sequence_length: int,
+    truncate_predictions: bool = True,
+) -> pd.DataFrame:
+    """Postprocesses the predictions of a sequence or text output feature, all rows at once.
 
-    if return_log_prob:
-        return np.sum(np.log(sequence_probabilities))
-    else:
-        return np.prod(sequence_probabilities)
+    Args:
+        result: DataFrame of predictions.
+        feature_name: Name of the output feature.
+        idx2str: Vocabulary of the feature, if None the predicted token ids are not mapped to tokens.
+        max_sequence_length: Maximum length of the predicted sequences.
+        truncate_predictions: Whether to truncate the predicted tokens to `max_sequence_length`.
+    """
+    predictions_col = f"{feature_name}_{PREDICTIONS}"
+    if predictions_col in result and idx2str is not None:
+        predictions = stack_rows(result[predictions_col], row_shape=(0,))
+        if truncate_predictions:
+            predictions = predictions[:, :max_sequence_length]
+        tokens = ids_to_labels(predictions, idx2str, unknown_symbol=UNKNOWN_SYMBOL)
+        result[predictions_col] = pd.Series(tokens.tolist(), index=result.index, dtype=object)
+
+    last_preds_col = f"{feature_name}_{LAST_PREDICTIONS}"
+    if last_preds_col in result and idx2str is not None:
+        last_predictions = stack_rows(result[last_preds_col])
+        result[last_preds_col] = ids_to_labels(last_predictions, idx2str, unknown_symbol=UNKNOWN_SYMBOL)
+
+    probs_col = f"{feature_name}_{PROBABILITIES}"
+    prob_col = f"{feature_name}_{PROBABILITY}"
+    if probs_col in result:
+        # currently does not return full probabilties because usually it is huge:
+        # dataset x length x classes
+        # TODO: add a mechanism for letting the user decide to save it
+        token_probabilities = stack_rows(result[probs_col], row_shape=(0, 0)).max(axis=-1, initial=0)
+        result[probs_col] = pd.Series(list(token_probabilities), index=result.index, dtype=object)
+        result[prob_col] = np.sum(np.log(token_probabilities[:, :max_sequence_length]), axis=1)
+
+    lengths_col = f"{feature_name}_{LENGTHS}"
+    if lengths_col in result:
+        del result[lengths_col]
+
+    return result
 
 
 def sanitize(name):
@@ -21,6 +21,7 @@ from functools import partial
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import torch
 import torchvision
 
@@ -428,17 +429,32 @@ class ImageFeatureMixin(BaseFeatureMixin):
         if in_memory or skip_save_processed_input:
             metadata[name]["reshape"] = (num_channels, height, width)
 
-            proc_col = backend.read_binary_files(
-                abs_path_column, map_fn=read_image_if_bytes_obj_and_resize, file_size=average_file_size
-            )
+            num_processes = preprocessing_parameters.get("num_processes", 1)
+            if num_processes > 1 and not backend.df_engine.partitioned:
+                # Decode in a pool of processes, into a single array of all the images.
+                images, failed = backend.read_binary_files_to_array(
+                    abs_path_column,
+                    read_image_if_bytes_obj_and_resize,
+                    (len(abs_path_column), num_channels, height, width),
+                    num_processes,
+                )
+                images[failed] = default_image
+                num_failed_image_reads = int(failed.sum())
+                proc_col = pd.Series(list(images), index=abs_path_column.index)
+            else:
+                proc_col = backend.read_binary_files(
+                    abs_path_column, map_fn=read_image_if_bytes_obj_and_resize, file_size=average_file_size
+                )
 
-            num_failed_image_reads = (
-                proc_col.isna().sum().compute() if is_dask_series_or_df(proc_col, backend) else proc_col.isna().sum()
-            )
+                num_failed_image_reads = (
+                    proc_col.isna().sum().compute()
+                    if is_dask_series_or_df(proc_col, backend)
+                    else proc_col.isna().sum()
+                )
 
-            proc_col = backend.df_engine.map_objects(
-                proc_col, lambda row: default_image if not isinstance(row, np.ndarray) else row
-            )
+                proc_col = backend.df_engine.map_objects(
+                    proc_col, lambda row: default_image if not isinstance(row, np.ndarray) else row
+                )
 
             proc_df[feature_config[PROC_COLUMN]] = proc_col
         else:
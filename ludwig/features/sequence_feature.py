@@ -15,7 +15,6 @@
 # ==============================================================================
 
 import logging
-from functools import partial
 from typing import Any, Dict, List, Union
 
 import numpy as np
@@ -25,7 +24,6 @@ from ludwig.constants import (
     COLUMN,
     EDIT_DISTANCE,
     LAST_ACCURACY,
-    LAST_PREDICTIONS,
     LENGTHS,
     LOSS,
     NAME,
@@ -39,7 +37,7 @@ from ludwig.constants import (
     TOKEN_ACCURACY,
 )
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
-from ludwig.features.feature_utils import compute_sequence_probability, compute_token_probabilities
+from ludwig.features.feature_utils import postprocess_sequence_predictions
 from ludwig.schema.features.sequence_feature import SequenceInputFeatureConfig, SequenceOutputFeatureConfig
 from ludwig.utils import output_feature_utils
 from ludwig.utils.math_utils import softmax
@@ -207,6 +205,7 @@ class SequenceFeatureMixin(BaseFeatureMixin):
             padding_symbol=preprocessing_parameters["padding_symbol"],
             ngram_size=preprocessing_parameters["ngram_size"],
             processor=backend.df_engine,
+            cache_tokens=True,
         )
         max_length = min(preprocessing_parameters["max_sequence_length"], max_length)
         return {
@@ -230,6 +229,7 @@ class SequenceFeatureMixin(BaseFeatureMixin):
             lowercase=preprocessing_parameters["lowercase"],
             tokenizer_vocab_file=preprocessing_parameters["vocab_file"],
             processor=backend.df_engine,
+            ngram_size=preprocessing_parameters.get("ngram_size"),
         )
         return sequence_data
 
@@ -425,51 +425,9 @@ class SequenceOutputFeature(SequenceFeatureMixin, OutputFeature):
         result,
         metadata,
     ):
-        predictions_col = f"{self.feature_name}_{PREDICTIONS}"
-        lengths_col = f"{self.feature_name}_{LENGTHS}"
-        if predictions_col in result:
-            if "idx2str" in metadata:
-
-                def idx2str(row):
-                    pred = row[predictions_col]
-                    length = metadata["max_sequence_length"]
-                    return [
-                        metadata["idx2str"][token] if token < len(metadata["idx2str"]) else UNKNOWN_SYMBOL
-                        for token in [pred[i] for i in range(length)]
-                    ]
-
-                result[predictions_col] = result.apply(idx2str, axis=1)
-
-        last_preds_col = f"{self.feature_name}_{LAST_PREDICTIONS}"
-        if last_preds_col in result:
-            if "idx2str" in metadata:
-
-                def last_idx2str(last_pred):
-                    if last_pred < len(metadata["idx2str"]):
-                        return metadata["idx2str"][last_pred]
-                    return UNKNOWN_SYMBOL
-
-                result[last_preds_col] = result[last_preds_col].map(last_idx2str)
-
-        probs_col = f"{self.feature_name}_{PROBABILITIES}"
-        prob_col = f"{self.feature_name}_{PROBABILITY}"
-        if probs_col in result:
-            # currently does not return full probabilties because usually it is huge:
-            # dataset x length x classes
-            # TODO: add a mechanism for letting the user decide to save it
-            result[probs_col] = result[probs_col].map(compute_token_probabilities)
-            result[prob_col] = result[probs_col].map(
-                partial(
-                    compute_sequence_probability,
-                    max_sequence_length=metadata["max_sequence_length"],
-                    return_log_prob=True,
-                )
-            )
-
-        if lengths_col in result:
-            del result[lengths_col]
-
-        return result
+        return postprocess_sequence_predictions(
+            result, self.feature_name, metadata.get("idx2str"), metadata["max_sequence_length"]
+        )
 
     @staticmethod
     def create_postproc_module(metadata: Dict[str, Any]) -> torch.nn.Module:
@@ -17,11 +17,12 @@ import logging
 from typing import Any, Dict, List, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import COLUMN, HIDDEN, JACCARD, LOGITS, LOSS, NAME, PREDICTIONS, PROBABILITIES, PROC_COLUMN, SET
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
-from ludwig.features.feature_utils import set_str_to_idx
+from ludwig.features.feature_utils import ids_to_labels, set_str_to_idx, stack_rows
 from ludwig.schema.features.set_feature import SetInputFeatureConfig, SetOutputFeatureConfig
 from ludwig.utils import output_feature_utils
 from ludwig.utils.strings_utils import create_vocabulary, UNKNOWN_SYMBOL
@@ -316,22 +317,27 @@ class SetOutputFeature(SetFeatureMixin, OutputFeature):
         result,
         metadata,
     ):
+        num_classes = len(metadata["idx2str"])
+
         predictions_col = f"{self.feature_name}_{PREDICTIONS}"
         if predictions_col in result:
-
-            def idx2str(pred_set):
-                return [metadata["idx2str"][i] for i, pred in enumerate(pred_set) if pred]
-
-            result[predictions_col] = result[predictions_col].map(idx2str)
+            predicted = stack_rows(result[predictions_col], row_shape=(num_classes,)).astype(bool)
+            labels = ids_to_labels(np.nonzero(predicted)[1], metadata["idx2str"])
+            # split the labels of all rows into the labels of every row
+            rows = np.split(labels, np.cumsum(predicted.sum(axis=1))[:-1]) if len(predicted) else []
+            result[predictions_col] = pd.Series([row.tolist() for row in rows], index=result.index, dtype=object)
 
         probabilities_col = f"{self.feature_name}_{PROBABILITIES}"
         if probabilities_col in result:
-
-            def get_prob(prob_set):
-                # Cast to float32 because empty np.array objects are np.float64, causing mismatch errors during saving.
-                return np.array([prob for prob in prob_set if prob >= self.threshold], dtype=np.float32)
-
-            result[probabilities_col] = result[probabilities_col].map(get_prob)
+            # Cast to float32 because empty np.array objects are np.float64, causing mismatch errors during saving.
+            probabilities = stack_rows(result[probabilities_col], row_shape=(num_classes,)).astype(np.float32)
+            above_threshold = probabilities >= self.threshold
+            rows = (
+                np.split(probabilities[above_threshold], np.cumsum(above_threshold.sum(axis=1))[:-1])
+                if len(probabilities)
+                else []
+            )
+            result[probabilities_col] = pd.Series(rows, index=result.index, dtype=object)
 
         return result
 
@@ -14,7 +14,6 @@
 # limitations under the License.
 # ==============================================================================
 import logging
-from functools import partial
 from typing import Any, Dict, Union
 
 import torch
@@ -23,20 +22,17 @@ from ludwig.constants import (
     COLUMN,
     EDIT_DISTANCE,
     LAST_ACCURACY,
-    LAST_PREDICTIONS,
     LENGTHS,
     LOSS,
     NAME,
     PERPLEXITY,
-    PREDICTIONS,
     PROBABILITIES,
-    PROBABILITY,
     PROC_COLUMN,
     TEXT,
     TOKEN_ACCURACY,
 )
 from ludwig.features.base_feature import BaseFeatureMixin, OutputFeature
-from ludwig.features.feature_utils import compute_sequence_probability, compute_token_probabilities
+from ludwig.features.feature_utils import postprocess_sequence_predictions
 from ludwig.features.sequence_feature import (
     _SequencePostprocessing,
     _SequencePreprocessing,
@@ -82,6 +78,7 @@ class TextFeatureMixin(BaseFeatureMixin):
             pretrained_model_name_or_path=preprocessing_parameters["pretrained_model_name_or_path"],
             ngram_size=preprocessing_parameters["ngram_size"],
             processor=backend.df_engine,
+            cache_tokens=True,
         )
         return (
             idx2str,
@@ -156,6 +153,7 @@ class TextFeatureMixin(BaseFeatureMixin):
             tokenizer_vocab_file=preprocessing_parameters[f"{prefix}vocab_file"],
             pretrained_model_name_or_path=preprocessing_parameters["pretrained_model_name_or_path"],
             processor=backend.df_engine,
+            ngram_size=preprocessing_parameters.get("ngram_size"),
         )
 
     @staticmethod
@@ -284,47 +282,13 @@ class TextOutputFeature(TextFeatureMixin, SequenceOutputFeature):
         result,
         metadata,
     ):
-        # todo: refactor to reuse SequenceOutputFeature.postprocess_predictions
-        predictions_col = f"{self.feature_name}_{PREDICTIONS}"
-        if predictions_col in result:
-
-            def idx2str(pred):
-                return [
-                    metadata["idx2str"][token] if token < len(metadata["idx2str"]) else UNKNOWN_SYMBOL for token in pred
-                ]
-
-            result[predictions_col] = result[predictions_col].map(idx2str)
-
-        last_preds_col = f"{self.feature_name}_{LAST_PREDICTIONS}"
-        if last_preds_col in result:
-
-            def last_idx2str(last_pred):
-                if last_pred < len(metadata["idx2str"]):
-                    return metadata["idx2str"][last_pred]
-                return UNKNOWN_SYMBOL
-
-            result[last_preds_col] = result[last_preds_col].map(last_idx2str)
-
-        probs_col = f"{self.feature_name}_{PROBABILITIES}"
-        prob_col = f"{self.feature_name}_{PROBABILITY}"
-        if probs_col in result:
-            # currently does not return full probabilties because usually it is huge:
-            # dataset x length x classes
-            # TODO: add a mechanism for letting the user decide to save it
-            result[probs_col] = result[probs_col].map(compute_token_probabilities)
-            result[prob_col] = result[probs_col].map(
-                partial(
-                    compute_sequence_probability,
-                    max_sequence_length=metadata["max_sequence_length"],
-                    return_log_prob=True,
-                ),
-            )
-
-        lengths_col = f"{self.feature_name}_{LENGTHS}"
-        if lengths_col in result:
-            del result[lengths_col]
-
-        return result
+        return postprocess_sequence_predictions(
+            result,
+            self.feature_name,
+            metadata["idx2str"],
+            metadata["max_sequence_length"],
+            truncate_predictions=False,
+        )
 
     @staticmethod
     def create_postproc_module(metadata: Dict[str, Any]) -> torch.nn.Module:
@@ -17,6 +17,7 @@ import logging
 from typing import Any, Dict, List, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import (
@@ -34,6 +35,7 @@ from ludwig.constants import (
     VECTOR,
 )
 from ludwig.features.base_feature import InputFeature, OutputFeature, PredictModule
+from ludwig.features.feature_utils import stack_rows
 from ludwig.schema.features.vector_feature import VectorInputFeatureConfig, VectorOutputFeatureConfig
 from ludwig.utils import output_feature_utils
 from ludwig.utils.types import TorchscriptPreprocessingInput
@@ -233,7 +235,8 @@ class VectorOutputFeature(VectorFeatureMixin, OutputFeature):
     ):
         predictions_col = f"{self.feature_name}_{PREDICTIONS}"
         if predictions_col in result:
-            result[predictions_col] = result[predictions_col].map(lambda pred: pred.tolist())
+            predictions = stack_rows(result[predictions_col], row_shape=(0,))
+            result[predictions_col] = pd.Series(predictions.tolist(), index=result.index, dtype=object)
         return result
 
     @staticmethod
@@ -0,0 +1,151 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Preprocessed datasets shared by the hyperopt trials with the same preprocessing config."""
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ludwig.api import LudwigModel
+from ludwig.backend.base import Backend
+from ludwig.constants import TEST, TRAINING, VALIDATION
+from ludwig.data.cache.types import CacheableDataset
+from ludwig.data.cache.util import calculate_checksum
+from ludwig.data.dataset.base import Dataset
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.utils.data_utils import load_json, save_json
+from ludwig.utils.fs_utils import file_lock, makedirs, path_exists
+
+logger = logging.getLogger(__name__)
+
+META_FILE_NAME = "training_set_metadata.json"
+COLUMNS_FILE_NAME = "columns.json"
+
+PreprocessedDatasets = Tuple[Dataset, Optional[Dataset], Optional[Dataset], Dict[str, Any]]
+
+
+class SharedPreprocessedDatasets:
+    """Preprocessed datasets materialized once for every distinct preprocessing config, and shared read-only by all
+    the trials using that config.
+
+    Trials are grouped by the checksum of their preprocessing config, the same key as the one of the dataset cache. The
+    first trial of a group preprocesses the dataset and materializes it under `cache_dir`, while concurrent trials of
+    the group wait for it, and all of them load the materialized datasets. Pandas datasets are stored as one `.npy` file
+    per column and memory mapped, so that concurrent trials share the pages of the files instead of each holding a copy
+    in memory. Other datasets (e.g. Ray datasets) are stored by the dataset manager of the backend.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        dataset: Optional[CacheableDataset] = None,
+        training_set: Optional[CacheableDataset] = None,
+        validation_set: Optional[CacheableDataset] = None,
+        test_set: Optional[CacheableDataset] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.dataset = dataset
+        self.training_set = training_set
+        self.validation_set = validation_set
+        self.test_set = test_set
+
+    def get_key(self, config: Dict[str, Any]) -> str:
+        return calculate_checksum(self.dataset if self.dataset is not None else self.training_set, config)
+
+    def get(
+        self,
+        config: Dict[str, Any],
+        backend: Backend,
+        data_format: Optional[str] = None,
+        random_seed: Optional[int] = None,
+        callbacks=None,
+    ) -> PreprocessedDatasets:
+        """Returns the datasets preprocessed with `config`, preprocessing and materializing them if no other trial
+        has already done so."""
+        key = self.get_key(config)
+        variant_dir = os.path.join(self.cache_dir, key)
+        makedirs(self.cache_dir, exist_ok=True)
+        with file_lock(self.cache_dir, lock_file=f".lock_{key}"):
+            if not path_exists(os.path.join(variant_dir, META_FILE_NAME)):
+                logger.info(f"Preprocessing the datasets of preprocessing config {key}")
+                model = LudwigModel(config, backend=backend, callbacks=callbacks)
+                training_set, validation_set, test_set, training_set_metadata = model.preprocess(
+                    dataset=self.dataset,
+                    training_set=self.training_set,
+                    validation_set=self.validation_set,
+                    test_set=self.test_set,
+                    data_format=data_format,
+                    skip_save_processed_input=True,
+                    random_seed=random_seed,
+                )
+                splits = {TRAINING: training_set, VALIDATION: validation_set, TEST: test_set}
+                for tag, split in splits.items():
+                    if split is not None:
+                        _save_dataset(variant_dir, tag, split, config, training_set_metadata, backend)
+                # written last, marks the variant as complete
+                save_json(os.path.join(variant_dir, META_FILE_NAME), training_set_metadata)
+            else:
+                logger.info(f"Using the shared datasets of preprocessing config {key}")
+
+        training_set_metadata = load_json(os.path.join(variant_dir, META_FILE_NAME))
+        datasets = [
+            _load_dataset(os.path.join(variant_dir, tag), config, training_set_metadata, backend)
+            for tag in (TRAINING, VALIDATION, TEST)
+        ]
+        return (*datasets, training_set_metadata)
+
+
+def _save_dataset(
+    variant_dir: str,
+    tag: str,
+    dataset: Dataset,
+    config: Dict[str, Any],
+    training_set_metadata: Dict[str, Any],
+    backend: Backend,
+):
+    path = os.path.join(variant_dir, tag)
+    if not isinstance(dataset, PandasDataset):
+        backend.dataset_manager.save(path, dataset.to_df(), config, training_set_metadata, tag)
+        return
+
+    makedirs(path, exist_ok=True)
+    columns = list(dataset.get_dataset())
+    for i, column in enumerate(columns):
+        values = dataset.get_dataset()[column]
+        np.save(os.path.join(path, f"{i}.npy"), values, allow_pickle=values.dtype == object)
+    save_json(os.path.join(path, COLUMNS_FILE_NAME), columns)
+
+
+def _load_dataset(
+    path: str, config: Dict[str, Any], training_set_metadata: Dict[str, Any], backend: Backend
+) -> Optional[Dataset]:
+    if not path_exists(path):
+        return None
+
+    columns_fp = os.path.join(path, COLUMNS_FILE_NAME)
+    if not path_exists(columns_fp):
+        return backend.dataset_manager.create(path, config, training_set_metadata)
+
+    dataset = {}
+    for i, column in enumerate(load_json(columns_fp)):
+        column_fp = os.path.join(path, f"{i}.npy")
+        try:
+            dataset[column] = np.load(column_fp, mmap_mode="r")
+        except ValueError:
+            # arrays of python objects cannot be memory mapped
+            dataset[column] = np.load(column_fp, allow_pickle=True)
+    return backend.dataset_manager.create(dataset, config, training_set_metadata)
@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import shutil
+import tempfile
 import threading
 import time
 import traceback
@@ -31,6 +32,9 @@ from ludwig.backend import initialize_backend, RAY
 from ludwig.backend.ray import initialize_ray
 from ludwig.callbacks import Callback
 from ludwig.constants import MAXIMIZE, TEST, TRAINER, TRAINING, TYPE, VALIDATION
+from ludwig.data.cache.types import wrap
+from ludwig.data.dataset.base import Dataset
+from ludwig.hyperopt.dataset_cache import SharedPreprocessedDatasets
 from ludwig.hyperopt.results import HyperoptResults, TrialResults
 from ludwig.hyperopt.search_algos import get_search_algorithm
 from ludwig.hyperopt.utils import load_json_values, substitute_parameters
@@ -109,6 +113,23 @@ def ray_resource_allocation_function(
     return pgf
 
 
+def remove_dir_on_all_nodes(path: str):
+    """Removes the local directory `path` on every alive node of the cluster, where trials may have created it."""
+
+    @ray.remote(num_cpus=0)
+    def _remove_dir():
+        shutil.rmtree(path, ignore_errors=True)
+
+    ray.get(
+        [
+            # every node has a `node:<ip>` resource, so the task runs on that node
+            _remove_dir.options(resources={f"node:{node['NodeManagerAddress']}": 0.001}).remote()
+            for node in ray.nodes()
+            if node["Alive"]
+        ]
+    )
+
+
 def checkpoint(progress_tracker, save_path):
     def ignore_dot_files(src, files):
         return [f for f in files if f.startswith(".")]
@@ -143,6 +164,8 @@ class RayTuneExecutor:
         max_concurrent_trials: Optional[int] = None,
         num_samples: int = 1,
         scheduler: Optional[Dict] = None,
+        share_preprocessed_datasets: bool = True,
+        preprocessed_datasets_dir: Optional[str] = None,
         **kwargs,
     ) -> None:
         if ray is None:
@@ -165,6 +188,11 @@ class RayTuneExecutor:
         self.kubernetes_namespace = kubernetes_namespace
         self.time_budget_s = time_budget_s
         self.max_concurrent_trials = max_concurrent_trials
+        # Trials with the same preprocessing config share the datasets preprocessed by the first of them, materialized
+        # in `preprocessed_datasets_dir` (by default a temporary directory, local to each node and removed from all the
+        # nodes after the run).
+        self.share_preprocessed_datasets = share_preprocessed_datasets
+        self.preprocessed_datasets_dir = preprocessed_datasets_dir
         self.sync_config = None
         self.sync_client = None
         # Head node is the node to which all checkpoints are synced if running on a K8s cluster.
@@ -586,6 +614,23 @@ class RayTuneExecutor:
 
             logger.debug(f"Trial horovod kwargs: {hvd_kwargs}")
 
+        shared_datasets: Optional[SharedPreprocessedDatasets] = hyperopt_dict.pop("shared_datasets", None)
+        if shared_datasets is not None:
+            training_set, validation_set, test_set, training_set_metadata = shared_datasets.get(
+                modified_config,
+                hyperopt_dict["backend"],
+                data_format=hyperopt_dict["data_format"],
+                random_seed=hyperopt_dict["random_seed"],
+                callbacks=hyperopt_dict["callbacks"],
+            )
+            hyperopt_dict.update(
+                dataset=None,
+                training_set=training_set,
+                validation_set=validation_set,
+                test_set=test_set,
+                training_set_metadata=training_set_metadata,
+            )
+
         stats = []
 
         def _run():
@@ -800,6 +845,24 @@ class RayTuneExecutor:
             self.sync_config = tune.SyncConfig(sync_to_driver=NamespacedKubernetesSyncer(self.kubernetes_namespace))
             self.sync_client = KubernetesSyncClient(self.kubernetes_namespace)
 
+        # Trials preprocess the dataset themselves when it has not been preprocessed beforehand, as their preprocessing
+        # configs may differ: group them by preprocessing config, so that each variant is materialized once.
+        cleanup_dir = None
+        if self.share_preprocessed_datasets and (
+            dataset is not None or (training_set is not None and not isinstance(training_set, Dataset))
+        ):
+            preprocessed_datasets_dir = self.preprocessed_datasets_dir
+            if preprocessed_datasets_dir is None:
+                preprocessed_datasets_dir = cleanup_dir = tempfile.mkdtemp(prefix="ludwig_hyperopt_")
+            # wrapped once, so that in-memory dataframes have the same checksum in all trials
+            hyperopt_dict["shared_datasets"] = SharedPreprocessedDatasets(
+                preprocessed_datasets_dir,
+                dataset=wrap(dataset),
+                training_set=wrap(training_set),
+                validation_set=wrap(validation_set),
+                test_set=wrap(test_set),
+            )
+
         run_experiment_trial_params = tune.with_parameters(run_experiment_trial, local_hyperopt_dict=hyperopt_dict)
 
         @ray.remote(num_cpus=0)
@@ -844,6 +907,11 @@ class RayTuneExecutor:
             # Explicitly raise a RuntimeError if an error is encountered during a Ray trial.
             # NOTE: Cascading the exception with "raise _ from e" still results in hanging.
             raise RuntimeError(f"Encountered Ray Tune error: {e}")
+        finally:
+            if cleanup_dir is not None:
+                shutil.rmtree(cleanup_dir, ignore_errors=True)
+                # trials on the other nodes materialized datasets in their own local copy of the directory
+                remove_dir_on_all_nodes(cleanup_dir)
 
         if "metric_score" in analysis.results_df.columns:
             ordered_trials = analysis.results_df.sort_values("metric_score", ascending=self.goal != MAXIMIZE)
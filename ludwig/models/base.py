@@ -16,7 +16,7 @@ from ludwig.schema.model_config import InputFeaturesContainer, OutputFeaturesCon
 from ludwig.utils.algorithms_utils import topological_sort_feature_dependencies
 from ludwig.utils.metric_utils import get_scalar_from_ludwig_metric
 from ludwig.utils.misc_utils import get_from_registry
-from ludwig.utils.torch_utils import DEVICE, LudwigModule, reg_loss
+from ludwig.utils.torch_utils import autocast, cast_to_float32, DEVICE, LudwigModule, reg_loss
 from ludwig.utils.types import TorchDevice
 
 logger = logging.getLogger(__name__)
@@ -167,23 +167,36 @@ class BaseModel(LudwigModule, metaclass=ABCMeta):
             A dictionary of output {feature name}::{tensor_name} -> output tensor.
         """
 
-    def predictions(self, inputs):
-        """Returns the model's predictions for the given inputs."""
-        outputs = self(inputs)
+    def predictions(self, inputs, autocast_dtype: Optional[torch.dtype] = None):
+        """Returns the model's predictions for the given inputs.
+
+        If `autocast_dtype` is set, the forward pass runs in mixed precision with that dtype, while the predictions are
+        computed from its outputs cast back to float32.
+        """
+        if autocast_dtype is None:
+            outputs = self(inputs)
+        else:
+            with autocast(next(iter(inputs.values())).device, autocast_dtype):
+                outputs = self(inputs)
+            outputs = cast_to_float32(outputs)
+        return self.outputs_to_predictions(outputs)
+
+    def outputs_to_predictions(self, outputs: Dict[str, torch.Tensor]) -> Dict[str, Dict[str, torch.Tensor]]:
+        """Returns the predictions of every output feature, computed from the outputs of a forward pass."""
         predictions = {}
         for of_name in self.output_features:
             predictions[of_name] = self.output_features[of_name].predictions(outputs, of_name)
         return predictions
 
-    def evaluation_step(self, inputs, targets):
+    def evaluation_step(self, inputs, targets, autocast_dtype: Optional[torch.dtype] = None):
         """Predict the inputs and update evaluation metrics."""
-        predictions = self.predictions(inputs)
+        predictions = self.predictions(inputs, autocast_dtype=autocast_dtype)
         self.update_metrics(targets, predictions)
         return predictions
 
-    def predict_step(self, inputs):
+    def predict_step(self, inputs, autocast_dtype: Optional[torch.dtype] = None):
         """Predict the inputs."""
-        return self.predictions(inputs)
+        return self.predictions(inputs, autocast_dtype=autocast_dtype)
 
     def train_loss(
         self,
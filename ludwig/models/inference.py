@@ -17,7 +17,7 @@ from ludwig.utils.data_utils import load_json, save_json
 from ludwig.utils.inference_utils import get_filename_from_stage, to_inference_module_input_from_dataframe
 from ludwig.utils.misc_utils import get_from_registry
 from ludwig.utils.output_feature_utils import get_feature_name_from_concat_name, get_tensor_name_from_concat_name
-from ludwig.utils.torch_utils import DEVICE
+from ludwig.utils.torch_utils import autocast, cast_to_float32, DEVICE, get_autocast_dtype
 from ludwig.utils.types import TorchDevice, TorchscriptPreprocessingInput
 
 # Prevents circular import errors from typing.
@@ -37,6 +37,7 @@ class InferenceModule(nn.Module):
         postprocessor: torch.jit.ScriptModule,
         config: Optional[Dict[str, Any]] = None,
         training_set_metadata: Optional[Dict[str, Any]] = None,
+        mixed_precision: Optional[str] = None,
     ):
         super().__init__()
         self.preprocessor = preprocessor
@@ -45,6 +46,8 @@ class InferenceModule(nn.Module):
         self.config = config
         # Do not remove – used by Predibase app
         self.training_set_metadata = training_set_metadata
+        # Only applied by `predict`, the scripted forward pass always runs in full precision
+        self.mixed_precision = mixed_precision
 
     def preprocessor_forward(self, inputs: Dict[str, TorchscriptPreprocessingInput]) -> Dict[str, torch.Tensor]:
         """Forward pass through the preprocessor."""
@@ -77,12 +80,24 @@ class InferenceModule(nn.Module):
 
     @torch.jit.unused
     def predict(
-        self, dataset: pd.DataFrame, return_type: Union[dict, pd.DataFrame] = pd.DataFrame
+        self,
+        dataset: pd.DataFrame,
+        return_type: Union[dict, pd.DataFrame] = pd.DataFrame,
+        mixed_precision: Optional[str] = None,
     ) -> Union[pd.DataFrame, dict]:
-        """Predict on a batch of data with an interface similar to LudwigModel.predict."""
+        """Predict on a batch of data with an interface similar to LudwigModel.predict.
+
+        `mixed_precision` ('bf16' or 'fp16') overrides the mixed precision the module was created with, if given.
+        """
         inputs = to_inference_module_input_from_dataframe(dataset, self.config, load_paths=True)
 
-        preds = self(inputs)
+        preproc_inputs = self.preprocessor_forward(inputs)
+        if mixed_precision is None:
+            mixed_precision = self.mixed_precision
+        autocast_dtype = get_autocast_dtype(mixed_precision, self.predictor.device)
+        with autocast(self.predictor.device, autocast_dtype):
+            predictions_flattened = self.predictor_forward(preproc_inputs)
+        preds = self.postprocessor_forward(cast_to_float32(predictions_flattened))
 
         if return_type == pd.DataFrame:
             preds = convert_dict_to_df(preds)
@@ -96,6 +111,7 @@ class InferenceModule(nn.Module):
         config: Dict[str, Any],
         training_set_metadata: Dict[str, Any],
         device: Optional[TorchDevice] = None,
+        mixed_precision: Optional[str] = None,
     ):
         """Create an InferenceModule from a trained LudwigModel."""
         if device is None:
@@ -112,6 +128,7 @@ class InferenceModule(nn.Module):
             stage_to_module[POSTPROCESSOR],
             config=config,
             training_set_metadata=training_set_metadata,
+            mixed_precision=mixed_precision,
         )
 
     @torch.jit.unused
@@ -120,6 +137,7 @@ class InferenceModule(nn.Module):
         cls: "InferenceModule",
         directory: str,
         device: Optional[TorchDevice] = None,
+        mixed_precision: Optional[str] = None,
     ):
         """Create an InferenceModule from a directory containing a model, config, and training set metadata."""
         if device is None:
@@ -140,6 +158,7 @@ class InferenceModule(nn.Module):
             stage_to_module[POSTPROCESSOR],
             config=config,
             training_set_metadata=training_set_metadata,
+            mixed_precision=mixed_precision,
         )
 
 
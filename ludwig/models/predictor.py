@@ -4,7 +4,7 @@ import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict, OrderedDict
 from pprint import pformat
-from typing import Dict
+from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
@@ -22,7 +22,7 @@ from ludwig.utils.dataframe_utils import from_numpy_dataset
 from ludwig.utils.horovod_utils import return_first
 from ludwig.utils.print_utils import repr_ordered_dict
 from ludwig.utils.strings_utils import make_safe_filename
-from ludwig.utils.torch_utils import get_torch_device
+from ludwig.utils.torch_utils import autocast, cast_to_float32, get_autocast_dtype, get_torch_device
 
 EXCLUDE_PRED_SET = {LOGITS, LAST_HIDDEN}
 SKIP_EVAL_METRICS = {"confusion_matrix", "roc_curve"}
@@ -63,13 +63,23 @@ class BasePredictor(ABC):
 class Predictor(BasePredictor):
     """Predictor is a class that uses a model to predict and evaluate."""
 
-    def __init__(self, model: BaseModel, batch_size=128, horovod=None, report_tqdm_to_ray=False, **kwargs):
+    def __init__(
+        self,
+        model: BaseModel,
+        batch_size=128,
+        horovod=None,
+        report_tqdm_to_ray=False,
+        mixed_precision: Optional[str] = None,
+        **kwargs,
+    ):
         self._batch_size = batch_size
         self._horovod = horovod
         self.report_tqdm_to_ray = report_tqdm_to_ray
 
         self.device = get_torch_device()
         self.model = model.to(self.device)
+        # forward passes run in mixed precision ('bf16' or 'fp16') if set, metrics are always computed in fp32
+        self.autocast_dtype = get_autocast_dtype(mixed_precision, self.device)
 
     def batch_predict(self, dataset: Dataset, dataset_name: str = None, collect_logits: bool = False):
         prev_model_training_mode = self.model.training  # store previous model training mode
@@ -134,7 +144,7 @@ class Predictor(BasePredictor):
             for i_feat in model.input_features.values()
         }
 
-        return model.predict_step(inputs)
+        return model.predict_step(inputs, autocast_dtype=self.autocast_dtype)
 
     def _accumulate_preds(self, preds, predictions, exclude_pred_set=EXCLUDE_PRED_SET):
         # accumulate predictions from batch for each output feature
@@ -197,7 +207,7 @@ class Predictor(BasePredictor):
                         for o_feat in self.model.output_features.values()
                     }
 
-                    preds = self.model.evaluation_step(inputs, targets)
+                    preds = self.model.evaluation_step(inputs, targets, autocast_dtype=self.autocast_dtype)
 
                     # accumulate predictions from batch for each output feature
                     if collect_predictions:
@@ -253,7 +263,9 @@ class Predictor(BasePredictor):
                         )
                         for i_feat in self.model.input_features.values()
                     }
-                    outputs = self.model(inputs)
+                    with autocast(self.device, self.autocast_dtype):
+                        outputs = self.model(inputs)
+                    outputs = cast_to_float32(outputs)
                     collected_tensors = [(concat_name, tensor) for concat_name, tensor in outputs.items()]
                     progress_bar.update(1)
 
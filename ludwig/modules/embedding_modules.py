@@ -166,6 +166,22 @@ class Embed(LudwigModule):
         return torch.Size([self.embedding_size])
 
 
+def multi_hot_to_bags(inputs: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Converts a [batch x vocab_size] tensor into the sparse input of an embedding bag.
+
+    Returns the vocab indices of the nonzero entries of all the rows, concatenated, the offset of the indices of each
+    row, and the values of the nonzero entries.
+
+    Only the encoders are sparse: preprocessed datasets and batches of set and bag features are still dense
+    [num_rows x vocab_size] tensors, converted batch by batch here.
+    """
+    nonzero = torch.nonzero(inputs)
+    rows, indices = nonzero[:, 0], nonzero[:, 1]
+    counts = torch.count_nonzero(inputs, dim=1)
+    offsets = torch.cumsum(counts, dim=0) - counts
+    return indices, offsets, inputs[rows, indices]
+
+
 class EmbedSet(LudwigModule):
     """Module to embed Set data types, works on multi-hot encoded input."""
 
@@ -203,13 +219,14 @@ class EmbedSet(LudwigModule):
             self.dropout = None
 
         if aggregation_function == "sum":
-            self.aggregation_function = torch.sum
+            self.aggregation_mode = "sum"
         elif aggregation_function == "avg":
-            self.aggregation_function = torch.mean
+            self.aggregation_mode = "mean"
         else:
             raise ValueError(f"Unsupported aggregation function {aggregation_function}")
 
-        self.register_buffer("vocab_indices", torch.arange(self.vocab_size))
+        # Set when loading the weights of a model saved before sets were embedded with embedding bags.
+        self.legacy_aggregation = False
 
     def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
         """
@@ -217,14 +234,16 @@ class EmbedSet(LudwigModule):
             inputs: Boolean multi-hot tensor of size [batch x vocab_size], where
                     inputs[b, i] indicates that token i is present in sample b.
         """
-        # Convert multi-hot input to input of indices
-        inputs = inputs.int() * self.vocab_indices
-        embedded = self.embeddings(inputs.long())
-        # Mask out the 0th embedding
-        mask = torch.unsqueeze(inputs, -1)
-        embedded = embedded * mask
-        # Sum over all positive tokens
-        embedded = self.aggregation_function(embedded, dim=1)
+        if self.legacy_aggregation:
+            embedded = self._legacy_embed(inputs)
+        else:
+            # Only embed the tokens present in each sample, instead of the whole vocab.
+            indices, offsets, _ = multi_hot_to_bags(inputs.reshape(-1, inputs.shape[-1]))
+            # The 0th embedding is masked out
+            embedded = torch.nn.functional.embedding_bag(
+                indices, self.embeddings.weight, offsets, mode=self.aggregation_mode, padding_idx=0
+            )
+            embedded = embedded.reshape(inputs.shape[:-1] + (self.embedding_size,))
         if self.dropout:
             embedded = self.dropout(embedded)
         return embedded
@@ -241,6 +260,31 @@ class EmbedSet(LudwigModule):
     def input_dtype(self):
         return torch.bool
 
+    def _legacy_embed(self, inputs: torch.Tensor) -> torch.Tensor:
+        # Embeds the whole vocab, scaling the embedding of token i by i, then sums or averages over the vocab.
+        indices = inputs.int() * torch.arange(self.vocab_size, dtype=torch.int32, device=inputs.device)
+        embedded = self.embeddings(indices.long()) * torch.unsqueeze(indices, -1)
+        if self.aggregation_mode == "mean":
+            return torch.mean(embedded, dim=1)
+        return torch.sum(embedded, dim=1)
+
+    def _load_from_state_dict(
+        self, state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+    ):
+        # The weights of models saved before sets were embedded with embedding bags have a `vocab_indices` buffer.
+        # These models keep aggregating the embeddings as they were trained to, so that their predictions don't change.
+        if state_dict.pop(prefix + "vocab_indices", None) is not None:
+            self.legacy_aggregation = True
+        super()._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+        )
+
+    def _save_to_state_dict(self, destination, prefix, keep_vars):
+        super()._save_to_state_dict(destination, prefix, keep_vars)
+        if self.legacy_aggregation:
+            # Saved again for the legacy aggregation to be used when the weights are loaded.
+            destination[prefix + "vocab_indices"] = torch.arange(self.vocab_size)
+
 
 class EmbedWeighted(LudwigModule):
     """Module to embed Bag data type, works on input of token frequencies."""
@@ -276,23 +320,22 @@ class EmbedWeighted(LudwigModule):
         else:
             self.dropout = None
 
-        self.register_buffer("vocab_indices", torch.arange(self.vocab_size, dtype=torch.int32))
-
     def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
         """
         Params:
             inputs: Tensor of frequencies, where inputs[b, i] represents
                     frequency of token i in sample b of batch.
         """
-        # Convert to multi-hot input
-        signed_input = (inputs != 0).type(torch.int32)
-        multiple_hot_indexes = signed_input * self.vocab_indices
-        embedded = self.embeddings(multiple_hot_indexes)
-        # Mask out the 0th embedding
-        mask = torch.unsqueeze(inputs, -1)
-        weighted_embedded = embedded * mask
-        # Sum over the all the positive indices
-        embedded_reduced = torch.sum(weighted_embedded, dim=1)
+        # Sum the embeddings of the tokens present in each sample, weighted by their frequencies.
+        indices, offsets, frequencies = multi_hot_to_bags(inputs.reshape(-1, inputs.shape[-1]))
+        embedded_reduced = torch.nn.functional.embedding_bag(
+            indices,
+            self.embeddings.weight,
+            offsets,
+            mode="sum",
+            per_sample_weights=frequencies.to(self.embeddings.weight.dtype),
+        )
+        embedded_reduced = embedded_reduced.reshape(inputs.shape[:-1] + (self.embedding_size,))
         if self.dropout:
             embedded_reduced = self.dropout(embedded_reduced)
         return embedded_reduced
@@ -305,6 +348,15 @@ class EmbedWeighted(LudwigModule):
     def output_shape(self) -> torch.Size:
         return torch.Size([self.embedding_size])
 
+    def _load_from_state_dict(
+        self, state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+    ):
+        # The `vocab_indices` buffer of models saved before bags were embedded with embedding bags is no longer used.
+        state_dict.pop(prefix + "vocab_indices", None)
+        super()._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+        )
+
 
 # TODO(shreya): Implement sparse embedding lookup.
 # class EmbedSparse(LudwigModule):
@@ -33,6 +33,7 @@ def create_optimizer(
     model,
     optimizer_config: BaseOptimizerConfig = SGDOptimizerConfig(),
     horovod=None,
+    backward_passes_per_step: int = 1,
 ):
     """Returns a ready-to-use torch optimizer instance based on the given optimizer config.
 
@@ -40,6 +41,8 @@ def create_optimizer(
     :param optimizer_config: Instance of `ludwig.modules.optimization_modules.BaseOptimizerConfig` (default:
            `ludwig.modules.optimization_modules.SGDOptimizerConfig()`).
     :param horovod: Horovod parameters (default: None).
+    :param backward_passes_per_step: Number of backward passes accumulated before each step of the optimizer, Horovod
+           only aggregates the gradients once per step (default: 1).
     :return: Initialized instance of a torch optimizer.
     """
     # Get the corresponding torch optimizer class for the given config:
@@ -54,5 +57,6 @@ def create_optimizer(
         torch_optimizer = horovod.DistributedOptimizer(
             torch_optimizer,
             named_parameters=model.named_parameters(),
+            backward_passes_per_step=backward_passes_per_step,
         )
     return torch_optimizer
@@ -15,6 +15,7 @@
 # ==============================================================================
 import argparse
 import logging
+import os
 import sys
 from typing import List, Optional, Union
 
@@ -25,7 +26,8 @@ from ludwig.backend import ALL_BACKENDS, Backend, initialize_backend
 from ludwig.callbacks import Callback
 from ludwig.constants import FULL, TEST, TRAINING, VALIDATION
 from ludwig.contrib import add_contrib_callback_args
-from ludwig.globals import LUDWIG_VERSION
+from ludwig.globals import LUDWIG_VERSION, PREDICTIONS_PARQUET_FILE_NAME
+from ludwig.utils.fs_utils import makedirs
 from ludwig.utils.print_utils import logging_level_registry, print_ludwig
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,7 @@ def predict_cli(
     data_format: str = None,
     split: str = FULL,
     batch_size: int = 128,
+    chunk_size: Optional[int] = None,
     skip_save_unprocessed_output: bool = False,
     skip_save_predictions: bool = False,
     output_directory: str = "results",
@@ -66,6 +69,10 @@ def predict_cli(
         to perform predictions. Valid values are `'training'`, `'validation'`,
         `'test'` and `'full'`.
     :param batch_size: (int, default `128`) size of batches for processing.
+    :param chunk_size: (int, default `None`) if set, the dataset is read,
+        predicted and written to `predictions.parquet` in the output directory
+        in chunks of this many rows, for datasets that do not fit in memory.
+        Only supported for the `'full'` split on the local backend.
     :param skip_save_unprocessed_output: (bool, default: `False`) by default
         predictions and their probabilities are saved in both raw
         unprocessed numpy files containing tensors and as postprocessed
@@ -103,6 +110,19 @@ def predict_cli(
         allow_parallel_threads=allow_parallel_threads,
         callbacks=callbacks,
     )
+    if chunk_size is not None:
+        if split != FULL:
+            raise ValueError(f"Predicting in chunks is only supported for the '{FULL}' split, found: {split}")
+        makedirs(output_directory, exist_ok=True)
+        model.predict_streaming(
+            dataset=dataset,
+            output_path=os.path.join(output_directory, PREDICTIONS_PARQUET_FILE_NAME),
+            data_format=data_format,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+        )
+        return
+
     model.predict(
         dataset=dataset,
         data_format=data_format,
@@ -183,6 +203,13 @@ def cli(sys_argv):
     # Generic parameters
     # ------------------
     parser.add_argument("-bs", "--batch_size", type=int, default=128, help="size of batches")
+    parser.add_argument(
+        "-chs",
+        "--chunk_size",
+        type=int,
+        default=None,
+        help="read, predict and write the dataset in chunks of this many rows, for datasets larger than memory",
+    )
 
     # ------------------
     # Runtime parameters
@@ -57,6 +57,13 @@ class SequenceGeneratorDecoderConfig(BaseDecoderConfig):
         parameter_metadata=DECODER_METADATA["SequenceGeneratorDecoder"]["num_layers"],
     )
 
+    early_exit: bool = schema_utils.Boolean(
+        default=False,
+        description="Whether to stop decoding predictions once every sequence of the batch has produced the stop "
+        "symbol, the steps after the stop symbol then predict the padding symbol with a probability of 1.",
+        parameter_metadata=DECODER_METADATA["SequenceGeneratorDecoder"]["early_exit"],
+    )
+
 
 @register_decoder_config("tagger", [SEQUENCE, TEXT])
 @dataclass(repr=False)
@@ -386,6 +386,24 @@ DECODER_METADATA = {
             literature_references=None,
             internal_only=False,
         ),
+        "early_exit": ParameterMetadata(
+            ui_display_name="Early Exit",
+            default_value_reasoning="Off by default, so that predictions cover all the steps up to the maximum "
+            "sequence length.",
+            example_value=[True],
+            related_parameters=["max_sequence_length"],
+            other_information="Only affects predictions, training always decodes the whole target sequences.",
+            description_implications="When every sequence of a batch has produced the stop symbol, decoding stops, "
+            "and sequences that produced it are no longer decoded. The steps after the stop symbol "
+            "predict the padding symbol with a probability of 1, so they do not change the sequence probability.",
+            suggested_values=True,
+            suggested_values_reasoning="Speeds up predictions when sequences are much shorter than the maximum "
+            "sequence length, e.g. for short generation.",
+            commonly_used=False,
+            expected_impact=ExpectedImpact.LOW,
+            literature_references=None,
+            internal_only=False,
+        ),
         "input_size": ParameterMetadata(
             ui_display_name="Not Displayed",
             default_value_reasoning=None,
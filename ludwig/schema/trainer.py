@@ -304,6 +304,55 @@ class ECDTrainerConfig(BaseTrainerConfig):
         parameter_metadata=TRAINER_METADATA["bucketing_field"],
     )
 
+    prefetch_batches: int = schema_utils.NonNegativeInteger(
+        default=0,
+        description="Number of training batches to assemble ahead of time on a background thread, overlapping data "
+        "loading with the training step. If 0, batches are assembled on the training thread when needed.",
+    )
+
+    mixed_precision: Optional[str] = schema_utils.StringOptions(
+        ["bf16", "fp16"],
+        default=None,
+        allow_none=True,
+        description="Runs the forward passes of training and evaluation in mixed precision, autocasting eligible ops "
+        "to bfloat16 ('bf16') or float16 ('fp16') while losses and metrics are computed in float32. 'fp16' requires a "
+        "GPU and uses loss scaling, 'bf16' is also supported on CPUs. If not set, everything runs in float32. Not "
+        "applied with the L-BFGS optimizer.",
+    )
+
+    async_checkpointing: bool = schema_utils.Boolean(
+        default=False,
+        description="Whether to write training checkpoints on a background thread. The training step only waits for "
+        "a CPU copy of the model and optimizer state to be taken, instead of for the state to be written to disk.",
+    )
+
+    gradient_accumulation_steps: int = schema_utils.PositiveInteger(
+        default=1,
+        allow_none=False,
+        description="Number of batches to accumulate gradients over before updating the model weights, for an "
+        "effective batch size of `batch_size * gradient_accumulation_steps` with the memory footprint of `batch_size`. "
+        "Training steps, `train_steps`, `steps_per_checkpoint` and `decay_steps` count weight updates rather than "
+        "batches. Not supported by the L-BFGS optimizer.",
+    )
+
+    evaluate_training_set_mode: str = schema_utils.StringOptions(
+        ["full", "running", "sample"],
+        default="full",
+        allow_none=False,
+        description="How the training set is evaluated when `evaluate_training_set` is enabled. 'full' scores the "
+        "entire training set again at every checkpoint. 'running' reports metrics accumulated from the forward passes "
+        "of the training batches since the previous checkpoint, at no extra cost, computed with dropout active and "
+        "with weights changing from batch to batch. 'sample' scores a fixed random sample of "
+        "`evaluate_training_set_sample_size` rows of the training set at every checkpoint.",
+    )
+
+    evaluate_training_set_sample_size: int = schema_utils.PositiveInteger(
+        default=10000,
+        allow_none=False,
+        description="Number of rows of the training set scored at every checkpoint when `evaluate_training_set_mode` "
+        "is 'sample'.",
+    )
+
 
 @register_trainer_schema(MODEL_GBM)
 @dataclass(repr=False, order=True)
@@ -14,23 +14,30 @@
 # limitations under the License.
 # ==============================================================================
 import argparse
+import asyncio
+import functools
 import io
 import json
 import logging
 import os
 import sys
 import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import pandas as pd
 import torch
 from torchvision.io import decode_image
 
 from ludwig.api import LudwigModel
-from ludwig.constants import AUDIO, COLUMN
+from ludwig.constants import AUDIO, COLUMN, NAME, PREDICTOR, TYPE
 from ludwig.contrib import add_contrib_callback_args
 from ludwig.globals import LUDWIG_VERSION
+from ludwig.models.inference import InferenceModule
+from ludwig.utils.inference_utils import get_filename_from_stage
 from ludwig.utils.print_utils import logging_level_registry, print_ludwig
-from ludwig.utils.server_utils import NumpyJSONResponse
+from ludwig.utils.server_utils import NumpyJSONResponse, RequestBatcher
+from ludwig.utils.torch_utils import DEVICE
 
 logger = logging.getLogger(__name__)
 
@@ -55,13 +62,84 @@ ALL_FEATURES_PRESENT_ERROR = {"error": "entry must contain all input features"}
 
 COULD_NOT_RUN_INFERENCE_ERROR = {"error": "Unexpected Error: could not run inference on model"}
 
+SERVER_OVERLOADED_ERROR = {"error": "Too many pending requests, try again later"}
 
-def server(model, allowed_origins=None):
+
+def _get_predict_fns(
+    model: Union[LudwigModel, InferenceModule]
+) -> Tuple[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]], Callable[[pd.DataFrame], pd.DataFrame]]:
+    """Returns functions predicting a list of rows and a DataFrame of rows with `model`.
+
+    The functions run on worker threads, calls are serialized by a lock as `model` is not safe to use from several
+    threads at once.
+    """
+    if isinstance(model, InferenceModule):
+
+        def predict_df(data_df):
+            resp, _ = model.predict(data_df)
+            return resp
+
+        def predict_records(entries):
+            return predict_df(pd.DataFrame(entries)).to_dict("records")
+
+    else:
+
+        def predict_df(data_df):
+            resp, _ = model.predict(dataset=data_df)
+            return resp
+
+        def predict_records(entries):
+            resp, _ = model.predict(dataset=entries, data_format=dict)
+            return resp.to_dict("records")
+
+    predict_lock = threading.Lock()
+
+    def locked(predict_fn):
+        @functools.wraps(predict_fn)
+        def locked_predict_fn(data):
+            with predict_lock:
+                return predict_fn(data)
+
+        return locked_predict_fn
+
+    return locked(predict_records), locked(predict_df)
+
+
+def server(model, allowed_origins=None, max_batch_size=0, max_batch_wait_ms=5.0, max_queue_size=1024):
+    """Creates the app serving `model`, either a `LudwigModel` or an `InferenceModule`.
+
+    An `InferenceModule` answers requests with its torchscript preprocessor, predictor and postprocessor directly,
+    skipping the dataset building and batching of `LudwigModel.predict`, but only returns the outputs of the torchscript
+    postprocessors (e.g. no per-class probability columns).
+
+    If `max_batch_size` is greater than 0, concurrent `/predict` requests are coalesced into batches of up to
+    `max_batch_size` rows, waiting at most `max_batch_wait_ms` for a batch to fill, and batching metrics are exposed at
+    `/metrics`.
+    """
     middleware = [Middleware(CORSMiddleware, allow_origins=allowed_origins)] if allowed_origins else None
     app = FastAPI(middleware=middleware)
 
     config = model.config
     input_features = {f[COLUMN] for f in config["input_features"]}
+    input_feature_types = {f[NAME]: f[TYPE] for f in config["input_features"]}
+    predict_records, predict_df = _get_predict_fns(model)
+
+    request_batcher = None
+    if max_batch_size > 0:
+        request_batcher = RequestBatcher(
+            predict_records,
+            max_batch_size=max_batch_size,
+            max_batch_wait_ms=max_batch_wait_ms,
+            max_queue_size=max_queue_size,
+        )
+
+        @app.get("/metrics")
+        def metrics():
+            return NumpyJSONResponse(request_batcher.get_metrics())
+
+        @app.on_event("shutdown")
+        async def close_request_batcher():
+            await request_batcher.close()
 
     @app.get("/")
     def check_health():
@@ -71,7 +149,7 @@ def server(model, allowed_origins=None):
     async def predict(request: Request):
         try:
             form = await request.form()
-            entry, files = convert_input(form, model.model.input_features)
+            entry, files = convert_input(form, input_feature_types)
         except Exception:
             logger.exception("Failed to parse predict form")
             return NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
@@ -80,9 +158,13 @@ def server(model, allowed_origins=None):
             if (entry.keys() & input_features) != input_features:
                 return NumpyJSONResponse(ALL_FEATURES_PRESENT_ERROR, status_code=400)
             try:
-                resp, _ = model.predict(dataset=[entry], data_format=dict)
-                resp = resp.to_dict("records")[0]
+                if request_batcher is not None:
+                    resp = await request_batcher.predict(entry)
+                else:
+                    resp = (await asyncio.get_running_loop().run_in_executor(None, predict_records, [entry]))[0]
                 return NumpyJSONResponse(resp)
+            except asyncio.QueueFull:
+                return NumpyJSONResponse(SERVER_OVERLOADED_ERROR, status_code=503)
             except Exception as exc:
                 logger.exception(f"Failed to run predict: {exc}")
                 return NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
@@ -94,7 +176,7 @@ def server(model, allowed_origins=None):
     async def batch_predict(request: Request):
         try:
             form = await request.form()
-            data, files = convert_batch_input(form, model.model.input_features)
+            data, files = convert_batch_input(form, input_feature_types)
             data_df = pd.DataFrame.from_records(data["data"], index=data.get("index"), columns=data["columns"])
         except Exception:
             logger.exception("Failed to parse batch_predict form")
@@ -103,8 +185,8 @@ def server(model, allowed_origins=None):
         if (set(data_df.columns) & input_features) != input_features:
             return NumpyJSONResponse(ALL_FEATURES_PRESENT_ERROR, status_code=400)
         try:
-            resp, _ = model.predict(dataset=data_df)
-            resp = resp.to_dict("split")
+            # on a worker thread, so that the event loop keeps serving requests meanwhile
+            resp = (await asyncio.get_running_loop().run_in_executor(None, predict_df, data_df)).to_dict("split")
             return NumpyJSONResponse(resp)
         except Exception:
             logger.exception("Failed to run batch_predict: {}")
@@ -131,14 +213,14 @@ def _read_image_buffer(v):
     return image  # channels, height, width
 
 
-def convert_input(form, input_features):
+def convert_input(form, input_feature_types):
     """Returns a new input and a list of files to be cleaned up."""
     new_input = {}
     files = []
     for k, v in form.multi_items():
         if type(v) == UploadFile:
             # check if audio or image file
-            if input_features[k].type() == AUDIO:
+            if input_feature_types[k] == AUDIO:
                 new_input[k] = _write_file(v, files)
             else:
                 new_input[k] = _read_image_buffer(v)
@@ -148,7 +230,7 @@ def convert_input(form, input_features):
     return new_input, files
 
 
-def convert_batch_input(form, input_features):
+def convert_batch_input(form, input_feature_types):
     """Returns a new input and a list of files to be cleaned up."""
     file_index = {}
     files = []
@@ -161,7 +243,7 @@ def convert_batch_input(form, input_features):
         for i in range(len(row)):
             if row[i] in file_index:
                 feature_name = data["columns"][i]
-                if input_features[feature_name].type() == AUDIO:
+                if input_feature_types[feature_name] == AUDIO:
                     row[i] = _write_file(file_index[row[i]], files)
                 else:
                     row[i] = _read_image_buffer(file_index[row[i]])
@@ -169,11 +251,24 @@ def convert_batch_input(form, input_features):
     return data, files
 
 
+def load_inference_module(model_path: str) -> InferenceModule:
+    """Loads the `InferenceModule` saved in `model_path`, or creates it from the Ludwig model saved there."""
+    if os.path.exists(os.path.join(model_path, get_filename_from_stage(PREDICTOR, DEVICE))):
+        return InferenceModule.from_directory(model_path, device=DEVICE)
+
+    model = LudwigModel.load(model_path, backend="local")
+    return InferenceModule.from_ludwig_model(model.model, model.config, model.training_set_metadata, device=DEVICE)
+
+
 def run_server(
     model_path: str,
     host: str,
     port: int,
     allowed_origins: list,
+    max_batch_size: int = 0,
+    max_batch_wait_ms: float = 5.0,
+    max_queue_size: int = 1024,
+    use_inference_module: bool = False,
 ) -> None:
     """Loads a pre-trained model and serve it on an http server.
 
@@ -183,14 +278,24 @@ def run_server(
     :param host: (str, default: `0.0.0.0`) host ip address for the server to use.
     :param port: (int, default: `8000`) port number for the server to use.
     :param allowed_origins: (list) list of origins allowed to make cross-origin requests.
+    :param max_batch_size: (int, default: `0`) if greater than 0, concurrent `/predict` requests are batched together
+        up to this many rows.
+    :param max_batch_wait_ms: (float, default: `5.0`) maximum time to wait for a batch of requests to fill.
+    :param max_queue_size: (int, default: `1024`) maximum number of requests waiting to be batched.
+    :param use_inference_module: (bool, default: `False`) serve the torchscript `InferenceModule` of the model instead
+        of going through `LudwigModel.predict`. Modules saved by `save_torchscript` in `model_path` are loaded if
+        present, otherwise they are created from the model.
 
     # Return
 
     :return: (`None`)
     """
-    # Use local backend for serving to use pandas DataFrames.
-    model = LudwigModel.load(model_path, backend="local")
-    app = server(model, allowed_origins)
+    if use_inference_module:
+        model = load_inference_module(model_path)
+    else:
+        # Use local backend for serving to use pandas DataFrames.
+        model = LudwigModel.load(model_path, backend="local")
+    app = server(model, allowed_origins, max_batch_size, max_batch_wait_ms, max_queue_size)
     uvicorn.run(app, host=host, port=port)
 
 
@@ -233,6 +338,39 @@ def cli(sys_argv):
         'Use "*" to allow any origin. See https://www.starlette.io/middleware/#corsmiddleware.',
     )
 
+    parser.add_argument(
+        "-mbs",
+        "--max_batch_size",
+        help="if greater than 0, concurrent /predict requests are coalesced into batches of up to this many rows "
+        "(default: 0)",
+        default=0,
+        type=int,
+    )
+
+    parser.add_argument(
+        "-mbw",
+        "--max_batch_wait_ms",
+        help="maximum time in milliseconds to wait for a batch of /predict requests to fill (default: 5)",
+        default=5.0,
+        type=float,
+    )
+
+    parser.add_argument(
+        "-mqs",
+        "--max_queue_size",
+        help="maximum number of /predict requests waiting to be batched, further requests are rejected with a 503 "
+        "(default: 1024)",
+        default=1024,
+        type=int,
+    )
+
+    parser.add_argument(
+        "-im",
+        "--use_inference_module",
+        action="store_true",
+        help="serve requests with the torchscript inference module of the model instead of LudwigModel.predict",
+    )
+
     add_contrib_callback_args(parser)
     args = parser.parse_args(sys_argv)
 
@@ -247,7 +385,16 @@ def cli(sys_argv):
 
     print_ludwig("Serve", LUDWIG_VERSION)
 
-    run_server(args.model_path, args.host, args.port, args.allowed_origins)
+    run_server(
+        args.model_path,
+        args.host,
+        args.port,
+        args.allowed_origins,
+        args.max_batch_size,
+        args.max_batch_wait_ms,
+        args.max_queue_size,
+        args.use_inference_module,
+    )
 
 
 if __name__ == "__main__":
@@ -14,6 +14,7 @@
 # limitations under the License.
 # ==============================================================================
 """This module contains the class and auxiliary methods of a model."""
+import copy
 import gc
 import logging
 import math
@@ -33,6 +34,7 @@ from tabulate import tabulate
 from torch.utils.tensorboard import SummaryWriter
 
 from ludwig.constants import COMBINED, DEFAULT_BATCH_SIZE, LOSS, MODEL_ECD, TEST, TRAINING, VALIDATION
+from ludwig.data.batcher.prefetching import prefetch
 from ludwig.data.dataset.base import Dataset
 from ludwig.globals import (
     is_progressbar_disabled,
@@ -55,7 +57,7 @@ from ludwig.utils.horovod_utils import return_first
 from ludwig.utils.math_utils import exponential_decay, learning_rate_warmup, learning_rate_warmup_distributed
 from ludwig.utils.metric_utils import get_metric_names, TrainerMetric
 from ludwig.utils.misc_utils import set_random_seed
-from ludwig.utils.torch_utils import get_torch_device
+from ludwig.utils.torch_utils import autocast, cast_to_float32, get_autocast_dtype, get_torch_device
 from ludwig.utils.trainer_utils import (
     append_metrics,
     get_final_steps_per_checkpoint,
@@ -146,12 +148,18 @@ class Trainer(BaseTrainer):
         self.max_batch_size = config.max_batch_size
         self.eval_batch_size = config.batch_size if config.eval_batch_size is None else config.eval_batch_size
         self.should_shuffle = config.should_shuffle
+        self.prefetch_batches = config.prefetch_batches
+        self.async_checkpointing = config.async_checkpointing
+        self.checkpoint_manager = None
         self._validation_field = config.validation_field
         self._validation_metric = config.validation_metric
         self.early_stop = config.early_stop
         self.steps_per_checkpoint = config.steps_per_checkpoint
         self.checkpoints_per_epoch = config.checkpoints_per_epoch
         self.evaluate_training_set = config.evaluate_training_set
+        self.evaluate_training_set_mode = config.evaluate_training_set_mode
+        self.evaluate_training_set_sample_size = config.evaluate_training_set_sample_size
+        self._training_set_sample = None
         self.reduce_learning_rate_on_plateau = config.reduce_learning_rate_on_plateau
         self.reduce_learning_rate_on_plateau_patience = config.reduce_learning_rate_on_plateau_patience
         self.reduce_learning_rate_on_plateau_rate = config.reduce_learning_rate_on_plateau_rate
@@ -163,6 +171,7 @@ class Trainer(BaseTrainer):
         self.increase_batch_size_eval_metric = config.increase_batch_size_eval_metric
         self.increase_batch_size_eval_split = config.increase_batch_size_eval_split
         self.learning_rate_warmup_epochs = config.learning_rate_warmup_epochs
+        self.gradient_accumulation_steps = config.gradient_accumulation_steps
         self.resume = resume
         self.skip_save_model = skip_save_model
         self.skip_save_progress = skip_save_progress
@@ -179,12 +188,22 @@ class Trainer(BaseTrainer):
         self.model = model
         self.model = self.model.to(self.device)
 
+        self.mixed_precision = config.mixed_precision
+        self.autocast_dtype = get_autocast_dtype(config.mixed_precision, self.device)
+        # fp16 gradients underflow without loss scaling, bf16 has the same exponent range as fp32
+        self.grad_scaler = torch.cuda.amp.GradScaler(enabled=self.autocast_dtype == torch.float16)
+
         # ================ Optimizer tuning ================
         optimizer_config = config.optimizer
         # Most optimizers require 'lr' parameter.  set_optimizer_learning_rate will update this during training:
         optimizer_config.lr = base_learning_rate
         self.gradient_clipping_config = create_clipper(config.gradient_clipping)
-        self.optimizer = create_optimizer(model, horovod=horovod, optimizer_config=optimizer_config)
+        self.optimizer = create_optimizer(
+            model,
+            horovod=horovod,
+            optimizer_config=optimizer_config,
+            backward_passes_per_step=self.gradient_accumulation_steps,
+        )
         self.lr_scale_fn = learning_rate_scale_fns[config.learning_rate_scaling]
 
         # when training starts the sigint handler will be replaced with
@@ -200,15 +219,23 @@ class Trainer(BaseTrainer):
                 "trainer.steps_per_checkpoint. Please specify one or the other, or specify neither to checkpoint/eval "
                 "the model every epoch."
             )
+        if self.gradient_accumulation_steps > 1 and isinstance(self.optimizer, torch.optim.LBFGS):
+            raise ValueError("trainer.gradient_accumulation_steps is not supported by the L-BFGS optimizer.")
 
     def train_step(
-        self, inputs: Dict[str, torch.Tensor], targets: Dict[str, torch.Tensor]
+        self,
+        inputs: Dict[str, torch.Tensor],
+        targets: Dict[str, torch.Tensor],
+        should_step: bool = True,
+        accumulation_steps: int = 1,
     ) -> Tuple[torch.Tensor, Dict[str, torch.Tensor]]:
         """Performs a single training step.
 
         Params:
             inputs: A dictionary of input data, from feature name to tensor.
             targets: A dictionary of target data, from feature name to tensor.
+            should_step: Whether to update the weights after this batch, or only accumulate its gradients.
+            accumulation_steps: Number of batches whose gradients are accumulated into the next weight update.
 
         Returns:
             A tuple of the loss tensor and a dictionary of loss for every output feature.
@@ -233,38 +260,57 @@ class Trainer(BaseTrainer):
             loss, all_losses = self.model.train_loss(
                 targets, model_outputs, self.regularization_type, self.regularization_lambda
             )
+            self._update_running_train_metrics(targets, model_outputs)
 
             return loss, all_losses
 
-        self.optimizer.zero_grad()
-
         # Obtain model predictions and loss
-        model_outputs = self.model((inputs, targets))
+        with autocast(self.device, self.autocast_dtype):
+            model_outputs = self.model((inputs, targets))
+        if self.autocast_dtype is not None:
+            # losses are computed in full precision
+            model_outputs = cast_to_float32(model_outputs)
         loss, all_losses = self.model.train_loss(
             targets, model_outputs, self.regularization_type, self.regularization_lambda
         )
+        self._update_running_train_metrics(targets, model_outputs)
 
-        # Begin the backward pass
+        # Begin the backward pass, the gradients of the accumulated batches are averaged
         variables = self.model.parameters()
-        loss.backward()
+        self.grad_scaler.scale(loss / accumulation_steps).backward()
+
+        if not should_step:
+            return loss, all_losses
 
         if self.horovod:
             # Wait for gradient aggregation to complete before clipping the gradients
             self.optimizer.synchronize()
 
-        # Clip gradients
+        # Clip gradients, once they are no longer scaled
+        self.grad_scaler.unscale_(self.optimizer)
         self.clip_grads(variables)
 
-        # Apply gradient updates
+        # Apply gradient updates, skipped by the grad scaler if they overflowed
         if self.horovod:
             # Because we already synchronized above, we can doing so here
             with self.optimizer.skip_synchronize():
-                self.optimizer.step()
+                self.grad_scaler.step(self.optimizer)
         else:
-            self.optimizer.step()
+            self.grad_scaler.step(self.optimizer)
+        self.grad_scaler.update()
+        self.optimizer.zero_grad()
 
         return loss, all_losses
 
+    def _update_running_train_metrics(self, targets: Dict[str, torch.Tensor], model_outputs: Dict[str, torch.Tensor]):
+        """Updates the metrics with the outputs of the training forward pass, if the training set is evaluated from
+        them rather than scored again at every checkpoint."""
+        if not self.evaluate_training_set or self.evaluate_training_set_mode != "running":
+            return
+
+        with torch.no_grad():
+            self.model.update_metrics(targets, self.model.outputs_to_predictions(model_outputs))
+
     def clip_grads(self, variables):
         """Applies gradient clipping."""
         if self.gradient_clipping_config.clipglobalnorm:
@@ -568,9 +614,26 @@ class Trainer(BaseTrainer):
         # eval metrics on train
         self.eval_batch_size = max(self.eval_batch_size, progress_tracker.batch_size)
         if self.evaluate_training_set:
-            self.evaluation(
-                training_set, "train", progress_tracker.train_metrics, tables, self.eval_batch_size, progress_tracker
-            )
+            if self.evaluate_training_set_mode == "running":
+                # metrics accumulated by the training steps since the previous evaluation
+                append_metrics(
+                    self.model,
+                    "train",
+                    self.model.get_metrics(),
+                    progress_tracker.train_metrics,
+                    tables,
+                    progress_tracker,
+                )
+                self.model.reset_metrics()
+            else:
+                self.evaluation(
+                    self._get_training_set_for_evaluation(training_set),
+                    "train",
+                    progress_tracker.train_metrics,
+                    tables,
+                    self.eval_batch_size,
+                    progress_tracker,
+                )
 
             self.write_eval_summary(
                 summary_writer=train_summary_writer,
@@ -665,6 +728,7 @@ class Trainer(BaseTrainer):
         else:
             # There's no validation, so we save the model.
             if self.is_coordinator() and not self.skip_save_model:
+                self.flush_checkpoints()
                 self.model.save(save_path)
 
         # Trigger eval end callback after any model weights save for complete checkpoint
@@ -681,6 +745,7 @@ class Trainer(BaseTrainer):
         """
         # ====== General setup =======
         output_features = self.model.output_features
+        self._training_set_sample = None
 
         # Only use signals when on the main thread to avoid issues with CherryPy
         # https://github.com/ludwig-ai/ludwig/issues/286
@@ -747,7 +812,10 @@ class Trainer(BaseTrainer):
         checkpoint = checkpoint_manager = None
         if self.is_coordinator() and not self.skip_save_progress:
             checkpoint = Checkpoint(model=self.model, optimizer=self.optimizer)
-            checkpoint_manager = CheckpointManager(checkpoint, training_checkpoints_path, device=self.device)
+            checkpoint_manager = CheckpointManager(
+                checkpoint, training_checkpoints_path, device=self.device, async_writes=self.async_checkpointing
+            )
+        self.checkpoint_manager = checkpoint_manager
 
         train_summary_writer = None
         validation_summary_writer = None
@@ -785,19 +853,25 @@ class Trainer(BaseTrainer):
 
         set_random_seed(self.random_seed)
 
+        # Gradients are only cleared after each update, drop any left over from batch size or learning rate tuning
+        self.optimizer.zero_grad()
+
         try:
             with training_set.initialize_batcher(
                 batch_size=self.batch_size,
                 should_shuffle=self.should_shuffle,
                 seed=self.random_seed,
                 horovod=self.horovod,
-            ) as batcher:
+            ) as batcher, prefetch(batcher, self.prefetch_batches, pin_memory=self.device != "cpu") as batcher:
                 # ================ Training Loop ================
-                self.total_steps = get_total_steps(self.epochs, batcher.steps_per_epoch, self.train_steps)
+                # A step updates the weights once, after accumulating the gradients of up to
+                # gradient_accumulation_steps batches.
+                steps_per_epoch = math.ceil(batcher.steps_per_epoch / self.gradient_accumulation_steps)
+                self.total_steps = get_total_steps(self.epochs, steps_per_epoch, self.train_steps)
 
                 # Get the terminal steps per checkpoint.
                 final_steps_per_checkpoint = get_final_steps_per_checkpoint(
-                    batcher.steps_per_epoch,
+                    steps_per_epoch,
                     self.steps_per_checkpoint,
                     self.checkpoints_per_epoch,
                     self.is_coordinator(),
@@ -809,7 +883,7 @@ class Trainer(BaseTrainer):
                 if self.is_coordinator():
                     logger.info(
                         f"Training for {self.total_steps} step(s), approximately "
-                        f"{int(self.total_steps / batcher.steps_per_epoch)} epoch(s)."
+                        f"{int(self.total_steps / steps_per_epoch)} epoch(s)."
                     )
                     if self.early_stop < 0:
                         logger.info("Early stopping policy: None")
@@ -817,7 +891,7 @@ class Trainer(BaseTrainer):
                         logger.info(
                             f"Early stopping policy: {self.early_stop} round(s) of evaluation, or "
                             f"{early_stopping_steps} step(s), approximately "
-                            f"{int(early_stopping_steps / batcher.steps_per_epoch)} epoch(s).\n"
+                            f"{int(early_stopping_steps / steps_per_epoch)} epoch(s).\n"
                         )
                     logger.info(f"Starting with step {progress_tracker.steps}, epoch: {progress_tracker.epoch}")
 
@@ -874,8 +948,7 @@ class Trainer(BaseTrainer):
                             f"{time_utils.strdelta((time.time()- start_time) * 1000.0)}."
                         )
                         if not self.skip_save_progress:
-                            checkpoint_manager.save(progress_tracker.steps)
-                            progress_tracker.save(os.path.join(save_path, TRAINING_PROGRESS_TRACKER_FILE_NAME))
+                            self._save_checkpoint(checkpoint_manager, progress_tracker, save_path)
 
                     # Early stop if needed.
                     if should_break:
@@ -967,23 +1040,34 @@ class Trainer(BaseTrainer):
                 )
             self.set_optimizer_learning_rate(current_learning_rate)
 
+            # The weights are updated after the last batch of every window of gradient_accumulation_steps batches,
+            # the last window of the epoch can be shorter.
+            window_start = batcher.step - batcher.step % self.gradient_accumulation_steps
+            accumulation_steps = min(self.gradient_accumulation_steps, batcher.steps_per_epoch - window_start)
+
             # obtain batch
             batch = batcher.next_batch()
 
             # Move tensors to cuda here.
             inputs = {
-                i_feat.feature_name: torch.from_numpy(np.array(batch[i_feat.proc_column], copy=True)).to(self.device)
+                i_feat.feature_name: self._to_device(batch[i_feat.proc_column])
                 for i_feat in self.model.input_features.values()
             }
             targets = {
-                o_feat.feature_name: torch.from_numpy(np.array(batch[o_feat.proc_column], copy=True)).to(self.device)
+                o_feat.feature_name: self._to_device(batch[o_feat.proc_column])
                 for o_feat in self.model.output_features.values()
             }
 
+            should_step = batcher.step - window_start == accumulation_steps or batcher.last_batch()
             loss, all_losses = self.train_step(
                 inputs,
                 targets,
+                should_step=should_step,
+                accumulation_steps=accumulation_steps,
             )
+            if not should_step:
+                self.callback(lambda c: c.on_batch_end(self, progress_tracker, save_path))
+                continue
 
             if self.is_coordinator() and not self.skip_save_log:
                 self.write_step_summary(
@@ -1006,8 +1090,7 @@ class Trainer(BaseTrainer):
             if progress_tracker.steps % final_steps_per_checkpoint == 0:
                 # Checkpoint the model.
                 if self.is_coordinator() and not self.skip_save_progress:
-                    checkpoint_manager.save(progress_tracker.steps)
-                    progress_tracker.save(os.path.join(save_path, TRAINING_PROGRESS_TRACKER_FILE_NAME))
+                    self._save_checkpoint(checkpoint_manager, progress_tracker, save_path)
 
                 should_break = self.run_evaluation(
                     training_set,
@@ -1032,6 +1115,29 @@ class Trainer(BaseTrainer):
 
         return False
 
+    @staticmethod
+    def _save_checkpoint(checkpoint_manager: CheckpointManager, progress_tracker: ProgressTracker, save_path: str):
+        """Saves a checkpoint, then the training progress of the time of the checkpoint once it is written.
+
+        The progress is never ahead of the latest checkpoint, so resuming does not skip steps.
+        """
+        progress = copy.deepcopy(progress_tracker) if checkpoint_manager.async_writes else progress_tracker
+        checkpoint_manager.save(
+            progress_tracker.steps,
+            after_save=lambda: progress.save(os.path.join(save_path, TRAINING_PROGRESS_TRACKER_FILE_NAME)),
+        )
+
+    def flush_checkpoints(self):
+        """Waits for the training checkpoints being written in the background, if any."""
+        if self.checkpoint_manager is not None:
+            self.checkpoint_manager.flush()
+
+    def _to_device(self, value) -> torch.Tensor:
+        # prefetched batches are already tensors, possibly in pinned memory
+        if not isinstance(value, torch.Tensor):
+            value = torch.from_numpy(np.array(value, copy=True))
+        return value.to(self.device, non_blocking=value.is_pinned())
+
     def train_online(self, dataset):
         self.model.train()  # Sets model training mode.
         with dataset.initialize_batcher(
@@ -1080,9 +1186,30 @@ class Trainer(BaseTrainer):
     def validation_metric(self):
         return self._validation_metric
 
+    def _get_training_set_for_evaluation(self, training_set):
+        """Returns the training set, or the fixed random sample of it that is scored at every checkpoint."""
+        if self.evaluate_training_set_mode != "sample":
+            return training_set
+
+        if self._training_set_sample is None:
+            try:
+                self._training_set_sample = training_set.sample(
+                    self.evaluate_training_set_sample_size, seed=self.random_seed
+                )
+            except NotImplementedError:
+                logger.warning(
+                    f"Sampling is not supported by {type(training_set).__name__}, evaluating the full training set"
+                )
+                self._training_set_sample = training_set
+        return self._training_set_sample
+
     def evaluation(self, dataset, dataset_name, metrics_log, tables, batch_size, progress_tracker):
         predictor = Predictor(
-            self.model, batch_size=batch_size, horovod=self.horovod, report_tqdm_to_ray=self.report_tqdm_to_ray
+            self.model,
+            batch_size=batch_size,
+            horovod=self.horovod,
+            report_tqdm_to_ray=self.report_tqdm_to_ray,
+            mixed_precision=self.mixed_precision,
         )
         metrics, predictions = predictor.batch_evaluation(dataset, collect_predictions=False, dataset_name=dataset_name)
 
@@ -1130,6 +1257,7 @@ class Trainer(BaseTrainer):
             progress_tracker.best_eval_metric = last_validation_metric_value
 
             if self.is_coordinator() and not skip_save_model:
+                self.flush_checkpoints()
                 self.model.save(save_path)
                 logger.info(
                     f"Validation {validation_metric} on {validation_output_feature_name} improved, model saved.\n"
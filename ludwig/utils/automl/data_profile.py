@@ -0,0 +1,300 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Single pass profiling of the columns of a dataset for type inference.
+
+All the statistics of all the columns are computed by scanning the dataset once, a chunk of rows at a time. Profiles of
+different chunks can be merged, so the chunks can also be profiled in parallel.
+"""
+import math
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ludwig.utils.audio_utils import is_audio_score
+from ludwig.utils.automl.utils import avg_num_tokens
+from ludwig.utils.image_utils import is_image_score
+
+# Number of rows sampled uniformly from the dataset, to detect images, audio and count tokens of each column.
+DEFAULT_SAMPLE_SIZE = 5000
+
+# Columns with more distinct values than this have their distinct values estimated with a HyperLogLog sketch.
+DEFAULT_MAX_EXACT_DISTINCT_VALUES = 10000
+
+# Number of distinct values to keep, in order of appearance, for each column.
+DEFAULT_MAX_DISTINCT_VALUES = 10
+
+# The sketch uses 2^precision one byte registers, 16KB per column, for a relative error of ~0.8%.
+HLL_PRECISION = 14
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """Returns the 64 bit hashes of the values."""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Returns the number of bits needed to represent each of the unsigned 64 bit integers."""
+    length = np.zeros(x.shape, dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        shifted = x >> np.uint64(shift)
+        has_high_bits = shifted != 0
+        length[has_high_bits] += shift
+        x = np.where(has_high_bits, shifted, x)
+    return length + (x != 0)
+
+
+class HyperLogLog:
+    """Approximate count of distinct values, with a memory footprint independent of the number of values.
+
+    See Flajolet et al., "HyperLogLog: the analysis of a near-optimal cardinality estimation algorithm", 2007.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, hashes: np.ndarray):
+        """Adds values to the sketch, given their 64 bit hashes."""
+        suffix_bits = 64 - self.precision
+        # The first bits of the hash select the register, which holds the max position of the leftmost 1 of the rest.
+        registers = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffixes = hashes & np.uint64((1 << suffix_bits) - 1)
+        ranks = (suffix_bits + 1 - _bit_length(suffixes)).astype(np.uint8)
+        np.maximum.at(self.registers, registers, ranks)
+
+    def merge(self, other: "HyperLogLog"):
+        """Adds all the values of another sketch to this one."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> float:
+        """Returns the estimated number of distinct values added to the sketch."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+        num_zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * math.log(m / num_zeros)
+        return estimate
+
+
+def _add_counts(counts: Optional[pd.Series], other: Optional[pd.Series]) -> Optional[pd.Series]:
+    if counts is None or other is None:
+        return other if counts is None else counts
+    return pd.concat([counts, other]).groupby(level=0, sort=False).sum()
+
+
+class ColumnProfile:
+    """Statistics of the values of a single column.
+
+    Distinct values are counted exactly until there are more than `max_exact_distinct_values` of them, then they are
+    estimated with a HyperLogLog sketch.
+    """
+
+    def __init__(self, max_exact_distinct_values: int, max_distinct_values: int):
+        self.max_exact_distinct_values = max_exact_distinct_values
+        self.max_distinct_values = max_distinct_values
+        self.nonnull_values = 0
+        # The first distinct values, in order of appearance.
+        self.distinct_values: List[Any] = []
+        # Exact count of every distinct value, None once the sketch is used.
+        self.value_counts: Optional[pd.Series] = None
+        self.sketch: Optional[HyperLogLog] = None
+
+    @property
+    def num_distinct_values(self) -> int:
+        if self.sketch is None:
+            return len(self.value_counts) if self.value_counts is not None else 0
+
+        estimate = min(round(self.sketch.count()), self.nonnull_values)
+        if estimate >= self.nonnull_values * (1 - 3 * self.sketch.relative_error):
+            # Within the error of the sketch, all values are unique, e.g. an ID column.
+            return self.nonnull_values
+        return estimate
+
+    @property
+    def distinct_values_balance(self) -> float:
+        """Ratio of the counts of the least and most frequent values, 1.0 if they are not counted exactly."""
+        if self.value_counts is None or len(self.value_counts) == 0:
+            return 1.0
+        return self.value_counts.min() / self.value_counts.max()
+
+    def update(self, column: pd.Series):
+        """Adds the values of a chunk of the column to the profile."""
+        values = column.dropna()
+        self.nonnull_values += len(values)
+        if len(self.distinct_values) < self.max_distinct_values:
+            self._add_distinct_values(pd.unique(values))
+
+        if self.sketch is None:
+            self.value_counts = _add_counts(self.value_counts, values.value_counts(sort=False))
+            if len(self.value_counts) > self.max_exact_distinct_values:
+                self._use_sketch()
+        else:
+            self.sketch.add(hash_values(values))
+
+    def merge(self, other: "ColumnProfile"):
+        """Adds the values of another chunk of the column, following the chunks of this profile."""
+        self.nonnull_values += other.nonnull_values
+        self._add_distinct_values(other.distinct_values)
+
+        if self.sketch is None and other.sketch is None:
+            self.value_counts = _add_counts(self.value_counts, other.value_counts)
+            if self.value_counts is not None and len(self.value_counts) > self.max_exact_distinct_values:
+                self._use_sketch()
+        else:
+            self._use_sketch()
+            other._use_sketch()
+            self.sketch.merge(other.sketch)
+
+    def _add_distinct_values(self, values: Iterable[Any]):
+        seen = set(self.distinct_values)
+        for value in values:
+            if len(self.distinct_values) >= self.max_distinct_values:
+                break
+            if value not in seen:
+                self.distinct_values.append(value)
+                seen.add(value)
+
+    def _use_sketch(self):
+        if self.sketch is not None:
+            return
+        self.sketch = HyperLogLog()
+        if self.value_counts is not None:
+            self.sketch.add(hash_values(self.value_counts.index.to_series()))
+        self.value_counts = None
+
+
+def _bottom_k(sample: pd.DataFrame, keys: np.ndarray, k: int):
+    """Keeps the `k` rows with the smallest random keys, a uniform sample of all the rows seen so far."""
+    if len(keys) <= k:
+        return sample, keys
+    idx = np.sort(np.argpartition(keys, k)[:k])
+    return sample.iloc[idx], keys[idx]
+
+
+class DatasetProfile:
+    """Statistics of all the columns of a dataset, and a uniform sample of its rows, computed in a single scan.
+
+    Only a sample of the rows of a dataset may be scanned, within a row budget. In that case, `row_count` is the number
+    of rows of the whole dataset, and the counts of non-null values, columns that only have unique values and the size
+    of the dataset are extrapolated from the rows scanned. For Dask dataframes, `row_count` itself is extrapolated from
+    the partitions scanned.
+    """
+
+    def __init__(
+        self,
+        columns: Iterable[str],
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        max_exact_distinct_values: int = DEFAULT_MAX_EXACT_DISTINCT_VALUES,
+        max_distinct_values: int = DEFAULT_MAX_DISTINCT_VALUES,
+    ):
+        self.sample_size = sample_size
+        self.columns = {column: ColumnProfile(max_exact_distinct_values, max_distinct_values) for column in columns}
+        self.rows = 0
+        self.row_count = 0
+        self.memory_usage_bytes = 0
+        self.sample: Optional[pd.DataFrame] = None
+        self.sample_keys = np.empty(0)
+
+    def update(self, chunk: pd.DataFrame, rng: np.random.Generator):
+        """Adds a chunk of rows of the dataset to the profile."""
+        for column, column_profile in self.columns.items():
+            column_profile.update(chunk[column])
+        self.rows += len(chunk)
+        self.row_count = max(self.row_count, self.rows)
+        self.memory_usage_bytes += int(chunk.memory_usage(deep=True, index=False).sum())
+
+        # Sample rows with uniform random keys, keeping those with the smallest keys over all chunks.
+        chunk_sample, chunk_keys = _bottom_k(chunk, rng.random(len(chunk)), self.sample_size)
+        self._add_sample(chunk_sample, chunk_keys)
+
+    def merge(self, other: "DatasetProfile") -> "DatasetProfile":
+        """Adds the profile of the chunks following the chunks of this profile."""
+        for column, column_profile in self.columns.items():
+            column_profile.merge(other.columns[column])
+        self.rows += other.rows
+        self.row_count = max(self.row_count, self.rows)
+        self.memory_usage_bytes += other.memory_usage_bytes
+        if other.sample is not None:
+            self._add_sample(other.sample, other.sample_keys)
+        return self
+
+    def _add_sample(self, sample: pd.DataFrame, keys: np.ndarray):
+        if self.sample is not None:
+            sample = pd.concat([self.sample, sample])
+            keys = np.concatenate([self.sample_keys, keys])
+        self.sample, self.sample_keys = _bottom_k(sample, keys, self.sample_size)
+
+    @property
+    def _scale(self) -> float:
+        return self.row_count / self.rows if self.rows > 0 else 1.0
+
+    @property
+    def size_bytes(self) -> int:
+        return round(self.memory_usage_bytes * self._scale)
+
+    def nonnull_values(self, column: str) -> int:
+        return round(self.columns[column].nonnull_values * self._scale)
+
+    def num_distinct_values(self, column: str) -> int:
+        column_profile = self.columns[column]
+        num_distinct_values = column_profile.num_distinct_values
+        if self.rows < self.row_count and num_distinct_values == column_profile.nonnull_values:
+            # All the values scanned are unique, assume that those of the rows not scanned are too.
+            return self.nonnull_values(column)
+        return num_distinct_values
+
+    def distinct_values(self, column: str) -> List[Any]:
+        return self.columns[column].distinct_values
+
+    def distinct_values_balance(self, column: str) -> float:
+        return self.columns[column].distinct_values_balance
+
+    def image_values(self, column: str, sample_size: int = 10) -> int:
+        if self.sample is None:
+            return 0
+        return int(sum(is_image_score(None, x, column) for x in self.sample[column].head(sample_size)))
+
+    def audio_values(self, column: str, sample_size: int = 10) -> int:
+        if self.sample is None:
+            return 0
+        return int(sum(is_audio_score(x) for x in self.sample[column].head(sample_size)))
+
+    def avg_num_tokens(self, column: str) -> int:
+        if self.sample is None:
+            return 0
+        return avg_num_tokens(self.sample[column])
+
+
+def profile_chunk(chunk: pd.DataFrame, seed: Any, **kwargs) -> DatasetProfile:
+    """Returns the profile of a single chunk of rows, sampled with a random generator seeded with `seed`."""
+    profile = DatasetProfile(chunk.columns, **kwargs)
+    profile.update(chunk, np.random.default_rng(seed))
+    return profile
+
+
+def merge_profiles(*profiles: DatasetProfile) -> DatasetProfile:
+    """Merges the profiles of consecutive chunks of rows, in order."""
+    profile = profiles[0]
+    for other in profiles[1:]:
+        profile.merge(other)
+    return profile
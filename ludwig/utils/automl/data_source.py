@@ -1,15 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
+import dask
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 
 from ludwig.utils.audio_utils import is_audio_score
+from ludwig.utils.automl.data_profile import DatasetProfile, DEFAULT_MAX_DISTINCT_VALUES, merge_profiles, profile_chunk
 from ludwig.utils.automl.utils import avg_num_tokens
 from ludwig.utils.image_utils import is_image_score
 from ludwig.utils.misc_utils import memoized_method
 from ludwig.utils.types import DataFrame
 
+# Number of rows of a pandas dataframe profiled at once.
+PROFILE_CHUNK_SIZE = 100000
+
+# Number of chunks, spread across a pandas dataframe, that the rows profiled within a row budget are taken from.
+PROFILE_SAMPLED_CHUNKS = 100
+
+# Number of partitions of a Dask dataframe merged at once, and profiled at once when scanning within a row budget.
+PROFILE_PARTITIONS_FAN_IN = 16
+
 
 class DataSource(ABC):
     @property
@@ -41,11 +53,66 @@ class DataSource(ABC):
     def size_bytes(self) -> int:
         raise NotImplementedError()
 
+    def profile(
+        self, max_rows: Optional[int] = None, seed: int = 0, **kwargs
+    ) -> Union[DatasetProfile, "SourceProfile"]:
+        """Computes the statistics of all the columns in a single scan of `max_rows` rows (all if None), sampled
+        across the dataset.
+
+        Keyword arguments are passed to `DatasetProfile`. Sources that don't override it are profiled with their per-
+        column statistics instead, over all the rows.
+        """
+        return SourceProfile(self, max_distinct_values=kwargs.get("max_distinct_values", DEFAULT_MAX_DISTINCT_VALUES))
+
     @abstractmethod
     def __len__(self) -> int:
         raise NotImplementedError()
 
 
+class SourceProfile:
+    """Statistics of the columns of a `DataSource`, each computed from the data source when first asked for.
+
+    Has the same accessors as `DatasetProfile`, for data sources that only implement the per-column statistics.
+    """
+
+    def __init__(self, source: DataSource, max_distinct_values: int = DEFAULT_MAX_DISTINCT_VALUES):
+        self.source = source
+        self.max_distinct_values = max_distinct_values
+
+    @property
+    def row_count(self) -> int:
+        return len(self.source)
+
+    @property
+    def size_bytes(self) -> int:
+        return self.source.size_bytes()
+
+    def nonnull_values(self, column: str) -> int:
+        return self.source.get_nonnull_values(column)
+
+    @memoized_method(maxsize=1)
+    def _get_distinct_values(self, column: str) -> Tuple[int, List[Any], float]:
+        return self.source.get_distinct_values(column, self.max_distinct_values)
+
+    def num_distinct_values(self, column: str) -> int:
+        return self._get_distinct_values(column)[0]
+
+    def distinct_values(self, column: str) -> List[Any]:
+        return self._get_distinct_values(column)[1]
+
+    def distinct_values_balance(self, column: str) -> float:
+        return self._get_distinct_values(column)[2]
+
+    def image_values(self, column: str) -> int:
+        return self.source.get_image_values(column)
+
+    def audio_values(self, column: str) -> int:
+        return self.source.get_audio_values(column)
+
+    def avg_num_tokens(self, column: str) -> int:
+        return self.source.get_avg_num_tokens(column)
+
+
 class DataframeSourceMixin:
     df: DataFrame
 
@@ -86,6 +153,29 @@ class DataframeSourceMixin:
     def size_bytes(self) -> int:
         return sum(self.df.memory_usage(deep=True))
 
+    def profile(
+        self, max_rows: Optional[int] = None, seed: int = 0, chunk_size: int = PROFILE_CHUNK_SIZE, **kwargs
+    ) -> DatasetProfile:
+        profile = DatasetProfile(self.columns, **kwargs)
+        rng = np.random.default_rng(seed)
+        if max_rows is None or max_rows >= len(self.df):
+            bounds = [(start, start + chunk_size) for start in range(0, len(self.df), chunk_size)]
+        else:
+            # The first rows of sorted data are not representative of it, the budget is spread across the dataframe
+            # in evenly spaced chunks.
+            num_chunks = max(1, min(PROFILE_SAMPLED_CHUNKS, max_rows))
+            sampled_chunk_size = max_rows // num_chunks
+            starts = np.linspace(0, len(self.df) - sampled_chunk_size, num_chunks).astype(int)
+            bounds = [
+                (start + offset, start + min(offset + chunk_size, sampled_chunk_size))
+                for start in starts
+                for offset in range(0, sampled_chunk_size, chunk_size)
+            ]
+        for start, end in bounds:
+            profile.update(self.df.iloc[start:end], rng)
+        profile.row_count = len(self.df)
+        return profile
+
     def __len__(self) -> int:
         return len(self.df)
 
@@ -125,6 +215,41 @@ class DaskDataSource(DataframeSource):
     def get_avg_num_tokens(self, column) -> int:
         return avg_num_tokens(self.sample[column])
 
+    def profile(self, max_rows: Optional[int] = None, seed: int = 0, **kwargs) -> DatasetProfile:
+        # Partitions are profiled in parallel, and their profiles merged in order in a tree.
+        partitions = [
+            dask.delayed(profile_chunk)(partition, seed=(seed, i), **kwargs)
+            for i, partition in enumerate(self.df.to_delayed())
+        ]
+        if max_rows is None:
+            (profile,) = dask.compute(_merge_tree(partitions))
+            return profile
+
+        # Within a row budget, profile groups of partitions until enough rows are scanned. The partitions are scanned in
+        # a random order, the first ones of sorted data are not representative of it.
+        order = np.random.default_rng(seed).permutation(len(partitions))
+        partitions = [partitions[i] for i in order]
+        profile = DatasetProfile(self.columns, **kwargs)
+        num_scanned = 0
+        while num_scanned < len(partitions) and profile.rows < max_rows:
+            group = partitions[num_scanned : num_scanned + PROFILE_PARTITIONS_FAN_IN]
+            (group_profile,) = dask.compute(_merge_tree(group))
+            profile.merge(group_profile)
+            num_scanned += len(group)
+        if num_scanned < len(partitions):
+            # Counting the rows of the partitions not scanned would read them all, estimate it from those scanned.
+            profile.row_count = round(profile.rows / num_scanned * len(partitions))
+        return profile
+
+
+def _merge_tree(profiles: List["dask.delayed.Delayed"]) -> "dask.delayed.Delayed":
+    while len(profiles) > 1:
+        profiles = [
+            dask.delayed(merge_profiles)(*profiles[i : i + PROFILE_PARTITIONS_FAN_IN])
+            for i in range(0, len(profiles), PROFILE_PARTITIONS_FAN_IN)
+        ]
+    return profiles[0]
+
 
 def wrap_data_source(df: DataFrame) -> DataSource:
     if isinstance(df, dd.core.DataFrame):
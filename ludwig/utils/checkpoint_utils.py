@@ -8,8 +8,11 @@ import os
 import re
 import signal
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from glob import glob
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import torch
 
@@ -44,6 +47,23 @@ def get_files(d, pattern, sort=True):
     return files
 
 
+def copy_to_cpu(value):
+    """Returns a copy of `value` with every tensor it contains, at any depth, copied to CPU memory."""
+    if isinstance(value, torch.Tensor):
+        return value.detach().to("cpu", copy=True)
+    if isinstance(value, dict):
+        copied = OrderedDict() if isinstance(value, OrderedDict) else {}
+        for k, v in value.items():
+            copied[k] = copy_to_cpu(v)
+        if hasattr(value, "_metadata"):
+            # module versions of a model state dict, used by load_state_dict
+            copied._metadata = value._metadata
+        return copied
+    if isinstance(value, (list, tuple)):
+        return type(value)(copy_to_cpu(v) for v in value)
+    return value
+
+
 def get_latest_checkpoint_path(directory: str) -> str:
     latest_path = os.path.join(directory, LATEST_FNAME)
     if os.path.exists(latest_path):
@@ -109,13 +129,27 @@ class Checkpoint:
           global_step (int): The iteration number which will be used
              to name the checkpoint.
         """
+        self.save_state(self.get_state(global_step), save_path)
+
+    def get_state(self, global_step: int, copy: bool = False) -> Dict[str, Any]:
+        """Returns the state to save.
+
+        Args:
+          global_step (int): The iteration number stored in the state.
+          copy (bool): Whether to return a CPU copy of the state, unaffected by further training steps, instead of
+            references to the live model and optimizer tensors.
+        """
         state = {
             "global_step": global_step,
             "model_weights": self.model.state_dict(),
         }
         if self.optimizer is not None:
             state["optim_state"] = self.optimizer.state_dict()
+        return copy_to_cpu(state) if copy else state
 
+    @staticmethod
+    def save_state(state: Dict[str, Any], save_path: str):
+        """Atomically writes a state returned by `get_state` to `save_path`."""
         # ignore ctrl+c while saving
         try:
             orig_handler = signal.getsignal(signal.SIGINT)
@@ -151,9 +185,24 @@ class Checkpoint:
 
 
 class CheckpointManager:
-    """A model and optimizer checkpoint manager."""
+    """A model and optimizer checkpoint manager.
+
+    With `async_writes`, `save` only takes a CPU snapshot of the state and returns, while a background thread serializes
+    and moves it into place. At most `max_pending_writes` snapshots are in flight at any time, `save` blocks until a
+    write completes beyond that. `flush` waits for all pending writes.
+
+    Files that must never be ahead of the latest checkpoint, like the training progress, are written by the `after_save`
+    function of `save`, run once the checkpoint is in place, on the background thread with `async_writes`.
+    """
 
-    def __init__(self, checkpoint: Checkpoint, directory: str, device: torch.device):
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        directory: str,
+        device: torch.device,
+        async_writes: bool = False,
+        max_pending_writes: int = 1,
+    ):
         """Constructor.
 
         Args:
@@ -161,12 +210,24 @@ class CheckpointManager:
           directory (str): The directory in which checkpoints will be saved.
           device (torch.device): The computing device on which to restore
             checkpoints.
+          async_writes (bool): Whether to write checkpoints on a background
+            thread.
+          max_pending_writes (int): Maximum number of checkpoints being
+            written in the background at any time.
         """
+        if max_pending_writes < 1:
+            raise ValueError(f"max_pending_writes must be a positive integer, found: {max_pending_writes}")
+
         self.checkpoint = checkpoint
         self.directory = directory
         self.device = device
         self.latest_checkpoint = None
 
+        self.async_writes = async_writes
+        self._executor = None
+        self._pending_writes: List[Future] = []
+        self._write_slots = threading.BoundedSemaphore(max_pending_writes)
+
         # create checkpoint directory if it doesn't
         # already exist
         mkdir(self.directory)
@@ -188,19 +249,68 @@ class CheckpointManager:
             return self.checkpoint.global_step
         return 0
 
-    def save(self, global_step: int):
+    def save(self, global_step: int, after_save: Optional[Callable[[], None]] = None):
         """Create a new checkpoint.
 
         Args:
            global_step (int): The iteration number which will be used
              to name the checkpoint.
+           after_save (Callable): Function called once the checkpoint is
+             written, not called if the write fails.
         """
         save_path = os.path.join(self.directory, LATEST_FNAME)
-        self.checkpoint.save(save_path, global_step)
+        if not self.async_writes:
+            self.checkpoint.save(save_path, global_step)
+            self.latest_checkpoint = save_path
+            if after_save is not None:
+                after_save()
+            return
+
+        # raise the errors of previous writes, if any, before queueing up more
+        self._collect_pending_writes(wait=False)
+        self._write_slots.acquire()
+        try:
+            state = self.checkpoint.get_state(global_step, copy=True)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ludwig-checkpoint")
+            # a single writer thread, so checkpoints land in the order they were taken
+            write = self._executor.submit(self._write_state, state, save_path, after_save)
+        except BaseException:
+            self._write_slots.release()
+            raise
+        write.add_done_callback(lambda _: self._write_slots.release())
+        self._pending_writes.append(write)
         self.latest_checkpoint = save_path
 
+    def flush(self):
+        """Blocks until all checkpoints saved so far are written, raising the first error of the writes if any."""
+        self._collect_pending_writes(wait=True)
+
     def close(self):
-        pass
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    @staticmethod
+    def _write_state(state: Dict[str, Any], save_path: str, after_save: Optional[Callable[[], None]]):
+        Checkpoint.save_state(state, save_path)
+        if after_save is not None:
+            after_save()
+
+    def _collect_pending_writes(self, wait: bool):
+        pending_writes = []
+        error = None
+        for write in self._pending_writes:
+            if not wait and not write.done():
+                pending_writes.append(write)
+            elif write.exception() is not None and error is None:
+                error = write.exception()
+        self._pending_writes = pending_writes
+        if error is not None:
+            raise error
 
     @staticmethod
     def load_latest_checkpoint(checkpoint: Checkpoint, directory: str, device: torch.device):
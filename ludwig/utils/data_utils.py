@@ -369,15 +369,24 @@ def flatten_dict(d, parent_key="", sep="."):
     return dict(items)
 
 
-def save_hdf5(data_fp, data):
-    numpy_dataset = to_numpy_dataset(data)
+def save_hdf5(data_fp, data: Union[DataFrame, Dict[str, np.ndarray]]):
+    """Saves a DataFrame, or a dict of numpy arrays keyed by column name, with one HDF5 dataset per column."""
+    numpy_dataset = data if isinstance(data, dict) else to_numpy_dataset(data)
     with upload_h5(data_fp) as h5_file:
-        h5_file.create_dataset(HDF5_COLUMNS_KEY, data=np.array(data.columns.values, dtype="S"))
-        for column in data.columns:
-            h5_file.create_dataset(column, data=numpy_dataset[column])
+        h5_file.create_dataset(HDF5_COLUMNS_KEY, data=np.array(list(numpy_dataset.keys()), dtype="S"))
+        for column, values in numpy_dataset.items():
+            h5_file.create_dataset(column, data=values)
 
 
-def load_hdf5(data_fp, clean_cols: bool = False):
+def load_hdf5(data_fp, clean_cols: bool = False) -> pd.DataFrame:
+    return from_numpy_dataset(load_hdf5_columns(data_fp, clean_cols=clean_cols))
+
+
+def load_hdf5_columns(data_fp, clean_cols: bool = False) -> Dict[str, np.ndarray]:
+    """Loads an HDF5 file written by `save_hdf5` as a dict of contiguous numpy arrays, keyed by column name.
+
+    Unlike `load_hdf5`, multidimensional columns are not unstacked into Series of per-row arrays.
+    """
     with download_h5(data_fp) as hdf5_data:
         columns = [s.decode("utf-8") for s in hdf5_data[HDF5_COLUMNS_KEY][()].tolist()]
 
@@ -387,7 +396,7 @@ def load_hdf5(data_fp, clean_cols: bool = False):
             np_col = column.rsplit("_", 1)[0] if clean_cols else column
             numpy_dataset[np_col] = hdf5_data[column][()]
 
-    return from_numpy_dataset(numpy_dataset)
+    return numpy_dataset
 
 
 def load_object(object_fp):
@@ -424,24 +433,27 @@ def save_array(data_fp, array):
 
 # TODO(shreya): Confirm types of args
 def load_pretrained_embeddings(embeddings_path: str, vocab: List[str]) -> np.ndarray:
-    """Create an embedding matrix of all words in vocab."""
-    embeddings, embeddings_size = load_glove(embeddings_path, return_embedding_size=True)
+    """Create an embedding matrix of all words in vocab.
+
+    The embeddings are read from a memory mapped store converted from the GloVe format file the first time it is used.
+    """
+    from ludwig.utils.embedding_store import EmbeddingStore
+
+    store = EmbeddingStore.from_glove(embeddings_path)
+    rows = store.lookup(vocab)
+    found = rows >= 0
+    if not found.any():
+        raise ValueError(f"None of the {len(vocab)} words of the vocabulary have an embedding in {embeddings_path}.")
 
     # calculate an average embedding, to use for initializing missing words
-    avg_embedding = [embeddings[w] for w in vocab if w in embeddings]
-    avg_embedding = sum(avg_embedding) / len(avg_embedding)
+    found_embeddings = store.vectors[rows[found]].astype(np.float64)
+    avg_embedding = found_embeddings.mean(axis=0)
 
     # create the embedding matrix
-    embeddings_vectors = []
-    for word in vocab:
-        if word in embeddings:
-            embeddings_vectors.append(embeddings[word])
-        else:
-            embeddings_vectors.append(avg_embedding + np.random.uniform(-0.01, 0.01, embeddings_size))
-    embeddings_matrix = np.stack(embeddings_vectors)
-
-    # let's help the garbage collector free some memory
-    embeddings = None
+    embeddings_matrix = np.empty((len(vocab), store.embedding_size), dtype=np.float64)
+    embeddings_matrix[found] = found_embeddings
+    num_missing = len(vocab) - int(found.sum())
+    embeddings_matrix[~found] = avg_embedding + np.random.uniform(-0.01, 0.01, (num_missing, store.embedding_size))
 
     return embeddings_matrix
 
@@ -0,0 +1,217 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Binary, memory mapped store of pretrained embeddings.
+
+Parsing a multi-GB GloVe text file takes minutes, while a model only needs the rows of the few thousand words of its
+vocabulary. The text file is instead converted once into a store holding:
+
+- `vectors.bin`: the float32 [num_tokens, embedding_size] matrix of the embeddings, in the order of the file.
+- `hashes.npy` and `rows.npy`: the 64 bit hashes of the tokens, sorted, and the row of the token of every hash. Tokens
+  are looked up with a binary search over the hashes.
+- `tokens.bin` and `offsets.npy`: the utf-8 encoded tokens, one after the other, to tell apart tokens with the same
+  hash.
+- `meta.json`: the shape of the matrix, written last to mark the store as complete.
+
+All the arrays are memory mapped, so looking up a vocabulary only reads the pages it needs, and processes using the same
+store share them through the page cache.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ludwig.utils.data_utils import load_json, save_json
+from ludwig.utils.fs_utils import abspath, file_lock, get_fs_and_path, makedirs, open_file, path_exists
+
+logger = logging.getLogger(__name__)
+
+META_FILE_NAME = "meta.json"
+VECTORS_FILE_NAME = "vectors.bin"
+HASHES_FILE_NAME = "hashes.npy"
+ROWS_FILE_NAME = "rows.npy"
+TOKENS_FILE_NAME = "tokens.bin"
+OFFSETS_FILE_NAME = "offsets.npy"
+
+
+def hash_token(token: str) -> int:
+    """Returns a stable 64 bit hash of the token, the same in every process unlike `hash`."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class EmbeddingStore:
+    """Memory mapped embeddings of the tokens of a pretrained embeddings file."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        meta = load_json(os.path.join(store_dir, META_FILE_NAME))
+        self.num_tokens = meta["num_tokens"]
+        self.embedding_size = meta["embedding_size"]
+        self.vectors = np.memmap(
+            os.path.join(store_dir, VECTORS_FILE_NAME),
+            dtype=np.float32,
+            mode="r",
+            shape=(self.num_tokens, self.embedding_size),
+        )
+        self.hashes = np.load(os.path.join(store_dir, HASHES_FILE_NAME), mmap_mode="r")
+        self.rows = np.load(os.path.join(store_dir, ROWS_FILE_NAME), mmap_mode="r")
+        self.offsets = np.load(os.path.join(store_dir, OFFSETS_FILE_NAME), mmap_mode="r")
+        self.tokens = np.memmap(os.path.join(store_dir, TOKENS_FILE_NAME), dtype=np.uint8, mode="r")
+
+    @classmethod
+    def from_glove(cls, embeddings_path: str, cache_dir: Optional[str] = None) -> "EmbeddingStore":
+        """Returns the store of the GloVe format file, converting the file the first time.
+
+        Args:
+            embeddings_path: Path of the GloVe format file.
+            cache_dir: Directory of the stores, defaults to `embeddings` in the Ludwig cache directory.
+
+        Returns:
+            The store of the embeddings of the file.
+        """
+        store_dir = get_store_dir(embeddings_path, cache_dir)
+        makedirs(os.path.dirname(store_dir), exist_ok=True)
+        with file_lock(os.path.dirname(store_dir), lock_file=f".lock_{os.path.basename(store_dir)}"):
+            if not path_exists(os.path.join(store_dir, META_FILE_NAME)):
+                convert_glove(embeddings_path, store_dir)
+        return cls(store_dir)
+
+    def lookup(self, tokens: Iterable[str]) -> np.ndarray:
+        """Returns the rows of the embeddings of the tokens, -1 for the tokens not in the store.
+
+        Tokens appearing more than once in the file are mapped to their last embedding.
+        """
+        tokens = list(tokens)
+        token_hashes = np.fromiter((hash_token(token) for token in tokens), np.uint64, len(tokens))
+        starts = np.searchsorted(self.hashes, token_hashes, side="left")
+        ends = np.searchsorted(self.hashes, token_hashes, side="right")
+
+        rows = np.full(len(tokens), -1, dtype=np.int64)
+        encoded = [token.encode("utf-8") for token in tokens]
+
+        # tokens matching a single row are compared with it all at once
+        single = np.flatnonzero(ends - starts == 1)
+        candidates = np.asarray(self.rows[starts[single]])
+        equal = self._equal_tokens(candidates, [encoded[i] for i in single.tolist()])
+        rows[single[equal]] = candidates[equal]
+
+        for i in np.flatnonzero(ends - starts > 1).tolist():
+            # rows of the same hash are in the order of the file, the last one wins
+            for row in self.rows[starts[i] : ends[i]][::-1].tolist():
+                if self._token_bytes(row) == encoded[i]:
+                    rows[i] = row
+                    break
+        return rows
+
+    def _equal_tokens(self, rows: np.ndarray, encoded: List[bytes]) -> np.ndarray:
+        """Returns whether the token of every row is equal to the encoded token."""
+        lengths = np.fromiter((len(token) for token in encoded), np.int64, len(encoded))
+        starts = np.asarray(self.offsets[rows])
+        equal = np.asarray(self.offsets[rows + 1]) - starts == lengths
+        if not equal.any():
+            return equal
+
+        # compare the bytes of the tokens of the same length, all concatenated
+        lengths = np.where(equal, lengths, 0)
+        expected = np.frombuffer(b"".join(token for token, same in zip(encoded, equal.tolist()) if same), np.uint8)
+        positions = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(int(lengths.sum()))
+        mismatches = (np.asarray(self.tokens[positions]) != expected).astype(np.int64)
+        equal[equal] = np.add.reduceat(mismatches, (np.cumsum(lengths) - lengths)[equal]) == 0
+        return equal
+
+    def _token_bytes(self, row: int) -> bytes:
+        return self.tokens[self.offsets[row] : self.offsets[row + 1]].tobytes()
+
+
+def get_store_dir(embeddings_path: str, cache_dir: Optional[str] = None) -> str:
+    """Returns the directory of the store of the embeddings file, keyed by the path and version of the file."""
+    if cache_dir is None:
+        from ludwig.datasets.loaders.dataset_loader import get_default_cache_location
+
+        cache_dir = os.path.join(get_default_cache_location(), "embeddings")
+
+    fs, path = get_fs_and_path(embeddings_path)
+    # the key changes with the size and modification time of the file
+    key = hashlib.md5(f"{abspath(embeddings_path)}:{fs.ukey(path)}".encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, key)
+
+
+def convert_glove(embeddings_path: str, store_dir: str):
+    """Converts the GloVe format file into a store in `store_dir`.
+
+    The embedding size is the one of the first line, lines with another number of values are skipped. The store is
+    written into a temporary directory moved to `store_dir` once complete.
+    """
+    logger.info(f"  Converting Glove format file {embeddings_path} into an embedding store at {store_dir}")
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(store_dir), prefix=".tmp_")
+    try:
+        embedding_size, tokens = _write_vectors(embeddings_path, os.path.join(tmp_dir, VECTORS_FILE_NAME))
+        if not tokens:
+            raise ValueError(f"No embeddings found in the GloVe file {embeddings_path}")
+
+        encoded = [token.encode("utf-8") for token in tokens]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(token) for token in encoded], out=offsets[1:])
+        np.save(os.path.join(tmp_dir, OFFSETS_FILE_NAME), offsets)
+        with open(os.path.join(tmp_dir, TOKENS_FILE_NAME), "wb") as f:
+            f.write(b"".join(encoded))
+
+        token_hashes = np.fromiter((hash_token(token) for token in tokens), np.uint64, len(tokens))
+        rows = np.argsort(token_hashes, kind="stable")
+        np.save(os.path.join(tmp_dir, HASHES_FILE_NAME), token_hashes[rows])
+        np.save(os.path.join(tmp_dir, ROWS_FILE_NAME), rows.astype(np.int64))
+
+        save_json(os.path.join(tmp_dir, META_FILE_NAME), {"num_tokens": len(tokens), "embedding_size": embedding_size})
+        if os.path.exists(store_dir):
+            # left over by an interrupted conversion
+            shutil.rmtree(store_dir)
+        os.rename(tmp_dir, store_dir)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    logger.info(f"  {len(tokens)} embeddings converted")
+
+
+def _write_vectors(embeddings_path: str, vectors_fp: str) -> Tuple[int, List[str]]:
+    """Writes the float32 embeddings of the valid lines of the file to `vectors_fp`.
+
+    Returns:
+        The embedding size and the tokens of the rows.
+    """
+    embedding_size = None
+    tokens = []
+    with open_file(embeddings_path, "r", encoding="utf-8") as f, open(vectors_fp, "wb") as out:
+        for line_number, line in enumerate(f):
+            split = line.split()
+            if not split:
+                continue
+            if embedding_size is None:
+                embedding_size = len(split) - 1
+            try:
+                if len(split) != embedding_size + 1:
+                    raise ValueError(
+                        f"Line {line_number} is of length {len(split)}, "
+                        f"while expected length is {embedding_size + 1}."
+                    )
+                embedding = np.array(split[1:], dtype=np.float32)
+            except ValueError:
+                logger.warning(f"Line {line_number} in the GloVe file {embeddings_path} is malformed, skipping it")
+                continue
+            out.write(embedding.tobytes())
+            tokens.append(split[0])
+    return embedding_size or 0, tokens
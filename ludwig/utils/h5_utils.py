@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+import h5py
+import numpy as np
+
+from ludwig.utils.fs_utils import get_fs_and_path, has_remote_protocol
+
+
+def get_memmap(h5_file: h5py.File, key: str) -> Optional[np.memmap]:
+    """Returns a read-only memory map over the dataset `key` of `h5_file`, or None if it can't be mapped.
+
+    Only datasets stored with a contiguous, unfiltered layout in a local file can be mapped, as their raw bytes live in
+    a single block of the file at a fixed offset.
+    """
+    dataset = h5_file[key]
+    if dataset.chunks is not None or dataset.compression is not None or dataset.dtype.hasobject:
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        # storage was never allocated, i.e. nothing has been written to the dataset yet
+        return None
+    return np.memmap(h5_file.filename, dtype=dataset.dtype, mode="r", offset=offset, shape=dataset.shape)
+
+
+def is_contiguous_range(indices: np.ndarray) -> bool:
+    """Returns whether `indices` is a strictly increasing run of consecutive integers."""
+    return len(indices) > 0 and indices[-1] - indices[0] == len(indices) - 1 and np.all(np.diff(indices) == 1)
+
+
+def read_rows(dataset, indices: np.ndarray) -> np.ndarray:
+    """Reads the rows `indices` (in any order, duplicates allowed) along the first axis of `dataset`.
+
+    For memory mapped arrays this is a plain gather. For HDF5 datasets the requested rows are sorted and coalesced into
+    runs that touch consecutive chunks (or consecutive rows for contiguous datasets), so that every run is served by a
+    single slice read instead of an element-wise fancy index.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) == 0:
+        return np.empty((0,) + dataset.shape[1:], dtype=dataset.dtype)
+    if is_contiguous_range(indices):
+        return dataset[indices[0] : indices[-1] + 1]
+    if isinstance(dataset, np.ndarray):
+        return dataset[indices]
+
+    unique_indices, inverse = np.unique(indices, return_inverse=True)
+    chunk_rows = dataset.chunks[0] if dataset.chunks is not None else 1
+    run_starts = np.flatnonzero(np.diff(unique_indices // chunk_rows) > 1) + 1
+    runs = np.split(unique_indices, run_starts)
+
+    rows = np.empty((len(unique_indices),) + dataset.shape[1:], dtype=dataset.dtype)
+    offset = 0
+    for run in runs:
+        block = dataset[run[0] : run[-1] + 1]
+        rows[offset : offset + len(run)] = block[run - run[0]]
+        offset += len(run)
+    return rows[inverse]
+
+
+class H5HandlePool:
+    """Pool of open, read-only HDF5 file handles.
+
+    Handles are opened on first use and kept open until the pool is closed, so repeated reads from the same file do not
+    pay for reopening it (or, for remote files, for downloading it again). Handles are never shared across processes:
+    a pool used from a forked worker transparently reopens its files.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._tmpdir: Optional[str] = None
+        self._handles: Dict[str, h5py.File] = {}
+        self._memmaps: Dict[Tuple[str, str], Optional[np.memmap]] = {}
+
+    def get(self, url: str) -> h5py.File:
+        with self._lock:
+            if self._pid != os.getpid():
+                # inherited from the parent process, h5py handles can't be used across a fork
+                self._reset()
+            if url not in self._handles:
+                self._handles[url] = h5py.File(self._get_local_path(url), "r")
+            return self._handles[url]
+
+    def get_dataset(self, url: str, key: str, use_memmap: bool = True):
+        """Returns a memory map over `key` if its layout allows it and `use_memmap` is set, else the h5py dataset."""
+        h5_file = self.get(url)
+        if not use_memmap:
+            return h5_file[key]
+        with self._lock:
+            if (url, key) not in self._memmaps:
+                self._memmaps[(url, key)] = get_memmap(h5_file, key)
+            memmap = self._memmaps[(url, key)]
+        return memmap if memmap is not None else h5_file[key]
+
+    def close(self):
+        with self._lock:
+            for h5_file in self._handles.values():
+                h5_file.close()
+            self._handles = {}
+            self._memmaps = {}
+            if self._tmpdir is not None:
+                shutil.rmtree(self._tmpdir, ignore_errors=True)
+                self._tmpdir = None
+
+    def _get_local_path(self, url: str) -> str:
+        if not has_remote_protocol(url):
+            _, path = get_fs_and_path(url)
+            return path
+
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp()
+        local_path = os.path.join(self._tmpdir, f"{len(self._handles)}_{os.path.basename(url)}")
+        fs, path = get_fs_and_path(url)
+        fs.get(path, local_path)
+        return local_path
+
+    def _reset(self):
+        # drop references without closing, the handles and downloaded files still belong to the parent process
+        self._handles = {}
+        self._memmaps = {}
+        self._tmpdir = None
+        self._pid = os.getpid()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -77,4 +77,7 @@ def to_inference_model_input_from_series(
         return [torch.tensor(create_vector_from_datetime_obj(datetime.strptime(v, datetime_format))) for v in s]
     elif feature_type in FEATURES_TO_CAST_AS_STRINGS:
         return s.astype(str).to_list()
+    if s.dtype == object:
+        # numerical values read as strings, e.g. from a csv file or a request form
+        s = pd.to_numeric(s)
     return torch.from_numpy(s.to_numpy())
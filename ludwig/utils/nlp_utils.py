@@ -15,6 +15,9 @@
 # ==============================================================================
 import logging
 import sys
+from typing import List
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +130,9 @@ default_characters = [
 ]
 punctuation = {".", ",", "@", "$", "%", "/", ":", ";", "+", "="}
 
+# Number of texts tokenized together by `process_texts`.
+DEFAULT_BATCH_SIZE = 1000
+
 
 def load_nlp_pipeline(language="xx"):
     if language not in language_module_registry:
@@ -194,6 +200,63 @@ def process_text(
     ]
 
 
+def filter_mask(
+    doc, filter_numbers=False, filter_punctuation=False, filter_short_tokens=False, filter_stopwords=False
+) -> np.ndarray:
+    """Returns the mask of the tokens of `doc` passing `pass_filters`, computed over the whole doc at once.
+
+    The filters are applied to the arrays of token attributes of the doc rather than token by token.
+    """
+    from spacy.attrs import IS_STOP, LENGTH, LIKE_NUM, ORTH
+
+    attributes = doc.to_array([LIKE_NUM, ORTH, LENGTH, IS_STOP]).reshape(len(doc), 4)
+    mask = np.ones(len(doc), dtype=bool)
+    if filter_numbers:
+        mask &= attributes[:, 0] == 0
+    if filter_punctuation:
+        # punctuation is looked up once per distinct token
+        orths, inverse = np.unique(attributes[:, 1], return_inverse=True)
+        has_punctuation = np.array([bool(set(doc.vocab.strings[orth]) & punctuation) for orth in orths.tolist()])
+        mask &= ~has_punctuation.astype(bool)[inverse]
+    if filter_short_tokens:
+        mask &= attributes[:, 2] > 2
+    if filter_stopwords:
+        mask &= attributes[:, 3] == 0
+    return mask
+
+
+def process_texts(
+    texts: List[str],
+    nlp_pipeline,
+    return_lemma=False,
+    filter_numbers=False,
+    filter_punctuation=False,
+    filter_short_tokens=False,
+    filter_stopwords=False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = 1,
+) -> List[List[str]]:
+    """Batched `process_text`, returning the tokens of every text of `texts`.
+
+    The texts are tokenized `batch_size` at a time by `nlp_pipeline.pipe` with all the components of the pipeline
+    disabled, as `process_text` only runs the tokenizer, in `n_process` processes.
+    """
+    filters = dict(
+        filter_numbers=filter_numbers,
+        filter_punctuation=filter_punctuation,
+        filter_short_tokens=filter_short_tokens,
+        filter_stopwords=filter_stopwords,
+    )
+    docs = nlp_pipeline.pipe(texts, batch_size=batch_size, n_process=n_process, disable=nlp_pipeline.pipe_names)
+    processed = []
+    for doc in docs:
+        tokens = (
+            [doc[i] for i in np.flatnonzero(filter_mask(doc, **filters)).tolist()] if any(filters.values()) else doc
+        )
+        processed.append([token.lemma_ if return_lemma else token.text for token in tokens])
+    return processed
+
+
 if __name__ == "__main__":
     text = (
         "Hello John, how are you doing my good old friend? Are you still number 732 in the list? Did you pay $32.43 or "
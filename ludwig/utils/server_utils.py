@@ -1,7 +1,11 @@
+import asyncio
+import collections
 import json
+import logging
 import os
 import tempfile
-from typing import Any, Dict, Union
+import time
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -10,6 +14,8 @@ from starlette.responses import JSONResponse
 
 from ludwig.utils.data_utils import NumpyEncoder
 
+logger = logging.getLogger(__name__)
+
 
 def serialize_payload(data_source: Union[pd.DataFrame, pd.Series]) -> tuple:
     """
@@ -168,3 +174,180 @@ class NumpyJSONResponse(JSONResponse):
         return json.dumps(
             content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), cls=NumpyEncoder
         ).encode("utf-8")
+
+
+class RequestBatcher:
+    """Coalesces concurrent single-row prediction requests into batches.
+
+    Requests are queued and picked up by a single worker task, which waits for up to `max_batch_wait_ms` after the first
+    queued request to fill a batch of up to `max_batch_size` rows. The batch is predicted with one call to `predict_fn`
+    on a worker thread, so the event loop keeps accepting requests in the meantime, and the resulting rows are handed
+    back to their callers in order. When the prediction of a batch fails, its rows are predicted one by one, so that
+    only the requests of the rows failing on their own get an error.
+
+    Args:
+        predict_fn: takes a list of input rows and returns the list of corresponding output rows.
+        max_batch_size: maximum number of requests predicted together.
+        max_batch_wait_ms: maximum time to wait for more requests once a batch has been started.
+        max_queue_size: maximum number of requests waiting to be batched, further requests are rejected.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        max_batch_size: int = 32,
+        max_batch_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+    ):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait_s = max_batch_wait_ms / 1000.0
+        self.max_queue_size = max_queue_size
+        self.metrics = RequestBatcherMetrics()
+
+        self._queue = None
+        self._worker = None
+        # Requests taken off the queue by the worker and not answered yet.
+        self._batch: List[Tuple[Dict[str, Any], asyncio.Future, float]] = []
+
+    async def predict(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Queues `entry` for prediction and returns its output row once its batch has been predicted.
+
+        Raises `asyncio.QueueFull` if too many requests are already waiting.
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((entry, future, time.perf_counter()))
+        self.metrics.record_enqueue(self._queue.qsize())
+        return await future
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        # the worker may have been stopped while predicting a batch
+        self._cancel_futures([future for _, future, _ in self._batch])
+        self._batch = []
+        if self._queue is not None:
+            self._cancel_queued()
+            self._queue = None
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            # (re)start the worker on the loop serving the requests, keeping the requests queued on this loop
+            if self._queue is None or (self._worker is not None and self._worker.get_loop() is not loop):
+                if self._queue is not None:
+                    # requests queued on another loop can't be awaited from this one
+                    self._cancel_queued()
+                self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = loop.create_task(self._run())
+
+    def _cancel_queued(self):
+        futures = []
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            futures.append(future)
+        self._cancel_futures(futures)
+
+    @staticmethod
+    def _cancel_futures(futures: List[asyncio.Future]):
+        for future in futures:
+            future_loop = future.get_loop()
+            if not future.done() and not future_loop.is_closed():
+                future_loop.call_soon_threadsafe(future.cancel)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = self._batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_batch_wait_s
+            while len(requests) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    requests.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            start_time = time.perf_counter()
+            try:
+                await self._predict_batch(requests)
+            except Exception as e:
+                if len(requests) == 1:
+                    self._set_exception(requests, e)
+                    self._batch = []
+                    continue
+                # predict every row on its own, so that a malformed row only fails its own request
+                logger.warning(f"Prediction of a batch of {len(requests)} requests failed, predicting them one by one")
+                for request in requests:
+                    try:
+                        await self._predict_batch([request])
+                    except Exception as row_error:
+                        self._set_exception([request], row_error)
+
+            self._batch = []
+            end_time = time.perf_counter()
+            self.metrics.record_batch(
+                predict_ms=(end_time - start_time) * 1000.0,
+                latencies_ms=[(end_time - enqueue_time) * 1000.0 for _, _, enqueue_time in requests],
+            )
+
+    async def _predict_batch(self, requests: List[Tuple[Dict[str, Any], asyncio.Future, float]]):
+        entries = [entry for entry, _, _ in requests]
+        outputs = await asyncio.get_running_loop().run_in_executor(None, self.predict_fn, entries)
+        if len(outputs) != len(requests):
+            raise ValueError(f"Predicted {len(outputs)} output rows for {len(requests)} input rows")
+        for (_, future, _), output in zip(requests, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    @staticmethod
+    def _set_exception(requests: List[Tuple[Dict[str, Any], asyncio.Future, float]], error: Exception):
+        for _, future, _ in requests:
+            if not future.done():
+                future.set_exception(error)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return self.metrics.to_dict(self._queue.qsize() if self._queue is not None else 0)
+
+
+class RequestBatcherMetrics:
+    """Running statistics of a `RequestBatcher`, latencies are kept for the most recent `window` requests."""
+
+    def __init__(self, window: int = 1000):
+        self.num_requests = 0
+        self.num_batches = 0
+        self.max_batch_size = 0
+        self.max_queue_size = 0
+        self.total_predict_ms = 0.0
+        self.latencies_ms = collections.deque(maxlen=window)
+
+    def record_enqueue(self, queue_size: int):
+        self.max_queue_size = max(self.max_queue_size, queue_size)
+
+    def record_batch(self, predict_ms: float, latencies_ms: List[float]):
+        self.num_requests += len(latencies_ms)
+        self.num_batches += 1
+        self.max_batch_size = max(self.max_batch_size, len(latencies_ms))
+        self.total_predict_ms += predict_ms
+        self.latencies_ms.extend(latencies_ms)
+
+    def to_dict(self, queue_size: int) -> Dict[str, Any]:
+        latencies_ms = np.array(self.latencies_ms) if self.latencies_ms else np.zeros(1)
+        return {
+            "num_requests": self.num_requests,
+            "num_batches": self.num_batches,
+            "mean_batch_size": self.num_requests / self.num_batches if self.num_batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "queue_size": queue_size,
+            "max_queue_size": self.max_queue_size,
+            "mean_predict_ms": self.total_predict_ms / self.num_batches if self.num_batches else 0.0,
+            "latency_ms_p50": float(np.percentile(latencies_ms, 50)),
+            "latency_ms_p99": float(np.percentile(latencies_ms, 99)),
+        }
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import itertools
 import logging
 import re
 import unicodedata
@@ -21,11 +22,13 @@ from enum import Enum
 from typing import List, Optional, Set, Union
 
 import numpy as np
+import pandas as pd
 
 from ludwig.data.dataframe.base import DataFrameEngine
 from ludwig.data.dataframe.pandas import PANDAS
 from ludwig.utils.fs_utils import open_file
 from ludwig.utils.math_utils import int_type
+from ludwig.utils.tokenization import tokenize_batches, tokenize_column, TOKENIZER_BATCH_SIZE
 from ludwig.utils.tokenizers import get_tokenizer_from_registry
 from ludwig.utils.types import Series
 
@@ -210,6 +213,7 @@ def create_vocabulary(
     pretrained_model_name_or_path: str = None,
     ngram_size: Optional[int] = None,
     processor: DataFrameEngine = PANDAS,
+    cache_tokens: bool = False,
 ):
     """Computes a vocabulary over the provided data frame.
 
@@ -239,6 +243,9 @@ def create_vocabulary(
         pretrained_model_name_or_path: Name/path to huggingface model.
         ngram_size: Size of the n-gram when using `ngram` tokenizer.
         processor: Which processor to use to process data.
+        cache_tokens: If True, the tokenized data is kept for a subsequent `build_sequence_matrix` over the same data,
+            which then doesn't tokenize it again. Only applies to pandas data, within a
+            `tokenization.tokenized_column_cache` scope.
 
     Returns:
         Tuple of:
@@ -290,12 +297,29 @@ def create_vocabulary(
     elif vocab_file is not None:
         vocab = load_vocabulary(vocab_file)
 
-    processed_lines = data.map(lambda line: tokenizer(line.lower() if lowercase else line))
-    processed_counts = processed_lines.explode().value_counts(sort=False)
-    processed_counts = processor.compute(processed_counts)
-    unit_counts = Counter(dict(processed_counts))
-    line_length_max = processor.compute(processed_lines.map(len).max())
-    line_length_99ptile = processor.compute(processed_lines.map(len).quantile(0.99))
+    if isinstance(data, pd.Series):
+        # tokenize each row once, shared with `build_sequence_matrix`, and count the interned tokens with numpy
+        tokenized = tokenize_column(
+            data,
+            tokenizer_type,
+            lowercase=lowercase,
+            vocab_file=vocab_file,
+            pretrained_model_name_or_path=pretrained_model_name_or_path,
+            ngram_size=ngram_size,
+            processor=processor,
+            cache=cache_tokens,
+        )
+        unit_counts = Counter(dict(zip(tokenized.uniques, tokenized.counts().tolist())))
+        line_lengths = pd.Series(tokenized.lengths)
+        line_length_max = line_lengths.max()
+        line_length_99ptile = line_lengths.quantile(0.99)
+    else:
+        processed_lines = _tokenize_partitions(data, tokenizer, lowercase, processor)
+        processed_counts = processed_lines.explode().value_counts(sort=False)
+        processed_counts = processor.compute(processed_counts)
+        unit_counts = Counter(dict(processed_counts))
+        line_length_max = processor.compute(processed_lines.map(len).max())
+        line_length_99ptile = processor.compute(processed_lines.map(len).quantile(0.99))
 
     if vocab is None:
         vocab = [unit for unit, count in unit_counts.most_common(num_most_frequent)]
@@ -360,31 +384,97 @@ def create_vocabulary_single_token(
     return vocab, str2idx, str2freq
 
 
-def _get_sequence_vector(
-    sequence, tokenizer, tokenizer_type, format_dtype, unit_to_id, lowercase=True, unknown_symbol=UNKNOWN_SYMBOL
-) -> np.ndarray:
-    unit_sequence = tokenizer(sequence.lower() if lowercase else sequence)
+def _tokenize_partitions(data, tokenizer, lowercase: bool, processor: DataFrameEngine):
+    """Tokenizes the rows of every partition of `data` together, with the batch API of the tokenizer if any."""
+    return processor.map_partitions(
+        data,
+        lambda partition: pd.Series(
+            tokenize_batches(tokenizer, partition.tolist(), lowercase), index=partition.index, dtype=object
+        ),
+    )
 
+
+def _get_sequence_vector(unit_sequence, format_dtype, unit_to_id, unknown_symbol=UNKNOWN_SYMBOL) -> np.ndarray:
     unit_indices_vector = np.empty(len(unit_sequence), dtype=format_dtype)
     for i in range(len(unit_sequence)):
         curr_unit = unit_sequence[i]
-        if tokenizer_type == "hf_tokenizer":
-            unit_indices_vector[i] = curr_unit
+        if curr_unit in unit_to_id:
+            unit_indices_vector[i] = unit_to_id[curr_unit]
         else:
-            if curr_unit in unit_to_id:
-                unit_indices_vector[i] = unit_to_id[curr_unit]
-            else:
-                unit_indices_vector[i] = unit_to_id[unknown_symbol]
+            unit_indices_vector[i] = unit_to_id[unknown_symbol]
 
     # Add start and stop symbols.
-    # Huggingface's pretrained tokenizers take care of this implicitly:
+    # Huggingface's pretrained tokenizers take care of this implicitly (see `_build_hf_sequence_matrix`):
     # https://huggingface.co/docs/transformers/preprocessing
-    if tokenizer_type != "hf_tokenizer":
-        unit_indices_vector = np.append(unit_indices_vector, unit_to_id[STOP_SYMBOL])
-        unit_indices_vector = np.insert(unit_indices_vector, 0, unit_to_id[START_SYMBOL])
+    unit_indices_vector = np.append(unit_indices_vector, unit_to_id[STOP_SYMBOL])
+    unit_indices_vector = np.insert(unit_indices_vector, 0, unit_to_id[START_SYMBOL])
     return unit_indices_vector
 
 
+def _build_padded_matrix(
+    unit_ids: np.ndarray,
+    lengths: np.ndarray,
+    max_length: int,
+    pad_id: int,
+    padding: str,
+    dtype,
+    start_id: Optional[int] = None,
+    stop_id: Optional[int] = None,
+) -> np.ndarray:
+    """Scatters the flat `unit_ids` of rows of `lengths` ids each into a [num_rows, max_length] matrix.
+
+    Every row is wrapped in `start_id` and `stop_id` if given, truncated to `max_length` and padded with `pad_id` on the
+    right, or on the left if `padding` is 'left'.
+    """
+    add_start_stop = start_id is not None
+    num_rows = len(lengths)
+    row_lengths = lengths + 2 if add_start_stop else lengths
+    row_starts = np.cumsum(row_lengths) - row_lengths
+
+    sequences = np.empty(int(row_lengths.sum()), dtype=dtype)
+    if add_start_stop:
+        unit_starts = np.cumsum(lengths) - lengths
+        unit_positions = np.arange(len(unit_ids)) + np.repeat(row_starts - unit_starts + 1, lengths)
+        sequences[unit_positions] = unit_ids
+        sequences[row_starts] = start_id
+        sequences[row_starts + row_lengths - 1] = stop_id
+    else:
+        sequences[:] = unit_ids
+
+    rows = np.repeat(np.arange(num_rows), row_lengths)
+    columns = np.arange(len(sequences)) - np.repeat(row_starts, row_lengths)
+    keep = columns < max_length
+    if padding == "left":
+        columns += np.repeat(max_length - np.minimum(row_lengths, max_length), row_lengths)
+
+    matrix = np.full((num_rows, max_length), pad_id, dtype=dtype)
+    matrix[rows[keep], columns[keep]] = sequences[keep]
+    return matrix
+
+
+def _build_hf_sequence_matrix(
+    sequences: pd.Series,
+    tokenizer,
+    max_length: int,
+    pad_id: int,
+    padding: str,
+    dtype,
+    lowercase: bool = True,
+) -> pd.Series:
+    """Encodes `sequences` with a huggingface tokenizer `TOKENIZER_BATCH_SIZE` rows at a time, scattering the ids
+    of every batch straight into the rows of a [num_rows, max_length] matrix padded with `pad_id`."""
+    matrix = np.empty((len(sequences), max_length), dtype=dtype)
+    lines = sequences.tolist()
+    for start in range(0, len(lines), TOKENIZER_BATCH_SIZE):
+        id_lists = tokenize_batches(tokenizer, lines[start : start + TOKENIZER_BATCH_SIZE], lowercase)
+        lengths = np.fromiter((len(ids) for ids in id_lists), np.int64, len(id_lists))
+        unit_ids = np.fromiter(itertools.chain.from_iterable(id_lists), dtype, int(lengths.sum()))
+        matrix[start : start + len(id_lists)] = _build_padded_matrix(
+            unit_ids, lengths, max_length, pad_id, padding, dtype
+        )
+    return pd.Series(list(matrix), index=sequences.index)
+
+
 def build_sequence_matrix(
     sequences,  # pd.core.series.Series
     inverse_vocabulary,
@@ -397,23 +487,63 @@ def build_sequence_matrix(
     tokenizer_vocab_file=None,
     pretrained_model_name_or_path=None,
     processor=PANDAS,
+    ngram_size=None,
 ) -> np.ndarray:
+    format_dtype = int_type(len(inverse_vocabulary) - 1)
+
+    if isinstance(sequences, pd.Series):
+        tokenized = tokenize_column(
+            sequences,
+            tokenizer_type,
+            lowercase=lowercase,
+            vocab_file=tokenizer_vocab_file,
+            pretrained_model_name_or_path=pretrained_model_name_or_path,
+            ngram_size=ngram_size,
+            processor=processor,
+        )
+        if tokenizer_type == "hf_tokenizer":
+            # Huggingface's pretrained tokenizers already produce ids, including start and stop symbols
+            unit_ids = tokenized.uniques.astype(format_dtype)[tokenized.codes]
+            start_id, stop_id = None, None
+        else:
+            unit_ids = tokenized.to_ids(inverse_vocabulary, inverse_vocabulary[unknown_symbol], format_dtype)
+            start_id, stop_id = inverse_vocabulary[START_SYMBOL], inverse_vocabulary[STOP_SYMBOL]
+        matrix = _build_padded_matrix(
+            unit_ids,
+            tokenized.lengths,
+            int(length_limit),
+            inverse_vocabulary[padding_symbol],
+            padding,
+            format_dtype,
+            start_id=start_id,
+            stop_id=stop_id,
+        )
+        return pd.Series(list(matrix), index=sequences.index)
+
     tokenizer = get_tokenizer_from_registry(tokenizer_type)(
         vocab_file=tokenizer_vocab_file,
         pretrained_model_name_or_path=pretrained_model_name_or_path,
+        ngram_size=ngram_size,
     )
 
-    format_dtype = int_type(len(inverse_vocabulary) - 1)
+    if tokenizer_type == "hf_tokenizer":
+        # Huggingface's pretrained tokenizers already produce ids, encode whole partitions in batches
+        return processor.map_partitions(
+            sequences,
+            lambda partition: _build_hf_sequence_matrix(
+                partition,
+                tokenizer,
+                int(length_limit),
+                inverse_vocabulary[padding_symbol],
+                padding,
+                format_dtype,
+                lowercase=lowercase,
+            ),
+        )
 
-    unit_vectors = sequences.map(
-        lambda sequence: _get_sequence_vector(
-            sequence,
-            tokenizer,
-            tokenizer_type,
-            format_dtype,
-            inverse_vocabulary,
-            lowercase=lowercase,
-            unknown_symbol=unknown_symbol,
+    unit_vectors = _tokenize_partitions(sequences, tokenizer, lowercase, processor).map(
+        lambda unit_sequence: _get_sequence_vector(
+            unit_sequence, format_dtype, inverse_vocabulary, unknown_symbol=unknown_symbol
         )
     )
 
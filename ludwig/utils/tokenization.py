@@ -0,0 +1,233 @@
+#! /usr/bin/env python
+# Copyright (c) 2022 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tokenization of whole text columns on the local (pandas) backend.
+
+A column is tokenized exactly once into a `TokenizedColumn`: the tokens of all rows interned into an array of unique
+tokens plus a flat array of codes into it. Vocabulary counts and the mapping of tokens to vocabulary ids are then
+vectorized numpy operations over the codes instead of per-token Python dict lookups. Large columns are sharded across
+the workers of the dataframe engine, if its parallelism allows it.
+"""
+import collections
+import contextlib
+import contextvars
+import functools
+import hashlib
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ludwig.data.dataframe.base import DataFrameEngine
+from ludwig.data.dataframe.pandas import PANDAS, PandasEngine
+from ludwig.utils.tokenizers import BaseTokenizer, get_tokenizer_from_registry
+
+logger = logging.getLogger(__name__)
+
+# Number of rows passed at once to the batch API of the tokenizers.
+TOKENIZER_BATCH_SIZE = 4096
+
+
+@dataclass
+class TokenizedColumn:
+    """The tokens of every row of a column.
+
+    Attributes:
+        codes: Flat array with the tokens of all rows, one after the other, as indices into `uniques`.
+        uniques: Array of the distinct tokens, in order of first appearance.
+        lengths: Number of tokens of every row.
+    """
+
+    codes: np.ndarray
+    uniques: np.ndarray
+    lengths: np.ndarray
+
+    def counts(self) -> np.ndarray:
+        """Returns the number of occurrences of every token in `uniques`."""
+        return np.bincount(self.codes, minlength=len(self.uniques))
+
+    def to_ids(self, unit_to_id: Dict[Any, int], unknown_id: int, dtype) -> np.ndarray:
+        """Maps the tokens to their ids in `unit_to_id`, tokens missing from it are mapped to `unknown_id`."""
+        unique_ids = np.fromiter((unit_to_id.get(unit, unknown_id) for unit in self.uniques), dtype, len(self.uniques))
+        return unique_ids[self.codes]
+
+
+class _TokenizedColumnCache:
+    """Hands over the tokens computed while building the vocabulary of a column to the build of its matrix.
+
+    Entries are looked up by a fingerprint of the column contents, as the column is usually a different Series object by
+    the time its matrix is built. An entry is dropped as soon as it is used, and only the most recent `max_entries` are
+    kept around. A cache only lives as long as its `tokenized_column_cache` scope.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple, TokenizedColumn] = collections.OrderedDict()
+
+    def put(self, key: Tuple, tokenized: TokenizedColumn):
+        with self._lock:
+            self._entries[key] = tokenized
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Tuple) -> Optional[TokenizedColumn]:
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Cache of the innermost `tokenized_column_cache` scope, if any.
+_active_cache: contextvars.ContextVar[Optional[_TokenizedColumnCache]] = contextvars.ContextVar(
+    "tokenized_column_cache", default=None
+)
+
+
+@contextlib.contextmanager
+def tokenized_column_cache() -> Iterator[_TokenizedColumnCache]:
+    """Scope within which `tokenize_column` keeps the columns it is asked to cache, all dropped on exit.
+
+    Wraps the preprocessing of a dataset, so that the tokens of its columns don't outlive it.
+    """
+    cache = _TokenizedColumnCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+        cache.clear()
+
+
+def tokenize_column(
+    data: pd.Series,
+    tokenizer_type: str,
+    lowercase: bool = True,
+    vocab_file: Optional[str] = None,
+    pretrained_model_name_or_path: Optional[str] = None,
+    ngram_size: Optional[int] = None,
+    processor: DataFrameEngine = PANDAS,
+    cache: bool = False,
+) -> TokenizedColumn:
+    """Tokenizes every row of `data`.
+
+    Args:
+        data: Series of strings.
+        tokenizer_type: Tokenizer registry value or 'hf_tokenizer' for huggingface.
+        lowercase: Whether to lowercase the strings before tokenizing them.
+        vocab_file: Vocabulary file of the tokenizer.
+        pretrained_model_name_or_path: Name/path to huggingface model.
+        ngram_size: Size of the n-gram when using the `ngram` tokenizer.
+        processor: Dataframe engine of the backend, the column is sharded across its workers. Sequential unless its
+            parallelism is set.
+        cache: If True and within a `tokenized_column_cache` scope, the result is kept so that the next call for the
+            same column and tokenizer returns it without tokenizing again. Otherwise a result kept by a previous call is
+            used up.
+
+    Returns:
+        The tokenized column.
+    """
+    tokenizer_args = (tokenizer_type, vocab_file, pretrained_model_name_or_path, ngram_size)
+    active_cache = _active_cache.get()
+    tokenized = None
+    if active_cache is not None:
+        key = (_fingerprint(data), lowercase) + tokenizer_args
+        tokenized = active_cache.pop(key)
+    if tokenized is None:
+        if not isinstance(processor, PandasEngine):
+            # the column is an in-memory pandas Series, which only the local engine can shard
+            processor = PANDAS
+        tokenized = _tokenize(data, tokenizer_args, lowercase, processor)
+    if cache and active_cache is not None:
+        active_cache.put(key, tokenized)
+    return tokenized
+
+
+def tokenize_batches(tokenizer, lines: List[str], lowercase: bool = True) -> List[List[Any]]:
+    """Tokenizes `lines` `TOKENIZER_BATCH_SIZE` rows at a time with the batch API of the tokenizer, if any.
+
+    Args:
+        tokenizer: Tokenizer from the registry.
+        lines: Strings to tokenize.
+        lowercase: Whether to lowercase the strings before tokenizing them.
+
+    Returns:
+        The tokens of every line.
+    """
+    if lowercase:
+        lines = [line.lower() for line in lines]
+    if not isinstance(tokenizer, BaseTokenizer):
+        return [tokenizer(line) for line in lines]
+
+    token_lists = []
+    for start in range(0, len(lines), TOKENIZER_BATCH_SIZE):
+        token_lists.extend(tokenizer.tokenize_batch(lines[start : start + TOKENIZER_BATCH_SIZE]))
+    return token_lists
+
+
+def _fingerprint(data: pd.Series) -> Tuple[int, str]:
+    row_hashes = pd.util.hash_pandas_object(data, index=False).values
+    return len(data), hashlib.sha1(row_hashes.tobytes()).hexdigest()
+
+
+def _tokenize(data: pd.Series, tokenizer_args: Tuple, lowercase: bool, processor: PandasEngine) -> TokenizedColumn:
+    def tokenize_shard(shard: pd.Series) -> pd.Series:
+        return pd.Series([_tokenize_shard(shard.tolist(), tokenizer_args, lowercase)])
+
+    tokenized_shards = processor.map_partitions(data, tokenize_shard).tolist()
+    if len(tokenized_shards) == 1:
+        return tokenized_shards[0]
+    return _merge_shards(tokenized_shards)
+
+
+def _tokenize_shard(lines: List[str], tokenizer_args: Tuple, lowercase: bool) -> TokenizedColumn:
+    token_lists = tokenize_batches(_get_tokenizer(*tokenizer_args), lines, lowercase)
+    lengths = np.fromiter((len(tokens) for tokens in token_lists), np.int64, len(token_lists))
+
+    tokens = np.empty(int(lengths.sum()), dtype=object)
+    tokens[:] = list(itertools.chain.from_iterable(token_lists))
+    codes, uniques = pd.factorize(tokens)
+    return TokenizedColumn(codes=codes.astype(np.int64), uniques=np.asarray(uniques, dtype=object), lengths=lengths)
+
+
+def _merge_shards(tokenized_shards: List[TokenizedColumn]) -> TokenizedColumn:
+    # interning the concatenated per-shard uniques keeps the global order of first appearance
+    shard_codes, uniques = pd.factorize(np.concatenate([shard.uniques for shard in tokenized_shards]))
+    codes = []
+    offset = 0
+    for shard in tokenized_shards:
+        codes.append(shard_codes[offset : offset + len(shard.uniques)][shard.codes])
+        offset += len(shard.uniques)
+    return TokenizedColumn(
+        codes=np.concatenate(codes).astype(np.int64),
+        uniques=np.asarray(uniques, dtype=object),
+        lengths=np.concatenate([shard.lengths for shard in tokenized_shards]),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_tokenizer(tokenizer_type, vocab_file, pretrained_model_name_or_path, ngram_size):
+    # built (once) in every worker rather than pickled, not every tokenizer can be pickled
+    return get_tokenizer_from_registry(tokenizer_type)(
+        vocab_file=vocab_file,
+        pretrained_model_name_or_path=pretrained_model_name_or_path,
+        ngram_size=ngram_size,
+    )
@@ -21,7 +21,7 @@ from typing import Any, Dict, List, Optional, Union
 import torch
 
 from ludwig.utils.data_utils import load_json
-from ludwig.utils.nlp_utils import load_nlp_pipeline, process_text
+from ludwig.utils.nlp_utils import load_nlp_pipeline, process_text, process_texts
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +53,10 @@ class BaseTokenizer:
     def __call__(self, text: str):
         pass
 
+    def tokenize_batch(self, texts: List[str]) -> List[Any]:
+        """Tokenizes every text, overridden by tokenizers processing batches faster than text by text."""
+        return [self(text) for text in texts]
+
 
 class CharactersToListTokenizer(BaseTokenizer):
     def __call__(self, text):
@@ -166,630 +170,594 @@ class StrippedStringToListTokenizer(BaseTokenizer):
         return [text.strip()]
 
 
-class EnglishTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("en"))
+class SpacyTokenizer(BaseTokenizer):
+    """Tokenizes with the spaCy pipeline of `language`, returning the text or the lemma of the tokens passing the
+    filters."""
 
+    language = "xx"
+    return_lemma = False
+    filter_numbers = False
+    filter_punctuation = False
+    filter_short_tokens = False
+    filter_stopwords = False
 
-class EnglishFilterTokenizer(BaseTokenizer):
     def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("en"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
+        return process_text(text, load_nlp_pipeline(self.language), **self._process_args())
+
+    def tokenize_batch(self, texts: List[str]) -> List[List[str]]:
+        return process_texts(texts, load_nlp_pipeline(self.language), **self._process_args())
+
+    def _process_args(self) -> Dict[str, bool]:
+        return dict(
+            return_lemma=self.return_lemma,
+            filter_numbers=self.filter_numbers,
+            filter_punctuation=self.filter_punctuation,
+            filter_short_tokens=self.filter_short_tokens,
+            filter_stopwords=self.filter_stopwords,
         )
 
 
-class EnglishRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("en"), filter_stopwords=True)
+class EnglishTokenizer(SpacyTokenizer):
+    language = "en"
 
 
-class EnglishLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        process_text(text, load_nlp_pipeline("en"), return_lemma=True)
+class EnglishFilterTokenizer(SpacyTokenizer):
+    language = "en"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class EnglishLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("en"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class EnglishRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "en"
+    filter_stopwords = True
 
 
-class EnglishLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("en"), return_lemma=True, filter_stopwords=True)
+class EnglishLemmatizeTokenizer(SpacyTokenizer):
+    language = "en"
+    return_lemma = True
 
 
-class ItalianTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("it"))
+class EnglishLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "en"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class ItalianFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("it"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class EnglishLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "en"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class ItalianRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("it"), filter_stopwords=True)
+class ItalianTokenizer(SpacyTokenizer):
+    language = "it"
 
 
-class ItalianLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("it"), return_lemma=True)
+class ItalianFilterTokenizer(SpacyTokenizer):
+    language = "it"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class ItalianLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("it"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class ItalianRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "it"
+    filter_stopwords = True
 
 
-class ItalianLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("it"), return_lemma=True, filter_stopwords=True)
+class ItalianLemmatizeTokenizer(SpacyTokenizer):
+    language = "it"
+    return_lemma = True
 
 
-class SpanishTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("es"))
+class ItalianLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "it"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class SpanishFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("es"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class ItalianLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "it"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class SpanishRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("es"), filter_stopwords=True)
+class SpanishTokenizer(SpacyTokenizer):
+    language = "es"
 
 
-class SpanishLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("es"), return_lemma=True)
+class SpanishFilterTokenizer(SpacyTokenizer):
+    language = "es"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class SpanishLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("es"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class SpanishRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "es"
+    filter_stopwords = True
 
 
-class SpanishLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("es"), return_lemma=True, filter_stopwords=True)
+class SpanishLemmatizeTokenizer(SpacyTokenizer):
+    language = "es"
+    return_lemma = True
 
 
-class GermanTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("de"))
+class SpanishLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "es"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class GermanFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("de"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class SpanishLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "es"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class GermanRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("de"), filter_stopwords=True)
+class GermanTokenizer(SpacyTokenizer):
+    language = "de"
 
 
-class GermanLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("de"), return_lemma=True)
+class GermanFilterTokenizer(SpacyTokenizer):
+    language = "de"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class GermanLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("de"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class GermanRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "de"
+    filter_stopwords = True
 
 
-class GermanLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("de"), return_lemma=True, filter_stopwords=True)
+class GermanLemmatizeTokenizer(SpacyTokenizer):
+    language = "de"
+    return_lemma = True
 
 
-class FrenchTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("fr"))
+class GermanLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "de"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class FrenchFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("fr"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class GermanLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "de"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class FrenchRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("fr"), filter_stopwords=True)
+class FrenchTokenizer(SpacyTokenizer):
+    language = "fr"
 
 
-class FrenchLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("fr"), return_lemma=True)
+class FrenchFilterTokenizer(SpacyTokenizer):
+    language = "fr"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class FrenchLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("fr"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class FrenchRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "fr"
+    filter_stopwords = True
 
 
-class FrenchLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("fr"), return_lemma=True, filter_stopwords=True)
+class FrenchLemmatizeTokenizer(SpacyTokenizer):
+    language = "fr"
+    return_lemma = True
 
 
-class PortugueseTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pt"))
+class FrenchLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "fr"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class PortugueseFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("pt"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class FrenchLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "fr"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class PortugueseRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pt"), filter_stopwords=True)
+class PortugueseTokenizer(SpacyTokenizer):
+    language = "pt"
 
 
-class PortugueseLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pt"), return_lemma=True)
+class PortugueseFilterTokenizer(SpacyTokenizer):
+    language = "pt"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class PortugueseLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("pt"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class PortugueseRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "pt"
+    filter_stopwords = True
 
 
-class PortugueseLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pt"), return_lemma=True, filter_stopwords=True)
+class PortugueseLemmatizeTokenizer(SpacyTokenizer):
+    language = "pt"
+    return_lemma = True
 
 
-class DutchTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nl"))
+class PortugueseLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "pt"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class DutchFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("nl"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class PortugueseLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "pt"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class DutchRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nl"), filter_stopwords=True)
+class DutchTokenizer(SpacyTokenizer):
+    language = "nl"
 
 
-class DutchLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nl"), return_lemma=True)
+class DutchFilterTokenizer(SpacyTokenizer):
+    language = "nl"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class DutchLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("nl"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class DutchRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "nl"
+    filter_stopwords = True
 
 
-class DutchLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nl"), return_lemma=True, filter_stopwords=True)
+class DutchLemmatizeTokenizer(SpacyTokenizer):
+    language = "nl"
+    return_lemma = True
 
 
-class GreekTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("el"))
+class DutchLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "nl"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class GreekFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("el"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class DutchLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "nl"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class GreekRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("el"), filter_stopwords=True)
+class GreekTokenizer(SpacyTokenizer):
+    language = "el"
 
 
-class GreekLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("el"), return_lemma=True)
+class GreekFilterTokenizer(SpacyTokenizer):
+    language = "el"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class GreekLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("el"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class GreekRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "el"
+    filter_stopwords = True
 
 
-class GreekLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("el"), return_lemma=True, filter_stopwords=True)
+class GreekLemmatizeTokenizer(SpacyTokenizer):
+    language = "el"
+    return_lemma = True
 
 
-class NorwegianTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nb"))
+class GreekLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "el"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class NorwegianFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("nb"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class GreekLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "el"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class NorwegianRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nb"), filter_stopwords=True)
+class NorwegianTokenizer(SpacyTokenizer):
+    language = "nb"
 
 
-class NorwegianLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nb"), return_lemma=True)
+class NorwegianFilterTokenizer(SpacyTokenizer):
+    language = "nb"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class NorwegianLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("nb"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class NorwegianRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "nb"
+    filter_stopwords = True
 
 
-class NorwegianLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("nb"), return_lemma=True, filter_stopwords=True)
+class NorwegianLemmatizeTokenizer(SpacyTokenizer):
+    language = "nb"
+    return_lemma = True
 
 
-class LithuanianTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("lt"))
+class NorwegianLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "nb"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class LithuanianFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("lt"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class NorwegianLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "nb"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class LithuanianRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("lt"), filter_stopwords=True)
+class LithuanianTokenizer(SpacyTokenizer):
+    language = "lt"
 
 
-class LithuanianLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("lt"), return_lemma=True)
+class LithuanianFilterTokenizer(SpacyTokenizer):
+    language = "lt"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class LithuanianLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("lt"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class LithuanianRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "lt"
+    filter_stopwords = True
 
 
-class LithuanianLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("lt"), return_lemma=True, filter_stopwords=True)
+class LithuanianLemmatizeTokenizer(SpacyTokenizer):
+    language = "lt"
+    return_lemma = True
 
 
-class DanishTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("da"))
+class LithuanianLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "lt"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class DanishFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("da"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class LithuanianLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "lt"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class DanishRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("da"), filter_stopwords=True)
+class DanishTokenizer(SpacyTokenizer):
+    language = "da"
 
 
-class DanishLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("da"), return_lemma=True)
+class DanishFilterTokenizer(SpacyTokenizer):
+    language = "da"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class DanishLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("da"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class DanishRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "da"
+    filter_stopwords = True
 
 
-class DanishLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("da"), return_lemma=True, filter_stopwords=True)
+class DanishLemmatizeTokenizer(SpacyTokenizer):
+    language = "da"
+    return_lemma = True
 
 
-class PolishTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pl"))
+class DanishLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "da"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class PolishFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("pl"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class DanishLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "da"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class PolishRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pl"), filter_stopwords=True)
+class PolishTokenizer(SpacyTokenizer):
+    language = "pl"
 
 
-class PolishLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pl"), return_lemma=True)
+class PolishFilterTokenizer(SpacyTokenizer):
+    language = "pl"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class PolishLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("pl"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class PolishRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "pl"
+    filter_stopwords = True
 
 
-class PolishLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("pl"), return_lemma=True, filter_stopwords=True)
+class PolishLemmatizeTokenizer(SpacyTokenizer):
+    language = "pl"
+    return_lemma = True
 
 
-class RomanianTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("ro"))
+class PolishLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "pl"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class RomanianFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("ro"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class PolishLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "pl"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class RomanianRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("ro"), filter_stopwords=True)
+class RomanianTokenizer(SpacyTokenizer):
+    language = "ro"
 
 
-class RomanianLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("ro"), return_lemma=True)
+class RomanianFilterTokenizer(SpacyTokenizer):
+    language = "ro"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class RomanianLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("ro"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class RomanianRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "ro"
+    filter_stopwords = True
 
 
-class RomanianLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("ro"), return_lemma=True, filter_stopwords=True)
+class RomanianLemmatizeTokenizer(SpacyTokenizer):
+    language = "ro"
+    return_lemma = True
 
 
-class JapaneseTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("jp"))
+class RomanianLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "ro"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class JapaneseFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("jp"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class RomanianLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "ro"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class JapaneseRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("jp"), filter_stopwords=True)
+class JapaneseTokenizer(SpacyTokenizer):
+    language = "jp"
 
 
-class JapaneseLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("jp"), return_lemma=True)
+class JapaneseFilterTokenizer(SpacyTokenizer):
+    language = "jp"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class JapaneseLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("jp"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class JapaneseRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "jp"
+    filter_stopwords = True
 
 
-class JapaneseLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("jp"), return_lemma=True, filter_stopwords=True)
+class JapaneseLemmatizeTokenizer(SpacyTokenizer):
+    language = "jp"
+    return_lemma = True
 
 
-class ChineseTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("zh"))
+class JapaneseLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "jp"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class ChineseFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("zh"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class JapaneseLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "jp"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class ChineseRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("zh"), filter_stopwords=True)
+class ChineseTokenizer(SpacyTokenizer):
+    language = "zh"
 
 
-class ChineseLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("zh"), return_lemma=True)
+class ChineseFilterTokenizer(SpacyTokenizer):
+    language = "zh"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class ChineseLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("zh"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class ChineseRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "zh"
+    filter_stopwords = True
 
 
-class ChineseLemmatizeRemoveStopwordsFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("zh"), return_lemma=True, filter_stopwords=True)
+class ChineseLemmatizeTokenizer(SpacyTokenizer):
+    language = "zh"
+    return_lemma = True
 
 
-class MultiTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("xx"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class ChineseLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "zh"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class MultiFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text, load_nlp_pipeline("xx"), filter_numbers=True, filter_punctuation=True, filter_short_tokens=True
-        )
+class ChineseLemmatizeRemoveStopwordsFilterTokenizer(SpacyTokenizer):
+    language = "zh"
+    return_lemma = True
+    filter_stopwords = True
 
 
-class MultiRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("xx"), filter_stopwords=True)
+class MultiTokenizer(SpacyTokenizer):
+    language = "xx"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class MultiLemmatizeTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("xx"), return_lemma=True)
+class MultiFilterTokenizer(SpacyTokenizer):
+    language = "xx"
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
 
 
-class MultiLemmatizeFilterTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(
-            text,
-            load_nlp_pipeline("xx"),
-            return_lemma=True,
-            filter_numbers=True,
-            filter_punctuation=True,
-            filter_short_tokens=True,
-        )
+class MultiRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "xx"
+    filter_stopwords = True
 
 
-class MultiLemmatizeRemoveStopwordsTokenizer(BaseTokenizer):
-    def __call__(self, text):
-        return process_text(text, load_nlp_pipeline("xx"), return_lemma=True, filter_stopwords=True)
+class MultiLemmatizeTokenizer(SpacyTokenizer):
+    language = "xx"
+    return_lemma = True
+
+
+class MultiLemmatizeFilterTokenizer(SpacyTokenizer):
+    language = "xx"
+    return_lemma = True
+    filter_numbers = True
+    filter_punctuation = True
+    filter_short_tokens = True
+
+
+class MultiLemmatizeRemoveStopwordsTokenizer(SpacyTokenizer):
+    language = "xx"
+    return_lemma = True
+    filter_stopwords = True
 
 
 class HFTokenizer(BaseTokenizer):
@@ -804,6 +772,10 @@ class HFTokenizer(BaseTokenizer):
     def __call__(self, text):
         return self.tokenizer.encode(text, truncation=True)
 
+    def tokenize_batch(self, texts: List[str]) -> List[List[int]]:
+        # fast tokenizers encode the whole batch at once, in parallel
+        return self.tokenizer(texts, truncation=True)["input_ids"]
+
     def get_vocab(self):
         return self.tokenizer.get_vocab()
 
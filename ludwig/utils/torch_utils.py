@@ -3,7 +3,7 @@ import os
 import warnings
 from abc import abstractmethod
 from functools import lru_cache
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import torch
 from torch import nn
@@ -37,6 +37,38 @@ def place_on_device(x, device):
         return x
 
 
+MIXED_PRECISION_DTYPES = {"bf16": torch.bfloat16, "fp16": torch.float16}
+
+
+def get_autocast_dtype(mixed_precision: Optional[str], device) -> Optional[torch.dtype]:
+    """Returns the dtype to autocast to for `mixed_precision` ('bf16', 'fp16' or None) on `device`.
+
+    None means running in full precision.
+    """
+    if mixed_precision is None:
+        return None
+    if mixed_precision not in MIXED_PRECISION_DTYPES:
+        raise ValueError(
+            f"Invalid mixed precision: {mixed_precision}, expected one of: {list(MIXED_PRECISION_DTYPES.keys())}"
+        )
+
+    dtype = MIXED_PRECISION_DTYPES[mixed_precision]
+    if dtype == torch.float16 and torch.device(device).type == "cpu":
+        warnings.warn("fp16 mixed precision requires a GPU, running in full precision. Use bf16 on CPU instead.")
+        return None
+    return dtype
+
+
+def autocast(device, dtype: Optional[torch.dtype]) -> torch.autocast:
+    """Returns a context running the ops on `device` in mixed precision with `dtype`, a no-op for None."""
+    return torch.autocast(torch.device(device).type, dtype=dtype, enabled=dtype is not None)
+
+
+def cast_to_float32(tensors: Dict[str, torch.Tensor]) -> Dict[str, torch.Tensor]:
+    """Casts the floating point tensors of a dict of outputs computed in mixed precision back to float32."""
+    return {k: v.float() if isinstance(v, torch.Tensor) and v.is_floating_point() else v for k, v in tensors.items()}
+
+
 def sequence_length_2D(sequence: torch.Tensor) -> torch.Tensor:
     """Returns the number of non-padding elements per sequence in batch.
 
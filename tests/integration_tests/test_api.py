@@ -17,6 +17,7 @@ import os
 import shutil
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 import torch
@@ -24,6 +25,7 @@ import torch
 from ludwig.api import LudwigModel
 from ludwig.callbacks import Callback
 from ludwig.constants import ENCODER, TRAINER, TYPE
+from ludwig.data.dataframe.pandas import PANDAS
 from ludwig.globals import MODEL_HYPERPARAMETERS_FILE_NAME
 from ludwig.models.inference import InferenceModule
 from ludwig.utils.data_utils import read_csv
@@ -33,6 +35,7 @@ from tests.integration_tests.utils import (
     generate_data,
     get_weights,
     image_feature,
+    number_feature,
     run_api_experiment,
     sequence_feature,
     text_feature,
@@ -613,6 +616,49 @@ def test_api_callbacks_fixed_train_steps_less_than_one_epoch(tmpdir, csv_filenam
     assert mock_callback.on_eval_end.call_count == train_steps // steps_per_checkpoint
 
 
+@pytest.mark.parametrize("output_format", ["parquet", "csv"])
+@pytest.mark.parametrize("data_format", ["csv", "parquet"])
+def test_api_predict_streaming(tmpdir, data_format, output_format):
+    input_features = [category_feature(encoder={"vocab_size": 5}), number_feature()]
+    output_features = [
+        category_feature(decoder={"vocab_size": 3}, output_feature=True),
+        number_feature(output_feature=True),
+    ]
+
+    data_csv = generate_data(input_features, output_features, os.path.join(tmpdir, "dataset.csv"), num_examples=50)
+    dataset = data_csv
+    if data_format == "parquet":
+        dataset = os.path.join(tmpdir, "dataset.parquet")
+        read_csv(data_csv).to_parquet(dataset)
+
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        TRAINER: {"epochs": 1},
+    }
+    model = LudwigModel(config)
+    model.train(dataset=data_csv, output_directory=tmpdir)
+    expected_df, _ = model.predict(dataset=data_csv)
+
+    output_path = os.path.join(tmpdir, "streamed", f"predictions.{output_format}")
+    os.makedirs(os.path.dirname(output_path))
+    stats = model.predict_streaming(dataset=dataset, output_path=output_path, chunk_size=16)
+    assert stats.rows == len(expected_df)
+    assert stats.chunks == 4
+    assert stats.rows_per_second > 0
+
+    if output_format == "parquet":
+        output_df = PANDAS.read_predictions(output_path)
+    else:
+        output_df = pd.read_csv(output_path)
+    assert list(output_df.columns) == list(expected_df.columns)
+
+    category_predictions = f"{output_features[0]['name']}_predictions"
+    number_predictions = f"{output_features[1]['name']}_predictions"
+    assert output_df[category_predictions].astype(str).tolist() == expected_df[category_predictions].tolist()
+    assert np.allclose(output_df[number_predictions], expected_df[number_predictions], atol=1e-5)
+
+
 def test_api_save_torchscript(tmpdir):
     """Tests successful saving and loading of model in TorchScript format."""
     input_features = [category_feature(encoder={"vocab_size": 5})]
@@ -27,6 +27,7 @@ ray = pytest.importorskip("ray")
 import dask.dataframe as dd  # noqa
 
 from ludwig.automl.automl import create_auto_config, train_with_config  # noqa
+from ludwig.automl.base_config import get_dataset_info  # noqa
 from ludwig.hyperopt.execution import RayTuneExecutor  # noqa
 
 _ray200 = version.parse(ray.__version__) >= version.parse("2.0")
@@ -129,6 +130,23 @@ def test_autoconfig_preprocessing_text_image(tmpdir):
     assert config[INPUT_FEATURES][1][ENCODER][TYPE] == "stacked_cnn"
 
 
+@pytest.mark.distributed
+@pytest.mark.parametrize("max_rows", [None, 100])
+def test_get_dataset_info(max_rows):
+    df = _get_sample_df(np.array([0.6, 0.2, 0.2])).sample(frac=1, random_state=0)
+    df["id"] = np.arange(len(df))
+    df["nullbool"] = pd.Series([True, False, None, False] * (len(df) // 4), dtype=object)
+
+    dataset_info = get_dataset_info(df, max_rows=max_rows)
+    assert dataset_info.row_count == len(df)
+
+    fields = {field.name: field for field in dataset_info.fields}
+    assert fields["category"].num_distinct_values == 3
+    assert fields["id"].num_distinct_values == len(df)
+    assert fields["nullbool"].dtype == "bool"
+    assert fields["nullbool"].nonnull_values == pytest.approx(0.75 * len(df), rel=0.05)
+
+
 @pytest.mark.distributed
 @pytest.mark.parametrize("time_budget", [200, 1], ids=["high", "low"])
 def test_train_with_config(time_budget, test_data, ray_cluster_2cpu, tmpdir):
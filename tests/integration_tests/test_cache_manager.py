@@ -1,15 +1,38 @@
+import copy
 import os
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 import pytest
 
-from ludwig.constants import CHECKSUM, META, TEST, TRAINING, VALIDATION
+from ludwig.api import LudwigModel
+from ludwig.constants import (
+    CHECKSUM,
+    INPUT_FEATURES,
+    META,
+    NAME,
+    OUTPUT_FEATURES,
+    PREPROCESSING,
+    PROC_COLUMN,
+    TEST,
+    TRAINING,
+    VALIDATION,
+)
+from ludwig.data.cache.feature_cache import FeatureCache
 from ludwig.data.cache.manager import alphanum, CacheManager
 from ludwig.data.cache.types import CacheableDataframe, wrap
 from ludwig.data.dataset.pandas import PandasDatasetManager
+from ludwig.data.preprocessing import build_data
 from ludwig.globals import TRAINING_PREPROC_FILE_NAME
-from tests.integration_tests.utils import category_feature, LocalTestBackend, sequence_feature
+from tests.integration_tests.utils import (
+    binary_feature,
+    category_feature,
+    generate_data,
+    LocalTestBackend,
+    number_feature,
+    sequence_feature,
+)
 
 
 @pytest.fixture
@@ -88,7 +111,65 @@ def test_cache_dataset(use_cache_dir, use_split, use_df, tmpdir, change_test_dir
     for cache_path in cache_map.values():
         assert os.path.exists(cache_path)
 
-    cache.delete()
-
+    os.makedirs(cache.feature_cache.cache_dir)
+    cache.delete(delete_features=False)
     for cache_path in cache_map.values():
         assert not os.path.exists(cache_path)
+    assert os.path.exists(cache.feature_cache.cache_dir)
+
+    cache.delete()
+    assert not os.path.exists(cache.feature_cache.cache_dir)
+
+
+def test_cache_features(tmpdir):
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    dataset = generate_data(input_features, output_features, os.path.join(tmpdir, "dataset.csv"), num_examples=100)
+    config = {INPUT_FEATURES: input_features, OUTPUT_FEATURES: output_features}
+
+    def preprocess(config):
+        model = LudwigModel(config, backend=LocalTestBackend())
+        with mock.patch("ludwig.data.preprocessing.build_data", side_effect=build_data) as build_data_mock:
+            training_set, _, _, training_set_metadata = model.preprocess(
+                dataset=dataset, skip_save_processed_input=False
+            )
+        built_features = [feature[NAME] for feature in build_data_mock.call_args.args[1]]
+        return training_set.to_df(), training_set_metadata, built_features
+
+    df, training_set_metadata, built_features = preprocess(config)
+    assert built_features == [feature[NAME] for feature in input_features + output_features]
+    assert os.path.isdir(os.path.join(tmpdir, "dataset.features"))
+
+    # Only the feature whose preprocessing changed is processed again.
+    changed_config = copy.deepcopy(config)
+    changed_config[INPUT_FEATURES][0][PREPROCESSING] = {"normalization": "minmax"}
+    changed_df, changed_metadata, built_features = preprocess(changed_config)
+    assert built_features == [input_features[0][NAME]]
+    for feature in input_features[1:] + output_features:
+        assert changed_metadata[feature[NAME]] == training_set_metadata[feature[NAME]]
+        pd.testing.assert_series_equal(changed_df[feature[PROC_COLUMN]], df[feature[PROC_COLUMN]])
+    assert changed_metadata[input_features[0][NAME]][PREPROCESSING]["normalization"] == "minmax"
+
+
+def test_feature_cache_evicts_least_recently_used(tmpdir):
+    column = pd.Series(range(1000))
+    feature_cache = FeatureCache(os.path.join(tmpdir, "features"), max_size_bytes=None)
+    for key in ["a", "b", "c"]:
+        feature_cache.put(key, {"key": key}, column)
+    entry_size = sum(f.stat().st_size for f in Path(tmpdir, "features", "a").iterdir())
+
+    # Entries that are used are kept over those that are not.
+    os.utime(os.path.join(tmpdir, "features", "a", "metadata.json"), (0, 0))
+    os.utime(os.path.join(tmpdir, "features", "b", "metadata.json"), (1, 1))
+    assert feature_cache.get("a") is not None
+
+    feature_cache.max_size_bytes = 3 * entry_size
+    feature_cache.put("d", {"key": "d"}, column)
+    assert feature_cache.get("b") is None
+    for key in ["a", "c", "d"]:
+        metadata, cached_column = feature_cache.get(key)
+        assert metadata == {"key": key}
+        pd.testing.assert_series_equal(cached_column, column)
+
+    feature_cache.delete()
+    assert not os.path.exists(os.path.join(tmpdir, "features"))
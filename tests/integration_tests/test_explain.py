@@ -1,16 +1,20 @@
 import logging
 import os
+from unittest import mock
 
+import lightgbm as lgb
 import numpy as np
 import pandas as pd
 import pytest
+import torch
+from captum.attr import IntegratedGradients
 
 from ludwig.api import LudwigModel
 from ludwig.constants import BINARY, CATEGORY, MODEL_ECD, MODEL_GBM
-from ludwig.explain.captum import IntegratedGradientsExplainer
+from ludwig.explain.captum import integrated_gradients, IntegratedGradientsExplainer
 from ludwig.explain.explainer import Explainer
 from ludwig.explain.explanation import Explanation
-from ludwig.explain.gbm import GBMExplainer
+from ludwig.explain.gbm import GBMExplainer, get_tree_shap_values
 from tests.integration_tests.utils import (
     binary_feature,
     category_feature,
@@ -40,6 +44,39 @@ def test_explanation_dataclass():
     assert np.array_equal(explanation_array, [[1, 2, 3], [4, 5, 6]])
 
 
+@pytest.mark.parametrize("target_chunk_size", [1, 2, 5])
+def test_integrated_gradients_matches_captum(target_chunk_size):
+    torch.manual_seed(0)
+
+    class Model(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.linear = torch.nn.Linear(7, 5)
+
+        def forward(self, a, b):
+            return torch.softmax(self.linear(torch.tanh(torch.cat([a, b], dim=1))), dim=1)
+
+    model = Model()
+    inputs = [torch.randn(8, 3), torch.randn(8, 4)]
+    baselines = [torch.zeros(1, 3), torch.randn(1, 4)]
+    target_indices = torch.tensor([[4, 0, 2]] * 8)
+
+    one_hot = torch.nn.functional.one_hot
+    with mock.patch("ludwig.explain.captum.F.one_hot", side_effect=one_hot) as one_hot_mock:
+        attributions = integrated_gradients(
+            model, inputs, baselines, target_indices, target_chunk_size=target_chunk_size
+        )
+    assert attributions.shape == (3, 8, 2)
+    # the one-hot selection of the labels is only built for one chunk of labels at a time
+    assert all(call.args[0].shape[1] <= target_chunk_size for call in one_hot_mock.call_args_list)
+
+    explainer = IntegratedGradients(model)
+    for label_position, target_idx in enumerate(target_indices[0].tolist()):
+        expected = explainer.attribute(tuple(inputs), baselines=tuple(baselines), target=target_idx)
+        expected = torch.stack([t.sum(1) for t in expected], dim=-1).to(attributions.dtype)
+        assert torch.allclose(attributions[label_position], expected, atol=1e-6)
+
+
 def test_abstract_explainer_instantiation(tmpdir):
     with pytest.raises(TypeError, match="Can't instantiate abstract class Explainer with abstract method"):
         Explainer(None, inputs_df=None, sample_df=None, target=None)
@@ -87,8 +124,61 @@ def test_explainer_api_ray(use_global, output_feature, tmpdir, ray_cluster_2cpu)
     )
 
 
+@pytest.mark.parametrize("use_global", [True, False])
+@pytest.mark.parametrize("batch_size", [7, 100])
+def test_get_tree_shap_values(batch_size, use_global):
+    rng = np.random.default_rng(0)
+    inputs = pd.DataFrame(rng.normal(size=(50, 4)), columns=["a", "b", "c", "d"])
+    labels = rng.integers(0, 3, size=50)
+    booster = lgb.LGBMClassifier(n_estimators=5, min_child_samples=2).fit(inputs, labels).booster_
+
+    shap_values = get_tree_shap_values(booster, inputs, batch_size, use_global)
+
+    expected_rows = 1 if use_global else len(inputs)
+    assert shap_values.shape == (expected_rows, 3, inputs.shape[1] + 1)
+
+    # SHAP values and expected value of every class add up to its raw score.
+    raw_scores = booster.predict(inputs, raw_score=True)
+    if use_global:
+        raw_scores = raw_scores.mean(axis=0, keepdims=True)
+    np.testing.assert_allclose(shap_values.sum(axis=-1), raw_scores, rtol=1e-5, atol=1e-8)
+
+
+@pytest.mark.parametrize(
+    "output_feature",
+    [binary_feature(), number_feature()],
+    ids=["binary", "number"],
+)
+def test_gbm_explainer_api(output_feature, tmpdir):
+    run_test_explainer_api(GBMExplainer, MODEL_GBM, [output_feature], {}, False, tmpdir, batch_size=16)
+
+
+@pytest.mark.parametrize("use_global", [True, False])
+def test_explainer_api_top_k(use_global, tmpdir):
+    output_features = [category_feature(decoder={"vocab_size": 4})]
+    top_k = 2
+    run_test_explainer_api(
+        IntegratedGradientsExplainer,
+        MODEL_ECD,
+        output_features,
+        {},
+        use_global,
+        tmpdir,
+        expected_num_labels=top_k,
+        top_k=top_k,
+        target_chunk_size=1,
+    )
+
+
 def run_test_explainer_api(
-    explainer_class, model_type, output_features, additional_config, use_global, tmpdir, **kwargs
+    explainer_class,
+    model_type,
+    output_features,
+    additional_config,
+    use_global,
+    tmpdir,
+    expected_num_labels=None,
+    **kwargs,
 ):
     input_features = [number_feature(), category_feature(encoder={"reduce_output": "sum"})]
 
@@ -131,7 +221,12 @@ def run_test_explainer_api(
     # Verify shapes. One explanation per row, or 1 averaged explanation if `use_global=True`
     expected_explanations = len(df) if not use_global else 1
     assert len(explanations) == expected_explanations
+    num_labels = expected_num_labels or vocab_size
     for e in explanations:
-        assert e.to_array().shape == (vocab_size, len(input_features))
+        assert e.to_array().shape == (num_labels, len(input_features))
+        if is_category:
+            label_indices = [le.label_idx for le in e.label_explanations]
+            assert len(set(label_indices)) == num_labels
+            assert all(0 <= label_idx < vocab_size for label_idx in label_indices)
 
-    assert len(expected_values) == vocab_size
+    assert len(expected_values) == num_labels
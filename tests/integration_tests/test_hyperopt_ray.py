@@ -40,7 +40,7 @@ try:
     from ray.tune import Callback as TuneCallback
     from ray.tune.trial import Trial
 
-    from ludwig.hyperopt.execution import get_build_hyperopt_executor
+    from ludwig.hyperopt.execution import get_build_hyperopt_executor, remove_dir_on_all_nodes
 except ImportError:
     ray = None
     Trial = None
@@ -223,6 +223,14 @@ def run_hyperopt_executor(
     hyperopt_executor.execute(config, dataset=rel_path, output_directory=tmpdir, backend=backend)
 
 
+@pytest.mark.distributed
+def test_remove_dir_on_all_nodes(tmpdir, ray_cluster_4cpu):
+    path = os.path.join(tmpdir, "preprocessed")
+    os.makedirs(os.path.join(path, "variant"))
+    remove_dir_on_all_nodes(path)
+    assert not os.path.exists(path)
+
+
 @pytest.mark.distributed
 @pytest.mark.parametrize("scenario", SCENARIOS)
 def test_hyperopt_executor(scenario, csv_filename, tmpdir, ray_cluster_4cpu):
@@ -3,6 +3,7 @@ import logging
 import os.path
 import re
 from collections import namedtuple
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -13,6 +14,7 @@ from sklearn.model_selection import train_test_split
 from ludwig import globals as global_vars
 from ludwig.api import LudwigModel
 from ludwig.backend import LOCAL_BACKEND
+from ludwig.callbacks import Callback
 from ludwig.constants import (
     CATEGORY,
     DEFAULTS,
@@ -27,7 +29,9 @@ from ludwig.contribs.mlflow import MlflowCallback
 from ludwig.experiment import experiment_cli
 from ludwig.features.number_feature import numeric_transformation_registry
 from ludwig.globals import DESCRIPTION_FILE_NAME, TRAINING_PREPROC_FILE_NAME
+from ludwig.models.inference import InferenceModule
 from ludwig.schema.optimizers import optimizer_registry
+from ludwig.trainers.trainer import Trainer
 from ludwig.utils.data_utils import load_json, replace_file_extension
 from ludwig.utils.misc_utils import get_from_registry
 from ludwig.utils.package_utils import LazyLoader
@@ -201,14 +205,20 @@ def test_model_progress_save(skip_save_progress, skip_save_model, generated_data
         assert len(training_checkpoints) > 0
 
 
+@pytest.mark.parametrize("async_checkpointing", [False, True])
 @pytest.mark.parametrize("optimizer", ["sgd", "adam"])
-def test_resume_training(optimizer, generated_data, tmp_path):
+def test_resume_training(optimizer, async_checkpointing, generated_data, tmp_path):
     input_features, output_features = get_feature_configs()
     config = {
         "input_features": input_features,
         "output_features": output_features,
         "combiner": {"type": "concat"},
-        TRAINER: {"epochs": 2, "batch_size": 16, "optimizer": {"type": optimizer}},
+        TRAINER: {
+            "epochs": 2,
+            "batch_size": 16,
+            "optimizer": {"type": optimizer},
+            "async_checkpointing": async_checkpointing,
+        },
     }
 
     # create sub-directory to store results
@@ -337,6 +347,140 @@ def test_optimizers(optimizer_type, generated_data_for_optimizer, tmp_path):
     assert train_losses[last_entry - 1] <= train_losses[0]
 
 
+@pytest.mark.parametrize("mixed_precision", ["bf16", "fp16"])
+def test_mixed_precision(mixed_precision, generated_data_for_optimizer, tmp_path):
+    input_features, output_features = get_feature_configs()
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        "combiner": {"type": "concat"},
+        TRAINER: {"epochs": 5, "batch_size": 16, "mixed_precision": mixed_precision},
+    }
+    model = LudwigModel(config, backend=LocalTestBackend())
+
+    # fp16 falls back to full precision on CPU
+    train_stats, _, _ = model.train(
+        training_set=generated_data_for_optimizer.train_df,
+        validation_set=generated_data_for_optimizer.validation_df,
+        output_directory=str(tmp_path / "results"),
+        skip_save_processed_input=True,
+        skip_save_progress=True,
+        skip_save_unprocessed_output=True,
+        skip_save_log=True,
+    )
+    train_losses = train_stats[TRAINING]["combined"]["loss"]
+    assert np.isfinite(train_losses).all()
+    assert train_losses[-1] <= train_losses[0]
+
+    predictions, _ = model.predict(generated_data_for_optimizer.test_df)
+    assert np.isfinite(predictions["y_predictions"]).all()
+
+    inference_module = InferenceModule.from_ludwig_model(
+        model.model, model.config, model.training_set_metadata, device="cpu"
+    )
+    predictions, _ = inference_module.predict(generated_data_for_optimizer.test_df, mixed_precision=mixed_precision)
+    assert np.isfinite(predictions["y_predictions"]).all()
+
+
+def test_gradient_accumulation(generated_data_for_optimizer, tmp_path):
+    input_features, output_features = get_feature_configs()
+    # a multiple of the batch size, so that no update averages batches of different sizes
+    train_df = generated_data_for_optimizer.train_df[:320]
+
+    class StepsCallback(Callback):
+        def __init__(self):
+            self.steps = []
+
+        def on_epoch_end(self, trainer, progress_tracker, save_path: str):
+            self.steps.append(progress_tracker.steps)
+
+    models = []
+    for batch_size, gradient_accumulation_steps in [(32, 1), (16, 2)]:
+        config = {
+            "input_features": input_features,
+            "output_features": output_features,
+            "combiner": {"type": "concat"},
+            TRAINER: {
+                "epochs": 2,
+                "batch_size": batch_size,
+                "gradient_accumulation_steps": gradient_accumulation_steps,
+                "should_shuffle": False,
+                "optimizer": {"type": "sgd"},
+                "learning_rate": 0.1,
+            },
+        }
+        callback = StepsCallback()
+        model = LudwigModel(config, backend=LocalTestBackend(), callbacks=[callback])
+        model.train(
+            training_set=train_df,
+            output_directory=str(tmp_path / f"results_{gradient_accumulation_steps}"),
+            random_seed=RANDOM_SEED,
+            skip_save_processed_input=True,
+            skip_save_progress=True,
+            skip_save_unprocessed_output=True,
+            skip_save_model=True,
+            skip_save_log=True,
+        )
+        # steps count weight updates, not batches
+        assert callback.steps == [10, 20]
+        models.append(model.model)
+
+    for (name, param), (_, accumulated_param) in zip(models[0].named_parameters(), models[1].named_parameters()):
+        assert torch.allclose(param, accumulated_param, atol=1e-5), name
+
+
+@pytest.mark.parametrize("evaluate_training_set_mode", ["running", "sample"])
+def test_evaluate_training_set_mode(generated_data, tmp_path, evaluate_training_set_mode):
+    input_features, output_features = get_feature_configs()
+
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        "combiner": {"type": "concat"},
+        TRAINER: {
+            "epochs": 2,
+            "batch_size": 16,
+            "evaluate_training_set": True,
+            "evaluate_training_set_mode": evaluate_training_set_mode,
+            "evaluate_training_set_sample_size": 50,
+        },
+    }
+
+    evaluated_datasets = []
+    evaluation = Trainer.evaluation
+
+    def record_evaluation(trainer, dataset, dataset_name, *args, **kwargs):
+        if dataset_name == "train":
+            evaluated_datasets.append(dataset)
+        return evaluation(trainer, dataset, dataset_name, *args, **kwargs)
+
+    model = LudwigModel(config, backend=LocalTestBackend())
+    with mock.patch.object(Trainer, "evaluation", record_evaluation):
+        train_stats, _, _ = model.train(
+            training_set=generated_data.train_df,
+            validation_set=generated_data.validation_df,
+            output_directory=str(tmp_path),
+            skip_save_processed_input=True,
+            skip_save_progress=True,
+            skip_save_unprocessed_output=True,
+            skip_save_log=True,
+        )
+
+    if evaluate_training_set_mode == "running":
+        # training metrics come from the training steps, the training set is never scored again
+        assert evaluated_datasets == []
+    else:
+        # the same sample is scored at every checkpoint
+        assert len(evaluated_datasets) == 2
+        assert evaluated_datasets[0] is evaluated_datasets[1]
+        assert len(evaluated_datasets[0]) == 50
+
+    for metric_name in ["loss", "mean_squared_error", "mean_absolute_error"]:
+        values = train_stats[TRAINING]["y"][metric_name]
+        assert len(values) == 2
+        assert np.isfinite(values).all()
+
+
 def test_regularization(generated_data, tmp_path):
     input_features, output_features = get_feature_configs()
 
@@ -203,6 +203,29 @@ def test_read_image_from_path(tmpdir, csv_filename, generate_images_as_numpy):
     )
 
 
+def test_read_images_in_processes(tmpdir, csv_filename):
+    input_features = [image_feature(os.path.join(tmpdir, "generated_output"))]
+    output_features = [category_feature(decoder={"vocab_size": 5}, reduce_input="sum")]
+    data_csv = generate_data(
+        input_features, output_features, os.path.join(tmpdir, csv_filename), num_examples=NUM_EXAMPLES
+    )
+    df = pd.read_csv(data_csv)
+    # Unreadable images are replaced by the default image.
+    df.loc[3, input_features[0][NAME]] = os.path.join(tmpdir, "missing.png")
+
+    def preprocess(num_processes):
+        input_features[0]["preprocessing"]["num_processes"] = num_processes
+        config = {"input_features": input_features, "output_features": output_features}
+        model = LudwigModel(config, backend=LocalTestBackend())
+        training_set, _, _, _ = model.preprocess(df)
+        return training_set.to_df()[input_features[0][PROC_COLUMN]]
+
+    images = preprocess(num_processes=1)
+    images_from_processes = preprocess(num_processes=2)
+    assert len(images) == len(images_from_processes)
+    np.testing.assert_array_equal(np.stack(images_from_processes), np.stack(images))
+
+
 def test_read_image_from_numpy_array(tmpdir, csv_filename):
     input_features = [image_feature(os.path.join(tmpdir, "generated_output"))]
     output_features = [category_feature(decoder={"vocab_size": 5}, reduce_input="sum")]
@@ -16,13 +16,14 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 
 from ludwig.api import LudwigModel
 from ludwig.constants import DECODER, TRAINER
-from ludwig.serve import ALL_FEATURES_PRESENT_ERROR, server
+from ludwig.serve import ALL_FEATURES_PRESENT_ERROR, load_inference_module, server
 from ludwig.utils.data_utils import read_csv
 from tests.integration_tests.utils import (
     audio_feature,
@@ -239,3 +240,88 @@ def test_server_integration_with_audio(single_record, tmpdir):
         model_output, _ = model.predict(dataset=data_df)
         model_output = model_output.to_dict("split")
         assert model_output == server_response
+
+
+def test_server_integration_with_request_batching(tmpdir):
+    input_features = [
+        text_feature(encoder={"type": "embed", "min_len": 1}),
+        number_feature(normalization="zscore"),
+    ]
+    output_features = [category_feature(decoder={"vocab_size": 4}), number_feature()]
+
+    rel_path = generate_data(input_features, output_features, os.path.join(tmpdir, "dataset.csv"))
+    model = train_and_predict_model(input_features, output_features, data_csv=rel_path, output_directory=tmpdir)
+
+    app = server(model, max_batch_size=8, max_batch_wait_ms=50)
+    data_df = read_csv(rel_path)
+    entries = [data_df.T.to_dict()[i] for i in range(20)]
+
+    with TestClient(app) as client:
+        response = client.post("/predict")
+        assert response.status_code == 400
+        assert response.json() == ALL_FEATURES_PRESENT_ERROR
+
+        with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+            server_responses = list(executor.map(lambda entry: client.post("/predict", data=entry), entries))
+
+        metrics = client.get("/metrics").json()
+
+    model_output, _ = model.predict(dataset=entries, data_format=dict)
+    for server_response, expected in zip(server_responses, model_output.to_dict("records")):
+        assert server_response.status_code == 200
+        server_response = server_response.json()
+        assert sorted(server_response.keys()) == sorted(output_keys_for(output_features))
+        for key, value in expected.items():
+            if isinstance(value, str):
+                assert server_response[key] == value
+            else:
+                assert np.allclose(server_response[key], value, atol=1e-5)
+
+    assert metrics["num_requests"] == len(entries)
+    assert metrics["num_batches"] < len(entries)
+    assert metrics["max_batch_size"] <= 8
+
+
+@pytest.mark.parametrize("save_torchscript", [False, True])
+def test_server_integration_with_inference_module(save_torchscript, tmpdir):
+    input_features = [
+        category_feature(encoder={"vocab_size": 3}),
+        number_feature(normalization="zscore"),
+    ]
+    output_features = [category_feature(decoder={"vocab_size": 4}), number_feature()]
+
+    rel_path = generate_data(input_features, output_features, os.path.join(tmpdir, "dataset.csv"))
+    model = train_and_predict_model(input_features, output_features, data_csv=rel_path, output_directory=tmpdir)
+    model_path = os.path.join(tmpdir, "model")
+    model.save(model_path)
+    if save_torchscript:
+        model.save_torchscript(model_path)
+
+    client = TestClient(server(load_inference_module(model_path)))
+    data_df = read_csv(rel_path)
+    expected_df, _ = model.predict(dataset=data_df)
+
+    # One-off prediction
+    first_entry = data_df.T.to_dict()[0]
+    server_response = client.post("/predict", data=first_entry)
+    assert server_response.status_code == 200
+    server_response = server_response.json()
+    for feature in output_features:
+        key = f"{feature['name']}_predictions"
+        if feature["type"] == "number":
+            assert np.isclose(server_response[key], expected_df[key][0], atol=1e-5)
+        else:
+            assert server_response[key] == expected_df[key][0]
+
+    # Batch prediction
+    server_response = client.post("/batch_predict", files=convert_to_batch_form(data_df))
+    assert server_response.status_code == 200
+    server_response = server_response.json()
+    assert len(server_response["data"]) == len(data_df)
+    for feature in output_features:
+        key = f"{feature['name']}_predictions"
+        column = [row[server_response["columns"].index(key)] for row in server_response["data"]]
+        if feature["type"] == "number":
+            assert np.allclose(column, expected_df[key], atol=1e-5)
+        else:
+            assert column == expected_df[key].tolist()
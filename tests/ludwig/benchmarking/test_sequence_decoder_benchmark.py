@@ -0,0 +1,14 @@
+import pytest
+
+from ludwig.benchmarking.sequence_decoder_benchmark import benchmark_sequence_decoder
+
+
+@pytest.mark.parametrize("cell_type", ["gru", "lstm"])
+def test_benchmark_sequence_decoder(cell_type):
+    results = benchmark_sequence_decoder(
+        max_sequence_length=32, mean_length=4, batch_size=8, hidden_size=16, vocab_size=20, cell_type=cell_type
+    )
+    assert set(results) == {"full", "early_exit"}
+    assert all(result["rows_per_second"] > 0 for result in results.values())
+    # Early exit does not change the predictions up to the stop symbol.
+    assert results["early_exit"]["mean_length"] == results["full"]["mean_length"]
@@ -0,0 +1,14 @@
+import pytest
+
+from ludwig.benchmarking.set_embedding_benchmark import benchmark_set_embedding
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_benchmark_set_embedding(weighted):
+    results = benchmark_set_embedding(
+        vocab_size=1000, batch_size=8, items_per_row=3, embedding_size=16, num_iterations=1, weighted=weighted
+    )
+    assert set(results) == {"embedding_bag", "dense"}
+    assert all(result["rows_per_second"] > 0 for result in results.values())
+    # The dense path materializes a [batch x vocab_size x embedding_size] tensor.
+    assert results["embedding_bag"]["allocated_memory_bytes"] < results["dense"]["allocated_memory_bytes"]
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.binary_reader import read_binary_files_to_array
+from tests.integration_tests.utils import LocalTestBackend
+
+
+def decode(entry):
+    if entry is None:
+        return None
+    return np.full((2, 3), len(entry), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("num_processes", [1, 3])
+def test_read_binary_files_to_array(tmpdir, num_processes):
+    paths = []
+    for i in range(10):
+        path = tmpdir.join(f"{i}.bin")
+        path.write_binary(b"x" * i)
+        paths.append(str(path))
+    entries = paths + [None, b"bytes"]
+
+    array, failed, stats = read_binary_files_to_array(entries, decode, (len(entries), 2, 3), num_processes)
+    assert array.dtype == np.uint8
+    assert array.shape == (len(entries), 2, 3)
+    np.testing.assert_array_equal(array[:10, 0, 0], np.arange(10))
+    np.testing.assert_array_equal(array[11], 5)
+    assert failed.tolist() == [False] * 10 + [True, False]
+
+    assert stats.num_files == len(entries)
+    assert stats.num_failed == 1
+    assert stats.bytes_read == sum(range(10))
+    assert stats.files_per_second > 0
+
+
+def test_local_backend_read_binary_files_to_array():
+    column = pd.Series([b"a", np.nan, b"abc"], name="image")
+    array, failed = LocalTestBackend().read_binary_files_to_array(column, decode, (3, 2, 3), num_processes=2)
+    np.testing.assert_array_equal(array[[0, 2], 0, 0], [1, 3])
+    assert failed.tolist() == [False, True, False]
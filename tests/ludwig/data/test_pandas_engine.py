@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.backend.base import LocalBackend
+from ludwig.data.dataframe.pandas import PANDAS, PandasEngine
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"a": np.arange(5000), "b": [str(i) for i in range(5000)]}, index=np.arange(5000)[::-1])
+
+
+@pytest.mark.parametrize("pool_type", ["process", "thread"])
+def test_parallel_map(df, pool_type):
+    engine = PandasEngine(parallelism=3, pool_type=pool_type)
+    offset = 7
+
+    # closures can't be pickled, forked workers inherit them instead
+    mapped = engine.map_objects(df["a"], lambda x: np.array([x + offset]))
+    expected = PANDAS.map_objects(df["a"], lambda x: np.array([x + offset]))
+    assert mapped.index.equals(df.index)
+    np.testing.assert_array_equal(np.stack(mapped.values), np.stack(expected.values))
+
+    applied = engine.apply_objects(df, lambda row: row["b"] + str(row["a"]))
+    pd.testing.assert_series_equal(applied, PANDAS.apply_objects(df, lambda row: row["b"] + str(row["a"])))
+
+    partitions = engine.map_partitions(df["a"], lambda series: series * offset)
+    pd.testing.assert_series_equal(partitions, df["a"] * offset)
+
+
+def test_set_parallelism(df):
+    engine = PandasEngine()
+    assert engine.parallelism is None
+
+    engine.set_parallelism(2)
+    assert engine.parallelism == 2
+    pd.testing.assert_series_equal(engine.map_objects(df["b"], len), df["b"].map(len))
+
+
+def test_local_backend_processor():
+    assert LocalBackend().df_engine is PANDAS
+    assert LocalBackend(processor={"parallelism": 4}).df_engine.parallelism == 4
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from ludwig.data.batcher.bucketed import BucketedBatcher
+from ludwig.data.batcher.prefetching import prefetch, PrefetchingBatcher
+from ludwig.data.dataset.pandas import PandasDataset
+
+
+@pytest.fixture
+def dataset():
+    df = pd.DataFrame(
+        {
+            "a": np.arange(100),
+            "b": [np.array([i, i + 1, 0]) for i in range(100)],
+        }
+    )
+    return PandasDataset(df, {"a": {}, "b": {}}, None)
+
+
+def _drain(batcher):
+    batches = []
+    while not batcher.last_batch():
+        batches.append(batcher.next_batch())
+    return batches
+
+
+@pytest.mark.parametrize("depth", [1, 3])
+def test_prefetching_batcher_matches_batcher(dataset, depth):
+    with dataset.initialize_batcher(batch_size=16, should_shuffle=True, seed=1) as batcher:
+        batcher.set_epoch(1, 16)
+        expected = _drain(batcher)
+
+    with dataset.initialize_batcher(batch_size=16, should_shuffle=True, seed=1) as batcher:
+        with PrefetchingBatcher(batcher, depth=depth) as prefetching_batcher:
+            for epoch in range(2):
+                # abandon the first epoch halfway, the next one must start from a clean state
+                prefetching_batcher.set_epoch(epoch, 16)
+                if epoch == 0:
+                    prefetching_batcher.next_batch()
+                    continue
+
+                actual = _drain(prefetching_batcher)
+                assert prefetching_batcher.step == prefetching_batcher.steps_per_epoch == len(expected)
+
+    for expected_batch, actual_batch in zip(expected, actual):
+        for key, value in expected_batch.items():
+            assert isinstance(actual_batch[key], torch.Tensor)
+            np.testing.assert_array_equal(actual_batch[key].numpy(), value)
+
+
+def test_prefetching_bucketed_batcher(dataset):
+    batcher = BucketedBatcher(dataset, bucketing_field="b", batch_size=8, buckets=4, should_shuffle=False)
+    with prefetch(batcher, depth=2) as prefetching_batcher:
+        batches = _drain(prefetching_batcher)
+    assert sum(len(batch["a"]) for batch in batches) == len(dataset)
+
+
+def test_prefetching_batcher_raises_producer_errors(dataset):
+    with dataset.initialize_batcher(batch_size=16) as batcher:
+        batcher.dataset = None
+        with PrefetchingBatcher(batcher, depth=2) as prefetching_batcher:
+            with pytest.raises(AttributeError):
+                prefetching_batcher.next_batch()
+
+
+def test_prefetch_disabled(dataset):
+    with dataset.initialize_batcher(batch_size=16) as batcher:
+        with prefetch(batcher, depth=0) as maybe_prefetching_batcher:
+            assert maybe_prefetching_batcher is batcher
@@ -0,0 +1,69 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.batcher.random_access import RandomAccessBatcher
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.data.sampler import DistributedSampler
+
+
+@pytest.fixture
+def dataset():
+    return PandasDataset(pd.DataFrame({"a": np.arange(103)}), {"a": {}}, None)
+
+
+def _horovod(rank, size):
+    horovod = mock.Mock()
+    horovod.rank.return_value = rank
+    horovod.size.return_value = size
+    return horovod
+
+
+@pytest.mark.parametrize("shuffle", [True, False])
+@pytest.mark.parametrize("num_replicas", [1, 4])
+def test_random_access_batcher_covers_shard(dataset, shuffle, num_replicas):
+    shards = []
+    for rank in range(num_replicas):
+        horovod = _horovod(rank, num_replicas) if num_replicas > 1 else None
+        sampler = DistributedSampler(len(dataset), shuffle=shuffle, seed=5, horovod=horovod)
+        batcher = RandomAccessBatcher(dataset, sampler, batch_size=16)
+        batcher.set_epoch(2, 16)
+
+        batches = []
+        while not batcher.last_batch():
+            batches.append(batcher.next_batch()["a"])
+        assert len(batches) == batcher.steps_per_epoch
+
+        shard = np.concatenate(batches)
+        np.testing.assert_array_equal(shard, list(sampler))
+        shards.append(shard)
+
+    all_indices = np.concatenate(shards)
+    assert len(all_indices) == sampler.total_size
+    assert set(all_indices) == set(range(len(dataset)))
+    if shuffle:
+        assert not np.array_equal(all_indices[: len(dataset)], np.arange(len(dataset)))
+
+
+def test_random_access_batcher_contiguous_views(dataset):
+    sampler = DistributedSampler(len(dataset), shuffle=False)
+    batcher = RandomAccessBatcher(dataset, sampler, batch_size=16)
+
+    batch = batcher.next_batch()["a"]
+    assert np.shares_memory(batch, dataset.get_dataset()["a"])
+    np.testing.assert_array_equal(batch, np.arange(16))
+
+
+def test_random_access_batcher_columnar_dataset():
+    matrix = np.arange(206, dtype=np.int32).reshape(103, 2)
+    dataset = PandasDataset({"a": np.arange(103), "b": matrix}, {"a": {}, "b": {}}, None)
+    assert len(dataset) == 103
+    assert dataset.get_dataset()["b"] is matrix
+    assert dataset.in_memory_size_bytes == np.arange(103).nbytes + matrix.nbytes
+
+    sampler = DistributedSampler(len(dataset), shuffle=True, seed=5)
+    batcher = RandomAccessBatcher(dataset, sampler, batch_size=16)
+    batch = batcher.next_batch()
+    np.testing.assert_array_equal(batch["b"], matrix[batch["a"]])
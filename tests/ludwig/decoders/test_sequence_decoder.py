@@ -1,7 +1,7 @@
 import pytest
 import torch
 
-from ludwig.constants import HIDDEN, LOGITS
+from ludwig.constants import HIDDEN, LOGITS, PROBABILITIES, PROBABILITY
 from ludwig.decoders.sequence_decoders import (
     LSTMDecoder,
     RNNDecoder,
@@ -9,6 +9,8 @@ from ludwig.decoders.sequence_decoders import (
     SequenceLSTMDecoder,
     SequenceRNNDecoder,
 )
+from ludwig.features.sequence_feature import _SequencePostprocessing, _SequencePredict
+from ludwig.utils import output_feature_utils, strings_utils
 from ludwig.utils.misc_utils import set_random_seed
 from tests.integration_tests.parameter_update_utils import check_module_parameters_updated
 
@@ -131,3 +133,77 @@ def test_sequence_generator_decoder(cell_type, num_layers, batch_size):
     target = torch.randn(output[LOGITS].shape)
     fpc, tpc, upc, not_updated = check_module_parameters_updated(sequence_rnn_decoder, (combiner_outputs, None), target)
     assert upc == tpc, f"Failed to update parameters. Parameters not updated: {not_updated}"
+
+
+@pytest.mark.parametrize("cell_type", ["gru", "lstm"])
+@pytest.mark.parametrize("num_layers", [1, 2])
+def test_sequence_generator_decoder_early_exit(cell_type, num_layers):
+    hidden_size = 32
+    vocab_size = 50
+    max_sequence_length = 20
+    batch_size = 64
+    STOP = strings_utils.SpecialSymbol.STOP.value
+
+    set_random_seed(RANDOM_SEED)
+    combiner_outputs = {HIDDEN: torch.randn([batch_size, hidden_size])}
+    decoders = [
+        SequenceGeneratorDecoder(
+            input_size=hidden_size,
+            vocab_size=vocab_size,
+            max_sequence_length=max_sequence_length,
+            cell_type=cell_type,
+            num_layers=num_layers,
+            early_exit=early_exit,
+        )
+        for early_exit in (False, True)
+    ]
+    decoders[1].load_state_dict(decoders[0].state_dict())
+
+    with torch.no_grad():
+        # rows produce the stop symbol at different steps
+        for decoder in decoders:
+            step_decoder = decoder.rnn_decoder.lstm_decoder if cell_type == "lstm" else decoder.rnn_decoder.rnn_decoder
+            step_decoder.out.bias.zero_()
+            step_decoder.out.bias[STOP] = 2.0
+
+        expected = decoders[0](combiner_outputs)[LOGITS]
+        # batch sizes of the steps of the early exit decoder
+        steps = []
+        step_decoder.register_forward_hook(lambda module, inputs, outputs: steps.append(len(inputs[0])))
+        actual = decoders[1](combiner_outputs)[LOGITS]
+
+    stop_steps = [
+        (row == STOP).nonzero()[0].item() if (row == STOP).any() else max_sequence_length for row in expected.argmax(-1)
+    ]
+    assert len(set(stop_steps)) > 1 and min(stop_steps) < max_sequence_length
+    # decoding stops once every row produced the stop symbol, rows that did are no longer decoded
+    assert len(steps) == min(max(stop_steps) + 1, max_sequence_length)
+    assert steps == [sum(stop_step >= step for stop_step in stop_steps) for step in range(len(steps))]
+    for row, stop_step in enumerate(stop_steps):
+        torch.testing.assert_close(actual[row, : stop_step + 1], expected[row, : stop_step + 1])
+        assert (actual[row, stop_step + 1 :].argmax(-1) == strings_utils.SpecialSymbol.PADDING.value).all()
+
+    # the steps after the stop symbol have a probability of 1, the probability of the sequences up to the stop symbol
+    # is the same as without early exit
+    metadata = {"max_sequence_length": max_sequence_length, "idx2str": [str(i) for i in range(vocab_size)]}
+
+    def postprocess(logits):
+        predictions = _SequencePredict()({output_feature_utils.get_feature_concat_name("f", LOGITS): logits}, "f")
+        predictions = {output_feature_utils.get_feature_concat_name("f", k): v for k, v in predictions.items()}
+        return _SequencePostprocessing(metadata)(predictions, "f")
+
+    expected_outputs, actual_outputs = postprocess(expected), postprocess(actual)
+    for row, stop_step in enumerate(stop_steps):
+        torch.testing.assert_close(
+            actual_outputs[PROBABILITIES][row, : stop_step + 1], expected_outputs[PROBABILITIES][row, : stop_step + 1]
+        )
+        assert (actual_outputs[PROBABILITIES][row, stop_step + 1 :] == 1).all()
+        torch.testing.assert_close(
+            actual_outputs[PROBABILITY][row], expected_outputs[PROBABILITIES][row, : stop_step + 1].log().sum()
+        )
+
+    # training decodes the whole target sequences
+    target = torch.randint(vocab_size, (batch_size, max_sequence_length))
+    torch.testing.assert_close(
+        decoders[1](combiner_outputs, target)[LOGITS], decoders[0](combiner_outputs, target)[LOGITS]
+    )
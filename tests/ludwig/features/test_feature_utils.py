@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 
@@ -39,25 +40,49 @@ def test_ludwig_feature_dict_with_periods():
     assert feature_dict["to."] == to_module
 
 
-@pytest.mark.parametrize("sequence_type", [list, tuple, np.array])
-def test_compute_token_probabilities(sequence_type):
-    inputs = sequence_type(
-        [
-            [0.1, 0.2, 0.7],
-            [0.3, 0.4, 0.3],
-            [0.6, 0.3, 0.2],
-        ]
+def test_stack_rows():
+    rows = pd.Series([np.array([1, 2]), np.array([3, 4]), np.array([5, 6])])
+    assert np.array_equal(feature_utils.stack_rows(rows), [[1, 2], [3, 4], [5, 6]])
+    assert np.array_equal(feature_utils.stack_rows(pd.Series([1, 2, 3])), [1, 2, 3])
+    assert feature_utils.stack_rows(pd.Series([], dtype=object), row_shape=(0, 4)).shape == (0, 0, 4)
+
+
+def test_ids_to_labels():
+    idx2str = ["<PAD>", "a", "b"]
+    labels = feature_utils.ids_to_labels(np.array([[1, 2], [0, 5]]), idx2str, unknown_symbol="<UNK>")
+    assert labels.tolist() == [["a", "b"], ["<PAD>", "<UNK>"]]
+    assert feature_utils.ids_to_labels(np.array([2, 0]), idx2str).tolist() == ["b", "<PAD>"]
+
+    # without an unknown symbol, ids out of the vocabulary are an error
+    for ids in [np.array([1, 3]), np.array([-1, 0])]:
+        with pytest.raises(IndexError):
+            feature_utils.ids_to_labels(ids, idx2str)
+
+
+@pytest.mark.parametrize("truncate_predictions", [True, False])
+def test_postprocess_sequence_predictions(truncate_predictions):
+    idx2str = ["<PAD>", "a", "b"]
+    result = pd.DataFrame(
+        {
+            "seq_predictions": [np.array([1, 2, 0]), np.array([2, 9, 1])],
+            "seq_last_predictions": [2, 1],
+            "seq_probabilities": [
+                np.array([[0.1, 0.9, 0.0], [0.2, 0.2, 0.6], [0.5, 0.3, 0.2]]),
+                np.array([[0.3, 0.3, 0.4], [0.8, 0.1, 0.1], [0.0, 0.7, 0.3]]),
+            ],
+            "seq_lengths": [2, 3],
+        }
     )
 
-    token_probabilities = feature_utils.compute_token_probabilities(inputs)
-    assert np.allclose(token_probabilities, [0.7, 0.4, 0.6])
-
-
-def test_compute_sequence_probability():
-    inputs = np.array([0.7, 0.4, 0.6])
-
-    sequence_probability = feature_utils.compute_sequence_probability(
-        inputs, max_sequence_length=2, return_log_prob=False
+    result = feature_utils.postprocess_sequence_predictions(
+        result, "seq", idx2str, max_sequence_length=2, truncate_predictions=truncate_predictions
     )
 
-    assert np.allclose(sequence_probability, [0.28])  # 0.7 * 0.4
+    if truncate_predictions:
+        assert result["seq_predictions"].tolist() == [["a", "b"], ["b", "<UNK>"]]
+    else:
+        assert result["seq_predictions"].tolist() == [["a", "b", "<PAD>"], ["b", "<UNK>", "a"]]
+    assert result["seq_last_predictions"].tolist() == ["b", "a"]
+    assert np.allclose(result["seq_probabilities"][0], [0.9, 0.6, 0.5])
+    assert np.allclose(result["seq_probability"], np.log([0.9 * 0.6, 0.4 * 0.8]))
+    assert "seq_lengths" not in result
@@ -0,0 +1,73 @@
+import copy
+import logging
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.api import LudwigModel
+from ludwig.constants import INPUT_FEATURES, OUTPUT_FEATURES, PREPROCESSING, TRAINER
+from ludwig.data.cache.types import wrap
+from ludwig.hyperopt.dataset_cache import SharedPreprocessedDatasets
+from ludwig.schema.model_config import ModelConfig
+from tests.integration_tests.utils import (
+    binary_feature,
+    category_feature,
+    generate_data,
+    LocalTestBackend,
+    number_feature,
+)
+
+
+@pytest.fixture
+def config_and_dataset(tmpdir):
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    csv_filename = generate_data(input_features, output_features, os.path.join(tmpdir, "dataset.csv"), num_examples=100)
+    config = {INPUT_FEATURES: input_features, OUTPUT_FEATURES: output_features, TRAINER: {"epochs": 1}}
+    return ModelConfig.from_dict(config).to_dict(), pd.read_csv(csv_filename)
+
+
+def test_shared_preprocessed_datasets(config_and_dataset, tmpdir):
+    config, df = config_and_dataset
+    shared_datasets = SharedPreprocessedDatasets(os.path.join(tmpdir, "preprocessed"), dataset=wrap(df))
+    backend = LocalTestBackend()
+
+    with mock.patch.object(LudwigModel, "preprocess", autospec=True, side_effect=LudwigModel.preprocess) as preprocess:
+        training_set, validation_set, test_set, training_set_metadata = shared_datasets.get(
+            config, backend, random_seed=42
+        )
+        assert preprocess.call_count == 1
+
+        # Trials with the same preprocessing config reuse the materialized datasets.
+        trial_config = copy.deepcopy(config)
+        trial_config[TRAINER]["learning_rate"] = 0.1
+        assert shared_datasets.get_key(trial_config) == shared_datasets.get_key(config)
+        shared = shared_datasets.get(trial_config, backend, random_seed=42)
+        assert preprocess.call_count == 1
+
+        # Datasets are memory mapped, read-only.
+        for dataset, shared_dataset in zip((training_set, validation_set, test_set), shared[:3]):
+            for column, values in dataset.get_dataset().items():
+                assert isinstance(values, np.memmap)
+                assert not values.flags.writeable
+                np.testing.assert_array_equal(values, shared_dataset.get_dataset()[column])
+        assert shared[3] == training_set_metadata
+
+        # A different preprocessing config is another variant.
+        variant_config = copy.deepcopy(config)
+        variant_config[INPUT_FEATURES][0][PREPROCESSING]["normalization"] = "minmax"
+        assert shared_datasets.get_key(variant_config) != shared_datasets.get_key(config)
+        shared_datasets.get(variant_config, backend, random_seed=42)
+        assert preprocess.call_count == 2
+
+    model = LudwigModel(config, logging_level=logging.WARNING, backend=backend)
+    model.train(
+        training_set=training_set,
+        validation_set=validation_set,
+        test_set=test_set,
+        training_set_metadata=training_set_metadata,
+        output_directory=os.path.join(tmpdir, "results"),
+    )
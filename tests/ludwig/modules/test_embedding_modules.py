@@ -3,6 +3,7 @@ from typing import List
 import pytest
 import torch
 
+from ludwig.benchmarking.set_embedding_benchmark import embed_dense
 from ludwig.modules.embedding_modules import Embed, EmbedSequence, EmbedSet, EmbedWeighted, TokenAndPositionEmbedding
 from ludwig.utils.torch_utils import get_torch_device
 
@@ -45,6 +46,57 @@ def test_embed_set(
     assert outputs.shape[1:] == embed.output_shape
 
 
+@pytest.mark.parametrize("aggregation_function", ["sum", "avg"])
+def test_embed_set_matches_dense(aggregation_function: str):
+    embed = EmbedSet(vocab=list("abcdefgh"), embedding_size=4, aggregation_function=aggregation_function).to(DEVICE)
+    inputs = torch.tensor(
+        [[0, 1, 0, 1, 1, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0, 0, 1]], dtype=torch.bool
+    ).to(DEVICE)
+    outputs = embed(inputs)
+
+    # The 0th embedding is masked out.
+    inputs[:, 0] = False
+    expected = embed_dense(inputs, embed.embeddings.weight, aggregation_function)
+    assert torch.allclose(outputs, expected)
+    assert torch.all(outputs[1] == 0)
+
+
+@pytest.mark.parametrize("aggregation_function", ["sum", "avg"])
+def test_embed_set_legacy_state_dict(aggregation_function: str):
+    vocab = list("abcdefgh")
+    embed = EmbedSet(vocab=vocab, embedding_size=4, aggregation_function=aggregation_function).to(DEVICE)
+    assert "vocab_indices" not in embed.state_dict()
+    inputs = torch.tensor([[0, 1, 0, 1, 1, 0, 0, 0], [1, 0, 0, 0, 0, 0, 0, 1]], dtype=torch.bool).to(DEVICE)
+
+    # Weights saved before embedding bags were used scaled the embedding of token i by i, and averaged over the vocab.
+    legacy_state_dict = {**embed.state_dict(), "vocab_indices": torch.arange(len(vocab))}
+    indices = inputs.int() * torch.arange(len(vocab), device=DEVICE)
+    embedded = embed.embeddings(indices.long()) * indices.unsqueeze(-1)
+    expected = embedded.mean(dim=1) if aggregation_function == "avg" else embedded.sum(dim=1)
+
+    legacy_embed = EmbedSet(vocab=vocab, embedding_size=4, aggregation_function=aggregation_function).to(DEVICE)
+    legacy_embed.load_state_dict(legacy_state_dict)
+    assert torch.allclose(legacy_embed(inputs), expected)
+
+    # The legacy aggregation is kept when the weights are saved again.
+    reloaded_embed = EmbedSet(vocab=vocab, embedding_size=4, aggregation_function=aggregation_function).to(DEVICE)
+    reloaded_embed.load_state_dict(legacy_embed.state_dict())
+    assert torch.allclose(reloaded_embed(inputs), expected)
+    assert torch.allclose(torch.jit.trace(reloaded_embed, inputs)(inputs), expected)
+
+
+def test_embed_weighted_matches_dense():
+    embed_weighted = EmbedWeighted(vocab=list("abcdefgh"), embedding_size=4).to(DEVICE)
+    inputs = torch.tensor([[0, 2, 0, 1, 3, 0, 0, 0], [0, 0, 0, 0, 0, 0, 0, 0], [1, 0, 0, 0, 0, 0, 0, 5]]).to(DEVICE)
+    outputs = embed_weighted(inputs)
+    assert torch.allclose(outputs, embed_dense(inputs, embed_weighted.embeddings.weight))
+
+    # The unused buffer of weights saved before embedding bags were used is dropped.
+    legacy_state_dict = {**embed_weighted.state_dict(), "vocab_indices": torch.arange(8, dtype=torch.int32)}
+    embed_weighted.load_state_dict(legacy_state_dict)
+    assert "vocab_indices" not in embed_weighted.state_dict()
+
+
 @pytest.mark.parametrize("vocab", [["a", "b", "c", "d", "e", "f", "g", "h"]])
 @pytest.mark.parametrize("embedding_size", [5, 10])
 @pytest.mark.parametrize("representation", ["dense", "sparse"])
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+dd = pytest.importorskip("dask.dataframe")  # noqa
+
+from ludwig.utils.automl.data_profile import hash_values, HyperLogLog  # noqa
+from ludwig.utils.automl.data_source import DataframeSource, DataSource, wrap_data_source  # noqa
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    num_rows = 2000
+    return pd.DataFrame(
+        {
+            "id": np.arange(num_rows),
+            "category": rng.choice(["a", "b", "c"], size=num_rows, p=[0.6, 0.3, 0.1]),
+            "number": rng.normal(size=num_rows),
+            "text": [" ".join(["word"] * (i % 5 + 1)) for i in range(num_rows)],
+            "image": [f"img_{i}.png" if i % 2 else None for i in range(num_rows)],
+            "nullbool": [True, False, None, False] * (num_rows // 4),
+        }
+    )
+
+
+@pytest.mark.parametrize("num_values", [10, 1000, 100000])
+def test_hyperloglog(num_values):
+    values = pd.Series(np.arange(num_values)).astype(str)
+    sketch = HyperLogLog()
+    # Duplicates do not change the count.
+    sketch.add(hash_values(values))
+    sketch.add(hash_values(values[: num_values // 2]))
+    assert sketch.count() == pytest.approx(num_values, rel=3 * sketch.relative_error)
+
+    other = HyperLogLog()
+    other.add(hash_values(values + "_other"))
+    sketch.merge(other)
+    assert sketch.count() == pytest.approx(2 * num_values, rel=3 * sketch.relative_error)
+
+
+@pytest.mark.parametrize("chunk_size", [128, 100000])
+def test_dataframe_source_profile(df, chunk_size):
+    source = DataframeSource(df)
+    profile = source.profile(chunk_size=chunk_size, sample_size=500, max_exact_distinct_values=100)
+    assert profile.rows == profile.row_count == len(df)
+    assert len(profile.sample) == 500
+    assert profile.size_bytes == pytest.approx(source.size_bytes(), rel=0.01)
+
+    for column in df.columns:
+        assert profile.nonnull_values(column) == df[column].notnull().sum()
+        assert profile.distinct_values(column) == list(df[column].dropna().unique()[:10])
+
+    # Exact counts of columns with few distinct values, estimates of the others.
+    assert profile.num_distinct_values("category") == 3
+    assert profile.num_distinct_values("nullbool") == 2
+    assert profile.num_distinct_values("id") == len(df)
+    assert profile.num_distinct_values("number") == len(df)
+    assert profile.columns["image"].sketch is not None
+    assert profile.num_distinct_values("image") == pytest.approx(len(df) // 2, rel=0.03)
+
+    counts = df["category"].value_counts()
+    assert profile.distinct_values_balance("category") == counts.min() / counts.max()
+    assert profile.image_values("image", sample_size=len(df)) == pytest.approx(
+        0.5 * profile.sample["image"].notnull().sum()
+    )
+
+
+def test_dataframe_source_profile_max_rows(df):
+    profile = DataframeSource(df).profile(max_rows=1000, chunk_size=300)
+    assert profile.rows == 1000
+    assert profile.row_count == len(df)
+
+    # Counts are extrapolated to the whole dataset.
+    assert profile.nonnull_values("image") == df["image"].notnull().sum()
+    assert profile.num_distinct_values("id") == len(df)
+    assert profile.num_distinct_values("category") == 3
+
+
+def test_dataframe_source_profile_max_rows_spread(df):
+    profile = DataframeSource(df).profile(max_rows=100, max_exact_distinct_values=1000)
+
+    # The rows are sampled across the whole dataframe, not only its first rows.
+    value_counts = profile.columns["id"].value_counts
+    assert len(value_counts) == 100
+    assert value_counts.index.min() == 0
+    assert value_counts.index.max() == len(df) - 1
+
+
+class PerColumnSource(DataSource):
+    """Data source implementing only the per-column statistics, like data sources outside of Ludwig."""
+
+    def __init__(self, df):
+        self.df = df
+
+    @property
+    def columns(self):
+        return self.df.columns
+
+    def get_dtype(self, column):
+        return self.df[column].dtype.name
+
+    def get_distinct_values(self, column, max_values_to_return):
+        unique_values = self.df[column].dropna().unique()
+        return len(unique_values), unique_values[:max_values_to_return], 1.0
+
+    def get_nonnull_values(self, column):
+        return int(self.df[column].notnull().sum())
+
+    def get_image_values(self, column):
+        return 0
+
+    def get_audio_values(self, column):
+        return 0
+
+    def get_avg_num_tokens(self, column):
+        return 1
+
+    def is_string_type(self, dtype):
+        return dtype == "object"
+
+    def size_bytes(self):
+        return 1
+
+    def __len__(self):
+        return len(self.df)
+
+
+def test_data_source_default_profile(df):
+    profile = PerColumnSource(df).profile(max_distinct_values=2)
+    assert profile.row_count == len(df)
+    assert profile.num_distinct_values("category") == 3
+    assert list(profile.distinct_values("category")) == list(df["category"].unique()[:2])
+    assert profile.nonnull_values("image") == len(df) // 2
+
+
+@pytest.mark.parametrize("max_rows", [None, 500])
+def test_dask_source_profile(df, max_rows):
+    pandas_profile = DataframeSource(df).profile(max_rows=max_rows)
+    dask_profile = wrap_data_source(dd.from_pandas(df, npartitions=8)).profile(max_rows=max_rows)
+
+    # Whole partitions are profiled.
+    assert dask_profile.rows >= (max_rows or len(df))
+    assert dask_profile.row_count == len(df)
+    for column in df.columns:
+        if max_rows is None:
+            # Within a row budget, both sample the rows they scan across the dataset, but not the same ones.
+            assert dask_profile.distinct_values(column) == pandas_profile.distinct_values(column)
+            assert dask_profile.nonnull_values(column) == pandas_profile.nonnull_values(column)
+            assert dask_profile.num_distinct_values(column) == pandas_profile.num_distinct_values(column)
+
+
+def test_dask_source_profile_max_rows_row_count(df):
+    ddf = dd.from_pandas(df, npartitions=40)
+    profile = wrap_data_source(ddf).profile(max_rows=500)
+
+    # The rows of the partitions not scanned are estimated from those scanned, not counted.
+    assert profile.rows < len(df)
+    assert profile.row_count == pytest.approx(len(df), rel=0.05)
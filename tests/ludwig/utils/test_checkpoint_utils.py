@@ -0,0 +1,68 @@
+import os
+from unittest import mock
+
+import pytest
+import torch
+
+from ludwig.utils.checkpoint_utils import Checkpoint, CheckpointManager
+
+
+@pytest.fixture
+def model():
+    return torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8), torch.nn.Linear(8, 2))
+
+
+def _train_step(model, optimizer):
+    optimizer.zero_grad()
+    model(torch.randn(16, 4)).sum().backward()
+    optimizer.step()
+
+
+@pytest.mark.parametrize("async_writes", [False, True])
+def test_checkpoint_manager_save_and_restore(tmpdir, model, async_writes):
+    optimizer = torch.optim.Adam(model.parameters())
+    _train_step(model, optimizer)
+
+    manager = CheckpointManager(Checkpoint(model, optimizer), str(tmpdir), "cpu", async_writes=async_writes)
+    manager.save(1)
+    expected_weights = {k: v.clone() for k, v in model.state_dict().items()}
+    # the saved state must be the one at the time of the save, not the one once the write happens
+    _train_step(model, optimizer)
+    manager.close()
+
+    restored_model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.BatchNorm1d(8), torch.nn.Linear(8, 2))
+    restored_optimizer = torch.optim.Adam(restored_model.parameters())
+    restored_manager = CheckpointManager(Checkpoint(restored_model, restored_optimizer), str(tmpdir), "cpu")
+    assert restored_manager.restore_or_initialize() == 1
+    for key, value in restored_model.state_dict().items():
+        assert torch.equal(value, expected_weights[key])
+    assert restored_optimizer.state_dict()["state"][0]["step"] == 1
+
+
+def test_checkpoint_manager_async_write_errors(tmpdir, model):
+    manager = CheckpointManager(Checkpoint(model), str(tmpdir), "cpu", async_writes=True)
+    with mock.patch("ludwig.utils.checkpoint_utils.torch.save", side_effect=OSError("disk full")):
+        manager.save(1)
+        with pytest.raises(OSError, match="disk full"):
+            manager.flush()
+
+    manager.save(2)
+    manager.close()
+    assert os.path.exists(manager.latest_checkpoint)
+
+
+@pytest.mark.parametrize("async_writes", [False, True])
+def test_checkpoint_manager_after_save(tmpdir, model, async_writes):
+    manager = CheckpointManager(Checkpoint(model), str(tmpdir), "cpu", async_writes=async_writes)
+    checkpoint_written = []
+    manager.save(1, after_save=lambda: checkpoint_written.append(os.path.exists(manager.latest_checkpoint)))
+    manager.flush()
+    assert checkpoint_written == [True]
+
+    # not called when the checkpoint could not be written
+    with mock.patch("ludwig.utils.checkpoint_utils.torch.save", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            manager.save(2, after_save=lambda: checkpoint_written.append(True))
+            manager.flush()
+    manager.close()
+    assert checkpoint_written == [True]
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 import json
+import os
 
 import numpy as np
 import pandas as pd
@@ -25,7 +26,10 @@ from ludwig.utils.data_utils import (
     figure_data_format_dataset,
     get_abs_path,
     hash_dict,
+    load_hdf5,
+    load_hdf5_columns,
     NumpyEncoder,
+    save_hdf5,
     use_credentials,
 )
 
@@ -155,3 +159,23 @@ def test_numpy_encoder():
         assert json.dumps(x, cls=NumpyEncoder) == "[0.0, 1.0, 2.0, 3.0, 4.0]"
         for i in x:
             assert json.dumps(i, cls=NumpyEncoder) == f"{i}"
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_hdf5_columns_roundtrip(tmpdir, columnar):
+    matrix = np.random.randint(0, 10, size=(8, 5)).astype(np.int32)
+    numbers = np.random.rand(8).astype(np.float32)
+    df = pd.DataFrame({"matrix": list(matrix), "numbers": numbers})
+
+    data_fp = os.path.join(tmpdir, "data.hdf5")
+    save_hdf5(data_fp, {"matrix": matrix, "numbers": numbers} if columnar else df)
+
+    columns = load_hdf5_columns(data_fp)
+    assert list(columns.keys()) == ["matrix", "numbers"]
+    assert columns["matrix"].flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(columns["matrix"], matrix)
+    np.testing.assert_array_equal(columns["numbers"], numbers)
+
+    loaded_df = load_hdf5(data_fp)
+    np.testing.assert_array_equal(np.stack(loaded_df["matrix"]), matrix)
+    assert loaded_df["numbers"].dtype == np.float32
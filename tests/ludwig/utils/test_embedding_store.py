@@ -0,0 +1,60 @@
+import os
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from ludwig.utils import embedding_store
+from ludwig.utils.data_utils import load_pretrained_embeddings
+from ludwig.utils.embedding_store import EmbeddingStore
+
+
+@pytest.fixture
+def glove_file(tmpdir):
+    glove_fp = os.path.join(tmpdir, "glove.txt")
+    with open(glove_fp, "w", encoding="utf-8") as f:
+        f.write("the 0.1 0.2 0.3\n")
+        f.write("ludwig 1.0 2.0 3.0\n")
+        f.write("malformed 1.0 2.0\n")
+        f.write("\n")
+        f.write("città -1.5 0.0 2.5\n")
+        f.write("the 0.4 0.5 0.6\n")
+    return glove_fp
+
+
+def test_embedding_store(glove_file, tmpdir):
+    cache_dir = os.path.join(tmpdir, "embeddings")
+    store = EmbeddingStore.from_glove(glove_file, cache_dir=cache_dir)
+    assert (store.num_tokens, store.embedding_size) == (4, 3)
+
+    rows = store.lookup(["ludwig", "missing", "the", "città"])
+    assert rows[1] == -1
+    np.testing.assert_allclose(store.vectors[rows[[0, 2, 3]]], [[1.0, 2.0, 3.0], [0.4, 0.5, 0.6], [-1.5, 0.0, 2.5]])
+
+    # converted only once
+    with mock.patch.object(embedding_store, "convert_glove") as convert_glove:
+        EmbeddingStore.from_glove(glove_file, cache_dir=cache_dir)
+        convert_glove.assert_not_called()
+
+    # until the file changes
+    with open(glove_file, "a", encoding="utf-8") as f:
+        f.write("model 7.0 8.0 9.0\n")
+    store = EmbeddingStore.from_glove(glove_file, cache_dir=cache_dir)
+    np.testing.assert_allclose(store.vectors[store.lookup(["model"])], [[7.0, 8.0, 9.0]])
+
+
+def test_load_pretrained_embeddings(glove_file, tmpdir, monkeypatch):
+    monkeypatch.setenv("LUDWIG_CACHE", str(tmpdir))
+    embeddings_matrix = load_pretrained_embeddings(glove_file, ["<PAD>", "ludwig", "città"])
+    assert embeddings_matrix.shape == (3, 3)
+    np.testing.assert_allclose(embeddings_matrix[1:], [[1.0, 2.0, 3.0], [-1.5, 0.0, 2.5]])
+    # missing words are initialized around the average embedding
+    np.testing.assert_allclose(embeddings_matrix[0], [-0.25, 1.0, 2.75], atol=0.01)
+
+
+def test_embedding_store_hash_collisions(glove_file, tmpdir):
+    # tokens of the same length collide
+    with mock.patch.object(embedding_store, "hash_token", len):
+        store = EmbeddingStore.from_glove(glove_file, cache_dir=os.path.join(tmpdir, "embeddings"))
+        rows = store.lookup(["the", "ludwig", "città", "cat", "models"])
+    np.testing.assert_array_equal(rows, [3, 1, 2, -1, -1])
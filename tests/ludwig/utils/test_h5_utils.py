@@ -0,0 +1,55 @@
+import os
+
+import h5py
+import numpy as np
+import pytest
+
+from ludwig.utils.h5_utils import get_memmap, H5HandlePool, read_rows
+
+
+@pytest.fixture
+def h5_data(tmpdir):
+    data_fp = os.path.join(tmpdir, "data.hdf5")
+    data = np.random.randint(0, 255, size=(100, 3, 4, 4), dtype=np.uint8)
+    with h5py.File(data_fp, "w") as h5_file:
+        h5_file.create_dataset("contiguous_data", data=data)
+        h5_file.create_dataset("chunked_data", data=data, chunks=(8, 3, 4, 4))
+    return data_fp, data
+
+
+@pytest.mark.parametrize("key", ["contiguous_data", "chunked_data"])
+@pytest.mark.parametrize("use_memmap", [True, False])
+def test_read_rows(h5_data, key, use_memmap):
+    data_fp, data = h5_data
+    with H5HandlePool() as pool:
+        dataset = pool.get_dataset(data_fp, key, use_memmap=use_memmap)
+        for indices in [
+            np.random.permutation(100)[:32],
+            np.array([5, 3, 3, 99, 0, 17, 16, 15]),
+            np.arange(40, 72),
+            np.array([7]),
+            np.array([], dtype=np.int64),
+        ]:
+            rows = read_rows(dataset, indices)
+            assert rows.shape == data[indices].shape
+            np.testing.assert_array_equal(rows, data[indices])
+
+
+def test_get_memmap(h5_data):
+    data_fp, data = h5_data
+    with h5py.File(data_fp, "r") as h5_file:
+        memmap = get_memmap(h5_file, "contiguous_data")
+        assert isinstance(memmap, np.memmap)
+        np.testing.assert_array_equal(memmap, data)
+
+        assert get_memmap(h5_file, "chunked_data") is None
+
+
+def test_handle_pool_reuses_handles(h5_data):
+    data_fp, _ = h5_data
+    pool = H5HandlePool()
+    h5_file = pool.get(data_fp)
+    assert pool.get(data_fp) is h5_file
+
+    pool.close()
+    assert not h5_file
@@ -0,0 +1,26 @@
+import pytest
+
+from ludwig.utils.nlp_utils import process_text, process_texts
+
+spacy = pytest.importorskip("spacy")
+
+
+@pytest.mark.parametrize(
+    "process_args",
+    [
+        {},
+        {"filter_numbers": True, "filter_punctuation": True, "filter_short_tokens": True},
+        {"filter_stopwords": True},
+        {"return_lemma": True, "filter_stopwords": True},
+    ],
+)
+def test_process_texts(process_args):
+    nlp_pipeline = spacy.blank("en")
+    texts = [
+        "Hello John, how are you doing my good old friend?",
+        "",
+        "Are you still number 732 in the list? Did you pay $32.43 or 54.21 for the book?",
+    ] * 3
+
+    processed = process_texts(texts, nlp_pipeline, batch_size=2, **process_args)
+    assert processed == [process_text(text, nlp_pipeline, **process_args) for text in texts]
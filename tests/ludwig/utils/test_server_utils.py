@@ -1,6 +1,10 @@
+import asyncio
+import threading
+
 import numpy as np
+import pytest
 
-from ludwig.utils.server_utils import NumpyJSONResponse
+from ludwig.utils.server_utils import NumpyJSONResponse, RequestBatcher
 
 
 def test_numpy_json_response():
@@ -29,3 +33,108 @@ def test_numpy_json_response():
         assert response.render(x) == b"[0.0,1.0,2.0,3.0,4.0]"
         for i in x:
             assert response.render(i) == f"{i}".encode()
+
+
+def test_request_batcher():
+    batch_sizes = []
+
+    def predict_fn(entries):
+        batch_sizes.append(len(entries))
+        return [{"y": entry["x"] * 2} for entry in entries]
+
+    async def run():
+        batcher = RequestBatcher(predict_fn, max_batch_size=4, max_batch_wait_ms=50)
+        outputs = await asyncio.gather(*[batcher.predict({"x": i}) for i in range(10)])
+        metrics = batcher.get_metrics()
+        await batcher.close()
+        return outputs, metrics
+
+    outputs, metrics = asyncio.run(run())
+    assert outputs == [{"y": i * 2} for i in range(10)]
+    assert batch_sizes == [4, 4, 2]
+    assert metrics["num_requests"] == 10
+    assert metrics["num_batches"] == 3
+    assert metrics["max_batch_size"] == 4
+    assert metrics["queue_size"] == 0
+
+
+def test_request_batcher_errors():
+    def predict_fn(entries):
+        raise ValueError("failed")
+
+    async def run():
+        batcher = RequestBatcher(predict_fn, max_batch_size=4, max_queue_size=2)
+        with pytest.raises(asyncio.QueueFull):
+            await asyncio.gather(*[batcher.predict({"x": i}) for i in range(3)])
+        with pytest.raises(ValueError):
+            await batcher.predict({"x": 0})
+        await batcher.close()
+
+    asyncio.run(run())
+
+
+def test_request_batcher_row_errors():
+    def predict_fn(entries):
+        if any(entry["x"] is None for entry in entries):
+            raise ValueError("malformed row")
+        # drops the last row of batches
+        return [{"y": entry["x"] * 2} for entry in entries][: max(len(entries) - 1, 1)]
+
+    async def run():
+        batcher = RequestBatcher(predict_fn, max_batch_size=4, max_batch_wait_ms=50)
+        outputs = await asyncio.gather(*[batcher.predict({"x": x}) for x in [0, None, 2]], return_exceptions=True)
+        await batcher.close()
+        return outputs
+
+    # the rows are predicted one by one once the batch failed, only the malformed row gets an error
+    outputs = asyncio.run(run())
+    assert outputs[0] == {"y": 0}
+    assert isinstance(outputs[1], ValueError)
+    assert outputs[2] == {"y": 4}
+
+
+def test_request_batcher_missing_outputs():
+    async def run():
+        batcher = RequestBatcher(lambda entries: [], max_batch_size=4, max_batch_wait_ms=50)
+        outputs = await asyncio.wait_for(
+            asyncio.gather(*[batcher.predict({"x": i}) for i in range(3)], return_exceptions=True), 1
+        )
+        await batcher.close()
+        return outputs
+
+    assert all(isinstance(output, ValueError) for output in asyncio.run(run()))
+
+
+def test_request_batcher_restart_keeps_queued_requests():
+    async def run():
+        batcher = RequestBatcher(lambda entries: [{"y": entry["x"]} for entry in entries], max_batch_wait_ms=50)
+        request = asyncio.ensure_future(batcher.predict({"x": 1}))
+        await asyncio.sleep(0)
+        # the worker stops with a request queued, the next request restarts it
+        batcher._worker.cancel()
+        await asyncio.sleep(0)
+        outputs = await asyncio.wait_for(asyncio.gather(request, batcher.predict({"x": 2})), 1)
+        await batcher.close()
+        return outputs
+
+    assert asyncio.run(run()) == [{"y": 1}, {"y": 2}]
+
+
+def test_request_batcher_close_cancels_batch_being_predicted():
+    started, release = threading.Event(), threading.Event()
+
+    def predict_fn(entries):
+        started.set()
+        release.wait(1)
+        return entries
+
+    async def run():
+        batcher = RequestBatcher(predict_fn, max_batch_wait_ms=0)
+        request = asyncio.ensure_future(batcher.predict({"x": 1}))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+        await batcher.close()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(request, 1)
+
+    asyncio.run(run())
@@ -1,9 +1,11 @@
+from unittest import mock
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from ludwig.schema.features.preprocessing.text import TextPreprocessingConfig
-from ludwig.utils import strings_utils
+from ludwig.utils import strings_utils, tokenization
 
 
 def test_is_number():
@@ -186,3 +188,121 @@ def test_build_sequence_matrix():
     assert not (
         sequence_matrix.tolist() - np.array([[1, 4, 5, 6, 0, 2, 2, 2, 2, 2], [1, 6, 5, 4, 0, 2, 2, 2, 2, 2]])
     ).any()
+
+
+def test_build_sequence_matrix_left_padding_and_truncation():
+    inverse_vocabulary = {
+        "<EOS>": 0,
+        "<SOS>": 1,
+        "<PAD>": 2,
+        "<UNK>": 3,
+        "a": 4,
+        "b": 5,
+        "c": 6,
+    }
+    sequences = pd.Series(["a b c d", "", "c a"], index=[3, 5, 7])
+    sequence_matrix = strings_utils.build_sequence_matrix(
+        sequences, inverse_vocabulary, tokenizer_type="space", length_limit=5, padding="left"
+    )
+    assert sequence_matrix.index.tolist() == [3, 5, 7]
+    assert np.stack(sequence_matrix.values).tolist() == [[1, 4, 5, 6, 3], [2, 2, 2, 1, 0], [2, 1, 6, 4, 0]]
+
+
+def test_create_vocabulary_cache_tokens():
+    column = pd.Series(["a b c", "c b a", "a a"])
+
+    with tokenization.tokenized_column_cache():
+        vocab, str2idx, str2freq, *_ = strings_utils.create_vocabulary(column, "space", cache_tokens=True)
+        assert str2freq["a"] == 4 and str2freq["b"] == 2
+
+        with mock.patch("ludwig.utils.tokenization._tokenize_shard") as tokenize_shard:
+            sequence_matrix = strings_utils.build_sequence_matrix(column.copy(), str2idx, "space", length_limit=5)
+            tokenize_shard.assert_not_called()
+    assert np.stack(sequence_matrix.values)[0].tolist() == [str2idx[u] for u in ["<SOS>", "a", "b", "c", "<EOS>"]]
+
+
+def test_create_vocabulary_cache_tokens_scope():
+    column = pd.Series(["a b c", "c b a", "a a"])
+
+    # tokens are not kept outside of a cache scope, nor once it is exited
+    strings_utils.create_vocabulary(column, "space", cache_tokens=True)
+    with tokenization.tokenized_column_cache() as cache:
+        strings_utils.create_vocabulary(column, "space", cache_tokens=True)
+        assert len(cache._entries) == 1
+    assert not cache._entries
+    assert tokenization._active_cache.get() is None
+
+
+@pytest.fixture
+def local_hf_tokenizer(tmpdir):
+    """Path of a fast huggingface tokenizer built from a local vocab file, loadable offline."""
+    from transformers import BertTokenizerFast
+
+    vocab_file = tmpdir.join("vocab.txt")
+    vocab_file.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "a", "b", "c", "hello", "world", "!"]))
+    tokenizer_dir = str(tmpdir.join("tokenizer"))
+    BertTokenizerFast(vocab_file=str(vocab_file)).save_pretrained(tokenizer_dir)
+    return tokenizer_dir
+
+
+@pytest.mark.parametrize("padding", ["right", "left"])
+@pytest.mark.parametrize("processor", ["pandas", "partitions"])
+def test_build_sequence_matrix_hf_tokenizer(local_hf_tokenizer, processor, padding):
+    from ludwig.utils.tokenizers import HFTokenizer
+
+    sequences = pd.Series(["Hello world!", "", "a b c a b c", "c d hello"] * 3, index=range(10, 22))
+    tokenizer = HFTokenizer(local_hf_tokenizer)
+    assert tokenizer.tokenize_batch(sequences.str.lower().tolist()) == [tokenizer(s.lower()) for s in sequences]
+
+    vocab, str2idx, *_ = strings_utils.create_vocabulary(
+        sequences, "hf_tokenizer", pretrained_model_name_or_path=local_hf_tokenizer
+    )
+    column, engine = sequences, strings_utils.PANDAS
+    if processor == "partitions":
+        # distributed columns (e.g. dask) are encoded one pandas partition at a time
+        column = mock.sentinel.distributed_column
+        engine = mock.Mock(map_partitions=lambda series, map_fn: map_fn(sequences))
+
+    # batches smaller than the column
+    with mock.patch("ludwig.utils.tokenization.TOKENIZER_BATCH_SIZE", 5), mock.patch(
+        "ludwig.utils.strings_utils.TOKENIZER_BATCH_SIZE", 5
+    ):
+        sequence_matrix = strings_utils.build_sequence_matrix(
+            column,
+            str2idx,
+            "hf_tokenizer",
+            length_limit=6,
+            padding_symbol="[PAD]",
+            padding=padding,
+            pretrained_model_name_or_path=local_hf_tokenizer,
+            processor=engine,
+        )
+
+    pad_id = str2idx["[PAD]"]
+    expected = []
+    for ids in (tokenizer(s.lower())[:6] for s in sequences):
+        padded = [pad_id] * (6 - len(ids))
+        expected.append(ids + padded if padding == "right" else padded + ids)
+    assert sequence_matrix.index.tolist() == list(range(10, 22))
+    assert np.stack(sequence_matrix.values).tolist() == expected
+
+
+def test_build_sequence_matrix_partitions():
+    sequences = pd.Series(["a b c", "", "c d"], index=[3, 5, 7])
+    vocab, str2idx, *_ = strings_utils.create_vocabulary(sequences, "space")
+
+    # distributed columns (e.g. dask) are tokenized one pandas partition at a time
+    engine = mock.Mock(
+        map_partitions=lambda series, map_fn: map_fn(sequences),
+        compute=lambda x: x,
+        map_objects=lambda series, map_fn: series.map(map_fn),
+    )
+    distributed_vocab, *_ = strings_utils.create_vocabulary(mock.sentinel.distributed_column, "space", processor=engine)
+    assert distributed_vocab == vocab
+
+    sequence_matrix = strings_utils.build_sequence_matrix(
+        mock.sentinel.distributed_column, str2idx, "space", length_limit=5, processor=engine
+    )
+    expected = strings_utils.build_sequence_matrix(sequences, str2idx, "space", length_limit=5)
+    assert sequence_matrix.index.tolist() == [3, 5, 7]
+    assert np.stack(sequence_matrix.values).tolist() == np.stack(expected.values).tolist()
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.dataframe.pandas import PandasEngine
+from ludwig.utils.tokenization import tokenize_column
+
+
+def test_tokenize_column():
+    tokenized = tokenize_column(pd.Series(["Hello world", "", "hello hello World"]), "space")
+    assert tokenized.uniques.tolist() == ["hello", "world"]
+    assert tokenized.codes.tolist() == [0, 1, 0, 0, 1]
+    assert tokenized.lengths.tolist() == [2, 0, 3]
+    assert tokenized.counts().tolist() == [3, 2]
+    assert tokenized.to_ids({"world": 5}, unknown_id=1, dtype=np.int8).tolist() == [1, 5, 1, 1, 5]
+
+
+@pytest.mark.parametrize("pool_type", ["process", "thread"])
+def test_tokenize_column_parallelism(pool_type):
+    rng = np.random.RandomState(42)
+    words = np.array([f"w{i}" for i in range(100)])
+    column = pd.Series([" ".join(rng.choice(words, size=rng.randint(0, 10))) for _ in range(5000)])
+
+    expected = tokenize_column(column, "space")
+    actual = tokenize_column(column, "space", processor=PandasEngine(parallelism=2, pool_type=pool_type))
+    assert actual.uniques.tolist() == expected.uniques.tolist()
+    np.testing.assert_array_equal(actual.codes, expected.codes)
+    np.testing.assert_array_equal(actual.lengths, expected.lengths)
@@ -9,6 +9,9 @@ import torch
 from ludwig.utils.torch_utils import (
     _get_torch_init_params,
     _set_torch_init_params,
+    autocast,
+    cast_to_float32,
+    get_autocast_dtype,
     initialize_pytorch,
     sequence_length_2D,
     sequence_length_3D,
@@ -152,3 +155,25 @@ def test_initialize_pytorch_with_horovod_explicit_gpus(mock_torch):
         initialize_pytorch(gpus="-1", horovod=mock_hvd)
 
     assert os.environ["CUDA_VISIBLE_DEVICES"] == ""
+
+
+def test_get_autocast_dtype():
+    assert get_autocast_dtype(None, "cpu") is None
+    assert get_autocast_dtype("bf16", "cpu") == torch.bfloat16
+    assert get_autocast_dtype("fp16", "cuda") == torch.float16
+    with pytest.warns(UserWarning):
+        assert get_autocast_dtype("fp16", "cpu") is None
+    with pytest.raises(ValueError):
+        get_autocast_dtype("fp8", "cpu")
+
+
+@pytest.mark.parametrize("dtype", [None, torch.bfloat16])
+def test_autocast(dtype):
+    linear = torch.nn.Linear(4, 2)
+    with autocast("cpu", dtype):
+        outputs = {"logits": linear(torch.rand(3, 4)), "predictions": torch.tensor([0, 1, 1])}
+    assert outputs["logits"].dtype == (dtype or torch.float32)
+
+    outputs = cast_to_float32(outputs)
+    assert outputs["logits"].dtype == torch.float32
+    assert outputs["predictions"].dtype == torch.int64